@@ -1,22 +1,33 @@
+import cProfile
 import importlib
-import matplotlib.pyplot as plt
 import sys
 
-from procsim.back_end.branch_unit import BranchUnit
-from procsim.back_end.broadcast_bus import BroadcastBus
-from procsim.back_end.integer_unit import IntegerUnit
-from procsim.back_end.load_store_queue import LoadStoreQueue
-from procsim.back_end.reorder_buffer import ReorderBuffer
-from procsim.back_end.reservation_station import ReservationStation
-from procsim.branch.dynamic.branch_history_table import BranchHistoryTable
-from procsim.branch.static.always_taken import AlwaysTaken
-from procsim.branch.static.back_taken_forward_not import BackTakenForwardNot
-from procsim.branch.static.never_taken import NeverTaken
-from procsim.clock import Clock
-from procsim.end_of_program import EndOfProgram
-from procsim.front_end.decode import Decode
-from procsim.front_end.fetch import Fetch
+from procsim.branch.dynamic.loop_predictor import LoopPredictor
+from procsim.functional.emulator import Emulator
+from procsim.profiler import Profiler
 from procsim.run.args import get_args
+from procsim.run.config import Config
+from procsim.run.simulator import Simulator
+
+if len(sys.argv) > 1 and sys.argv[1] == 'sweep':
+    from procsim.run.sweep import main
+    main(sys.argv[2:])
+    sys.exit()
+elif len(sys.argv) > 1 and sys.argv[1] == 'benchmark':
+    from procsim.run.benchmark import main
+    sys.exit(main(sys.argv[2:]))
+elif len(sys.argv) > 1 and sys.argv[1] == 'sample':
+    from procsim.run.sampler import main
+    main(sys.argv[2:])
+    sys.exit()
+elif len(sys.argv) > 1 and sys.argv[1] == 'simpoint':
+    from procsim.run.simpoint import main
+    main(sys.argv[2:])
+    sys.exit()
+elif len(sys.argv) > 1 and sys.argv[1] == 'branches':
+    from procsim.run.branch_eval import main
+    main(sys.argv[2:])
+    sys.exit()
 
 args = get_args()
 
@@ -25,83 +36,43 @@ try:
 except Exception as err:
     sys.exit('unable to load program %r, %r' % (args.PROGRAM, err))
 
-# Create processor components.
-clock = Clock()
-
-register_file = program.REGISTER_FILE
-
-memory = program.MEMORY
-
-broadcast_bus = BroadcastBus()
-
-branch_units = [BranchUnit(broadcast_bus)
-                for _ in range(args.n_branch_units)]
-
-integer_units = [IntegerUnit(broadcast_bus)
-                 for _ in range(args.n_integer_units)]
-
-reservation_station = ReservationStation(capacity=args.capacity,
-                                         width=args.superscalar_width)
-
-load_store_queue = LoadStoreQueue(memory,
-                                  broadcast_bus,
-                                  capacity=args.capacity,
-                                  width=args.superscalar_width,
-                                  data_forwarding=args.no_forwarding,
-                                  bypassing=args.no_bypassing)
-
-if args.always_taken:
-    branch_predictor = AlwaysTaken()
-elif args.never_taken:
-    branch_predictor = NeverTaken()
-elif args.back_taken_forward_not:
-    branch_predictor = BackTakenForwardNot()
-elif args.branch_history_table:
-    branch_predictor = BranchHistoryTable(n_entries=args.branch_history_table[0],
-                                          n_prediction_bits=args.branch_history_table[1])
+if args.functional:
+    emulator = Emulator.from_module(program)
+    emulator.run(max_instructions=args.max_instructions)
+    if args.console_output:
+        print('end:\t' + program.console_output())
+    print('Instructions Committed: %d' % emulator.n_committed)
+    print('Halted: %s' % emulator.halted)
+    print('Host Time: %.3fs' % emulator.host_time)
+    print('Instructions/Second: %.0f'
+          % (emulator.n_committed / max(emulator.host_time, 1e-9)))
+    sys.exit()
+
+profiler = Profiler() if args.profile else None
+cprofile = cProfile.Profile() if args.cprofile_output else None
+
+if args.load_checkpoint is not None:
+    simulator = Simulator.load_checkpoint(args.load_checkpoint)
+    simulator.cprofile = cprofile
+    # Profiling continues only if the checkpointed Simulator was profiled.
+    profiler = simulator.profiler if args.profile else None
+    # Console output reads the program module's state.
+    program.REGISTER_FILE = simulator.register_file
+    program.MEMORY = simulator.memory
 else:
-    branch_predictor = BranchHistoryTable(n_entries=2**8, n_prediction_bits=2)
-
-reorder_buffer = ReorderBuffer(register_file,
-                               reservation_station,
-                               load_store_queue,
-                               branch_predictor=branch_predictor,
-                               capacity=args.capacity,
-                               width=args.superscalar_width)
-
-decode = Decode(reorder_buffer,
-                capacity=args.capacity,
-                width=args.superscalar_width)
-
-fetch = Fetch(register_file,
-              program.PROGRAM,
-              decode,
-              branch_predictor,
-              width=args.superscalar_width)
-
-# Add additional connections.
-broadcast_bus.subscribe(reservation_station)
-broadcast_bus.subscribe(load_store_queue)
-broadcast_bus.subscribe(reorder_buffer)
-
-for branch_unit in branch_units:
-    reservation_station.register(branch_unit)
-for integer_unit in integer_units:
-    reservation_station.register(integer_unit)
-
-for branch_unit in branch_units:
-    clock.register(branch_unit)
-for integer_unit in integer_units:
-    clock.register(integer_unit)
-clock.register(reservation_station)
-clock.register(load_store_queue)
-clock.register(reorder_buffer)
-clock.register(decode)
-clock.register(fetch)
-
-reorder_buffer.set_pipeline_flush_root(fetch)
+    simulator = Simulator(Config.from_args(args),
+                          program.PROGRAM,
+                          program.REGISTER_FILE,
+                          program.MEMORY,
+                          profiler=profiler,
+                          cprofile=cprofile,
+                          cache_dir=args.program_cache)
+clock = simulator.clock
+reorder_buffer = simulator.reorder_buffer
 
 if args.plot:
+    import matplotlib.pyplot as plt
+
     cycles = []
     ins_per_cycle = []
     bpr = []
@@ -123,16 +94,27 @@ if args.plot:
     ax2.set_title('Average Branch Prediction Accuracy')
     graph2 = ax2.plot(cycles, bpr)[0]
 
-try:
-    while True:
-        out = str(clock.n_ticks) + ':\t' + program.console_output()
-
-        if args.step_execution:
-            if args.console_output:
-                out = ''
-            input(out)
-        elif args.console_output:
-            print(out)
+def limit_reached():
+    """Return True if a --max-cycles or --max-instructions limit is reached."""
+    if args.max_cycles is not None and clock.n_ticks >= args.max_cycles:
+        return True
+    if (args.max_instructions is not None
+            and reorder_buffer.n_committed >= args.max_instructions):
+        return True
+    return False
+
+def run_interactive():
+    """Step the simulator, displaying output each cycle, until halt or a limit."""
+    while not limit_reached():
+        if args.step_execution or args.console_output:
+            out = str(clock.n_ticks) + ':\t' + program.console_output()
+
+            if args.step_execution:
+                if args.console_output:
+                    out = ''
+                input(out)
+            else:
+                print(out)
 
         # Update graph.
         if args.plot:
@@ -149,16 +131,33 @@ try:
             plt.draw()
             plt.pause(0.01)
 
-        clock.tick()
+        if simulator.step():
+            break
 
-except EndOfProgram:
-    if args.console_output:
+if args.step_execution or args.console_output or args.plot:
+    run_interactive()
+    if simulator.halted and args.console_output:
         print('end:\t' + program.console_output())
-    rob = reorder_buffer
-    print('Instructions Issued: %d' % rob.n_issued)
-    print('Instructions Committed: %d' % rob.n_committed)
-    print('Cycles: %d' % clock.n_ticks)
-    print('Instructions/Cycle: %.2f' % (rob.n_committed / clock.n_ticks))
-    accuracy = max(1, rob.n_branch_correct) / max(1, (rob.n_branch_correct + rob.n_branch_incorrect))
-    print('Branch Prediction Accuracy: %.2f' % accuracy)
-    #input('Exit?')
+    stats = simulator.stats()
+else:
+    stats = simulator.run(max_cycles=args.max_cycles,
+                          max_instructions=args.max_instructions)
+
+print(stats.report())
+if isinstance(simulator.branch_predictor, LoopPredictor):
+    print(simulator.branch_predictor.report())
+
+if args.save_checkpoint is not None:
+    simulator.save_checkpoint(args.save_checkpoint)
+
+if profiler is not None:
+    print()
+    print('\n'.join(profiler.report()))
+
+    bus = simulator.broadcast_bus
+    print()
+    print('Bus Messages/Cycle: %s' % sorted(bus.messages_per_cycle.items()))
+    print('Bus Deliveries/Message: %s' % sorted(bus.deliveries_per_message.items()))
+
+if cprofile is not None:
+    cprofile.dump_stats(args.cprofile_output)
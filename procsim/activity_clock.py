@@ -0,0 +1,76 @@
+import math
+
+from procsim.clock import Clock
+
+class ActivityClock(Clock):
+    """A Clock that skips idle components and fast-forwards stalled cycles.
+
+    Each tick first asks every registered component how many upcoming cycles
+    it will spend doing nothing but counting down timers (see
+    Clocked.idle_cycles). If every component is waiting, no component can
+    affect any other during those cycles and the Clock advances straight to
+    the first cycle in which something happens. Otherwise a single cycle is
+    simulated, skipping the operate and trigger calls of idle components.
+
+    The simulation is cycle-exact with Clock; n_ticks counts simulated cycles
+    and so may increase by more than one per tick call.
+
+    Args:
+        profiler: If not None, a Profiler that records the time spent in each
+            registered component's operate and trigger methods. (default None)
+
+    Attributes:
+        n_ticks: Total number of simulated cycles.
+        n_skipped: Number of cycles that were fast-forwarded.
+    """
+
+    def __init__(self, profiler=None):
+        super().__init__(profiler)
+        self.n_skipped = 0
+        # Component that most recently reported work. It is likely to still
+        # have work so is asked first.
+        self.last_active = None
+
+    def operate(self):
+        """Call operate on every registered non-idle component."""
+        for comp in self.components:
+            if not comp.idle():
+                comp.operate()
+
+    def trigger(self):
+        """Call trigger on every registered non-idle component."""
+        for comp in self.components:
+            if not comp.idle():
+                comp.trigger()
+
+    def tick(self, max_cycles=None):
+        """Simulate at least one cycle.
+
+        Args:
+            max_cycles: Maximum number of cycles to advance. (default None,
+                unlimited)
+        """
+        n_cycles = self.idle_cycles()
+        if max_cycles is not None:
+            n_cycles = min(n_cycles, max_cycles)
+        if 0 < n_cycles < math.inf:
+            for comp in self.components:
+                comp.skip(n_cycles)
+            self.n_ticks += n_cycles
+            self.n_skipped += n_cycles
+            return
+        self.operate()
+        self.trigger()
+        self.n_ticks += 1
+
+    def idle_cycles(self):
+        """Return the number of cycles in which no component does any work."""
+        if self.last_active is not None and self.last_active.idle_cycles() == 0:
+            return 0
+        n_cycles = math.inf
+        for comp in self.components:
+            n_cycles = min(n_cycles, comp.idle_cycles())
+            if n_cycles == 0:
+                self.last_active = comp
+                break
+        return n_cycles
@@ -1,11 +1,44 @@
-class BroadcastBus:
+from collections import defaultdict
+import math
+from time import perf_counter
+
+from procsim.clocked import Clocked
+
+class BroadcastBus(Clocked):
     """BroadcastBus coordinates publishing a message to all subscribers.
 
     A subscriber must have a `receive' method that takes one argument.
+    Components may instead listen for the message with a given tag, in which
+    case they receive only that message.
+
+    If batched, messages published during a cycle are held until the bus is
+    triggered and then delivered together, via a subscriber's receive_batch
+    method if it has one. Register a batched bus with the Clock after every
+    other component so deliveries land at the end of the cycle. Note that this
+    delays every Result by one cycle compared to immediate delivery.
+
+    Args:
+        batched: If True, deliver messages once per cycle. (default False)
+
+    Attributes:
+        n_messages: Total number of messages published.
+        n_deliveries: Total number of receive calls made.
+        messages_per_cycle: {n_messages: n_cycles} dict counting the cycles in
+            which n_messages > 0 messages were published. Only kept if the bus
+            is registered with a Clock.
+        deliveries_per_message: {n_deliveries: n_messages} dict.
     """
 
-    def __init__(self):
+    def __init__(self, batched=False):
         self.subscribers = set()
+        self.listeners = {}
+        self.batched = batched
+        self.pending = []
+        self.n_messages = 0
+        self.n_deliveries = 0
+        self.n_cycle_messages = 0
+        self.messages_per_cycle = defaultdict(int)
+        self.deliveries_per_message = defaultdict(int)
 
     def subscribe(self, component):
         """Subscribe a component so that it receives published messages.
@@ -15,6 +48,22 @@ class BroadcastBus:
         """
         self.subscribers.add(component)
 
+    def listen(self, tag, component):
+        """Deliver the next message with the given tag to component.
+
+        The component stops listening once the message is delivered.
+        Listening more than once for the same tag has no further effect.
+
+        Args:
+            tag: Tag of the message to receive.
+            component: Component with a receive method.
+        """
+        listeners = self.listeners.get(tag)
+        if listeners is None:
+            self.listeners[tag] = {component: None}
+        else:
+            listeners[component] = None
+
     def publish(self, message):
         """Publish message to all subscribed components.
 
@@ -28,5 +77,109 @@ class BroadcastBus:
             AttributeError if a subscribed component does not have a receive
             method.
         """
+        self.n_messages += 1
+        self.n_cycle_messages += 1
+        if self.batched:
+            self.pending.append(message)
+            return
+        n_deliveries = len(self.subscribers)
         for subscriber in self.subscribers:
             subscriber.receive(message)
+        if self.listeners:
+            listeners = self.listeners.pop(message.tag, ())
+            n_deliveries += len(listeners)
+            for listener in listeners:
+                listener.receive(message)
+        self.n_deliveries += n_deliveries
+        self.deliveries_per_message[n_deliveries] += 1
+
+    def _deliver_batch(self):
+        """Deliver all pending messages, grouped by receiving component."""
+        batch = self.pending
+        self.pending = []
+        batches = {subscriber: batch for subscriber in self.subscribers}
+        for message in batch:
+            n_deliveries = len(self.subscribers)
+            if self.listeners:
+                listeners = self.listeners.pop(message.tag, ())
+                n_deliveries += len(listeners)
+                for listener in listeners:
+                    if batches.get(listener) is batch:
+                        # Subscribers already receive every message.
+                        continue
+                    batches.setdefault(listener, []).append(message)
+            self.n_deliveries += n_deliveries
+            self.deliveries_per_message[n_deliveries] += 1
+        for (component, messages) in batches.items():
+            self._receive_batch(component, messages)
+
+    def _receive_batch(self, component, messages):
+        receive_batch = getattr(component, 'receive_batch', None)
+        if receive_batch is not None:
+            receive_batch(messages)
+        else:
+            for message in messages:
+                component.receive(message)
+
+    def flush(self):
+        """Discard pending messages and listeners of flushed instructions."""
+        self.pending = []
+        self.listeners = {}
+
+    def operate(self):
+        pass
+
+    def trigger(self):
+        """Deliver a pending batch and record the number of messages."""
+        if self.pending:
+            self._deliver_batch()
+        if self.n_cycle_messages:
+            self.messages_per_cycle[self.n_cycle_messages] += 1
+            self.n_cycle_messages = 0
+
+    def idle(self):
+        return not self.pending and self.n_cycle_messages == 0
+
+    def idle_cycles(self):
+        return math.inf if self.idle() else 0
+
+    def profile(self, profiler):
+        """Record publish calls and the time each subscriber spends receiving.
+
+        Publishing is only instrumented after this is called.
+
+        Args:
+            profiler: Profiler to record timings in.
+        """
+        self.profiler = profiler
+        self.publish = self._profiled_publish
+        self._receive_batch = self._profiled_receive_batch
+
+    def _profiled_publish(self, message):
+        publish_stat = self.profiler.stat(self, 'publish')
+        publish_start = perf_counter()
+        self.n_messages += 1
+        self.n_cycle_messages += 1
+        if self.batched:
+            self.pending.append(message)
+        else:
+            receivers = list(self.subscribers)
+            if self.listeners:
+                receivers.extend(self.listeners.pop(message.tag, ()))
+            for receiver in receivers:
+                stat = self.profiler.stat(receiver, 'receive')
+                start = perf_counter()
+                receiver.receive(message)
+                stat[0] += 1
+                stat[1] += perf_counter() - start
+            self.n_deliveries += len(receivers)
+            self.deliveries_per_message[len(receivers)] += 1
+        publish_stat[0] += 1
+        publish_stat[1] += perf_counter() - publish_start
+
+    def _profiled_receive_batch(self, component, messages):
+        stat = self.profiler.stat(component, 'receive_batch')
+        start = perf_counter()
+        BroadcastBus._receive_batch(self, component, messages)
+        stat[0] += 1
+        stat[1] += perf_counter() - start
@@ -3,10 +3,35 @@ import abc
 from procsim.pipeline_stage import PipelineStage
 
 class ExecutionUnit(PipelineStage):
-    """Abstract class representing a single ExecutionUnit."""
+    """Abstract class representing a single ExecutionUnit.
+
+    Attributes:
+        free_units: Dict used as an ordered set of the non-full units in this
+            unit's pool, or None if untracked. Subclasses remove the unit when
+            fed and add it back when it can be fed again.
+    """
 
     def __init__(self):
         super().__init__()
+        self.free_units = None
+
+    def track(self, free_units):
+        """Keep free_units updated with this unit while it is not full.
+
+        Args:
+            free_units: Dict used as an ordered set of non-full units.
+        """
+        self.free_units = free_units
+        if not self.full():
+            free_units[self] = None
+
+    def _mark_full(self):
+        if self.free_units is not None:
+            self.free_units.pop(self, None)
+
+    def _mark_free(self):
+        if self.free_units is not None:
+            self.free_units[self] = None
 
     @abc.abstractmethod
     def capability(self):
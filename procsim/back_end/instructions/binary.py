@@ -23,6 +23,10 @@ class Binary(Instruction):
         if self.operand_2 == result.tag:
             self.operand_2 = result.value
 
+    def waiting_tags(self):
+        return [operand for operand in (self.operand_1, self.operand_2)
+                if not isinstance(operand, int)]
+
     def can_dispatch(self):
         return isinstance(self.operand_1, int) and isinstance(self.operand_2, int)
 
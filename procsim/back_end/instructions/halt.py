@@ -10,6 +10,9 @@ class Halt(Instruction):
     def receive(self, result):
         pass
 
+    def waiting_tags(self):
+        return []
+
     def can_dispatch(self):
         return True
 
@@ -21,6 +21,11 @@ class Instruction(Subscriber):
         """
         pass
 
+    @abc.abstractmethod
+    def waiting_tags(self):
+        """Return the tags of operands whose values are still to be received."""
+        pass
+
     @abc.abstractmethod
     def can_dispatch(self):
         """Return True if the Instruction is ready to be dispatched."""
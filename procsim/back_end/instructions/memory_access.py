@@ -23,5 +23,8 @@ class MemoryAccess(Instruction):
         if self.address == result.tag:
             self.address = result.value
 
+    def waiting_tags(self):
+        return [] if isinstance(self.address, int) else [self.address]
+
     def can_dispatch(self):
         return isinstance(self.address, int)
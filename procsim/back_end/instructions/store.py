@@ -19,6 +19,10 @@ class Store(MemoryAccess):
         if self.value == result.tag:
             self.value = result.value
 
+    def waiting_tags(self):
+        return [operand for operand in (self.address, self.value)
+                if not isinstance(operand, int)]
+
     def can_dispatch(self):
         return isinstance(self.address, int) and isinstance(self.value, int)
 
@@ -19,6 +19,9 @@ class Unconditional(Branch):
         if self.operand == result.tag:
             self.operand = result.value
 
+    def waiting_tags(self):
+        return [] if isinstance(self.operand, int) else [self.operand]
+
     def can_dispatch(self):
         return isinstance(self.operand, int)
 
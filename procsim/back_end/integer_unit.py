@@ -1,3 +1,5 @@
+import math
+
 from procsim.back_end.execution_unit import ExecutionUnit
 from procsim.back_end.instructions.integer_logical import IntegerLogical
 
@@ -27,6 +29,7 @@ class IntegerUnit(ExecutionUnit):
         assert self.future_inst is None, 'IntegerUnit fed when full'
         self.future_inst = instruction
         self.future_timer = max(0, instruction.DELAY - 1)
+        self._mark_full()
 
     def full(self):
         """Return True if the IntegerUnit's future state is non-empty."""
@@ -38,6 +41,7 @@ class IntegerUnit(ExecutionUnit):
             self.broadcast_bus.publish(self.current_inst.execute())
             if self.future_inst is self.current_inst:
                 self.future_inst = None
+                self._mark_free()
 
     def trigger(self):
         """Advance the state of the IntegerUnit and init a new future state."""
@@ -48,6 +52,20 @@ class IntegerUnit(ExecutionUnit):
         self.future_inst = self.current_inst
         self.future_timer = max(0, self.current_timer - 1)
 
+    def idle(self):
+        """Return True if the IntegerUnit holds no Instruction."""
+        return self.current_inst is None and self.future_inst is None
+
+    def idle_cycles(self):
+        """Return the number of cycles before the Instruction completes."""
+        if self.current_inst is None:
+            return math.inf if self.future_inst is None else 0
+        return self.current_timer
+
+    def skip(self, n_cycles):
+        self.current_timer -= n_cycles
+        self.future_timer = max(0, self.current_timer - 1)
+
     def capability(self):
         return IntegerLogical
 
@@ -56,3 +74,4 @@ class IntegerUnit(ExecutionUnit):
         self.current_timer = 0
         self.future_inst = None
         self.future_timer = 0
+        self._mark_free()
@@ -1,4 +1,5 @@
 from copy import copy
+import math
 
 from procsim.back_end.instructions.load import Load
 from procsim.back_end.instructions.memory_access import MemoryAccess
@@ -10,12 +11,20 @@ from procsim.pipeline_stage import PipelineStage
 class LoadStoreQueue(PipelineStage, Subscriber):
     """In-order LoadStoreQueue.
 
+    Buffered Instructions waiting on operands are indexed by the tag of each
+    operand they wait on, and the LoadStoreQueue listens on the BroadcastBus
+    for only those tags, so a published Result only reaches its consumers.
+
     Args:
         memory: Memory instructions should execute on.
-        broadcast_bus: BroadcastBus to publish Results to.
+        broadcast_bus: BroadcastBus to publish Results to and listen on. The
+            LoadStoreQueue must not also be subscribed to it.
         capacity: Size of the queue. (Max MemoryAccess Instructions that can be
             contained within the LoadStoreQueue at any one time.)
         data_forwarding: If True, Stores forward results to later Loads.
+
+    Attributes:
+        waiters: {tag: [Instruction]} dict of Instructions waiting on a tag.
     """
 
     def __init__(self, memory, broadcast_bus, capacity=32, width=4, data_forwarding=True, bypassing=True):
@@ -29,6 +38,7 @@ class LoadStoreQueue(PipelineStage, Subscriber):
         self.spec_exec = {}
         self.current_queue = []
         self.future_queue = []
+        self.waiters = {}
         self.data_forwarding = data_forwarding
         self.bypassing = bypassing
 
@@ -44,6 +54,13 @@ class LoadStoreQueue(PipelineStage, Subscriber):
             'LoadStoreQueue fed non-MemoryAccess Instruction'
         self.future_queue.append(instruction)
         self.spec_exec[instruction.uid] = instruction.spec_exec
+        self._listen(instruction)
+
+    def _listen(self, instruction):
+        """Wait for the Results of the tags the Instruction waits on."""
+        for tag in set(instruction.waiting_tags()):
+            self.waiters.setdefault(tag, []).append(instruction)
+            self.broadcast_bus.listen(tag, self)
 
     def speculative_execution_off(self, uid):
         """Turn off the speculative execution status of an Instruction.
@@ -119,11 +136,71 @@ class LoadStoreQueue(PipelineStage, Subscriber):
         self.current_queue = self.future_queue
         self.future_queue = copy(self.current_queue)
 
+    def idle(self):
+        """Return True if the LoadStoreQueue holds no Instructions."""
+        return not self.current_queue and not self.future_queue
+
+    def idle_cycles(self):
+        """Return the number of cycles before an Instruction executes."""
+        if self.future_queue != self.current_queue:
+            return 0
+        waiting = self._waiting()
+        if waiting is None:
+            return 0
+        return min((entry.DELAY - 1 for entry in waiting), default=math.inf)
+
+    def skip(self, n_cycles):
+        for entry in self._waiting():
+            entry.DELAY -= n_cycles
+
+    def _waiting(self):
+        """Return the Instructions whose DELAY operate would decrement.
+
+        Mirrors the scan in operate without changing any state.
+
+        Returns:
+            List of Instructions, or None if operate would execute an
+            Instruction this cycle.
+        """
+        waiting = []
+        n_op = 0
+        next_idx = 0
+        unk_addr = set()
+
+        while len(self.current_queue) > next_idx and n_op < self.width:
+            n_op += 1
+
+            entry = self.current_queue[next_idx]
+            next_idx += 1
+            if self.spec_exec[entry.uid] or not entry.can_dispatch():
+                if isinstance(entry, Store):
+                    if entry.address is None:
+                        break
+                    unk_addr.add(entry.address)
+                continue
+
+            if entry.address in unk_addr:
+                continue
+
+            if entry.DELAY <= 1 or hasattr(entry, 'forwarded'):
+                return None
+            waiting.append(entry)
+        return waiting
+
     def receive(self, result):
-        for instruction in self.current_queue:
+        """Forward the Result to Instructions waiting on its tag."""
+        waiting = self.waiters.pop(result.tag, None)
+        if waiting is None:
+            return
+        for instruction in waiting:
             instruction.receive(result)
 
     def flush(self):
         self.current_queue = [ins for ins in self.current_queue if not self.spec_exec[ins.uid]]
         self.future_queue = [ins for ins in self.future_queue if not self.spec_exec[ins.uid]]
         self.spec_exec = {ins.uid: False for ins in self.future_queue}
+        # The BroadcastBus may have dropped its listeners, so listen again
+        # for the remaining Instructions.
+        self.waiters = {}
+        for instruction in self.future_queue:
+            self._listen(instruction)
@@ -1,4 +1,5 @@
-from copy import copy
+import math
+import operator
 
 from procsim.back_end.instructions.branch import Branch
 from procsim.back_end.instructions.conditional import Conditional
@@ -7,6 +8,7 @@ from procsim.back_end.instructions import load as back_end_load
 from procsim.back_end.instructions import store as back_end_store
 from procsim.back_end.instructions.integer_logical import IntegerLogical
 from procsim.back_end.subscriber import Subscriber
+from procsim.back_end.tag import Tag
 from procsim.end_of_program import EndOfProgram
 from procsim.front_end.instructions import *
 from procsim.pipeline_stage import PipelineStage
@@ -28,6 +30,9 @@ class ReorderBuffer(PipelineStage, Subscriber):
             instructions in it's queue. (default 4)
 
     Attributes:
+        slots: Preallocated circular queue of QueueEntry objects, indexed by
+            slot. Free slots hold None.
+        tags: The Tag of each slot.
         n_issued: Number of instructions issued.
         n_committed: Number of instructions committed.
         n_branch_correct: Number of correctly predicted branch instructions.
@@ -55,17 +60,18 @@ class ReorderBuffer(PipelineStage, Subscriber):
         if capacity < 1:
             raise ValueError('capacity must be >= 1')
         self.CAPACITY = capacity
-        self.ID_PREFIX = 'ROB'
         # Invariant: head_id's point to first entry in queue. tail_id's point
-        # to next free slot in queue.
+        # to next free slot in queue. Only the head and tail are double
+        # buffered: entries fed this cycle lie beyond current_tail_id and so
+        # are not visible to operate until trigger.
         self.current_head_id = None
         self.current_tail_id = 0
         self.future_head_id = None
         self.future_tail_id = 0
-        self.current_queue = {}
-        self.future_queue = {}
+        self.slots = [None] * capacity
+        self.tags = [Tag(slot) for slot in range(capacity)]
 
-        # RAT.
+        # RAT, keyed by RegisterFile index.
         self.register_alias_table = {}
 
         self._init_lookup_tables()
@@ -89,13 +95,15 @@ class ReorderBuffer(PipelineStage, Subscriber):
                                     Blth:  self._translate_conditional,
                                     Halt:  self._translate_halt}
 
-        self.operation_lookup = {Add:  lambda o1, o2: o1 + o2,
-                                 AddI: lambda o1, o2: o1 + o2,
-                                 Sub:  lambda o1, o2: o1 - o2,
-                                 SubI: lambda o1, o2: o1 - o2,
-                                 Mul:  lambda o1, o2: o1 * o2,
-                                 MulI: lambda o1, o2: o1 * o2,
-                                 Blth: lambda o1, o2: o1 < o2}
+        # Module-level functions rather than lambdas so the ReorderBuffer
+        # can be pickled.
+        self.operation_lookup = {Add:  operator.add,
+                                 AddI: operator.add,
+                                 Sub:  operator.sub,
+                                 SubI: operator.sub,
+                                 Mul:  operator.mul,
+                                 MulI: operator.mul,
+                                 Blth: operator.lt}
 
         self.type_lookup = {Add:   self.REGISTER,
                             AddI:  self.REGISTER,
@@ -108,18 +116,29 @@ class ReorderBuffer(PipelineStage, Subscriber):
                             Blth:  self.REGISTER,
                             Halt:  None}
 
-    def feed(self, front_end_ins):
+    def feed(self, front_end_ins, branch_info=None):
         """Insert an Instruction into the ReorderBuffer.
 
         Args:
             front_end_ins: Frontend instruction to insert.
+            branch_info: BranchInfo of a conditional branch. (default None,
+                the branch_info attribute of front_end_ins)
+
+        Raises:
+            ValueError if a conditional branch has no BranchInfo.
         """
         assert not self.full(front_end_ins), 'ReorderBuffer fed when full'
+        if branch_info is None and isinstance(front_end_ins, Blth):
+            branch_info = getattr(front_end_ins, 'branch_info', None)
+            if branch_info is None:
+                raise ValueError('conditional branch without branch_info %r'
+                                 % front_end_ins)
         self.n_issued += 1
 
         # Translate to back_end Instruction.
         translate = self.translate_fn_lookup[type(front_end_ins)]
         back_end_ins = translate(front_end_ins)
+        index = self.register_file.index
 
         # Add a QueueEntry to ROB queue.
         if isinstance(back_end_ins, back_end_store.Store):
@@ -130,7 +149,9 @@ class ReorderBuffer(PipelineStage, Subscriber):
                                      spec_exec=self.spec_exec)
             queue_entry.uid = back_end_ins.uid
         elif isinstance(back_end_ins, back_end_load.Load):
-            queue_entry = QueueEntry(dest=front_end_ins.rd,
+            dest = index[front_end_ins.rd]
+            self.register_alias_table[dest] = back_end_ins.tag
+            queue_entry = QueueEntry(dest=dest,
                                      value=None,
                                      done=False,
                                      typ=back_end_load.Load,
@@ -138,8 +159,8 @@ class ReorderBuffer(PipelineStage, Subscriber):
             queue_entry.uid = back_end_ins.uid
         elif isinstance(back_end_ins, Conditional):
             # Conditional instructions should come with BranchInfo.
-            queue_entry = QueueEntry(dest='pc',
-                                     value=front_end_ins.branch_info,
+            queue_entry = QueueEntry(dest=self.register_file.PC,
+                                     value=branch_info,
                                      typ=Conditional,
                                      done=False,
                                      spec_exec=self.spec_exec)
@@ -151,13 +172,15 @@ class ReorderBuffer(PipelineStage, Subscriber):
                                      done=True,
                                      spec_exec=self.spec_exec)
         else:
-            queue_entry = QueueEntry(dest=front_end_ins.rd,
+            dest = index[front_end_ins.rd]
+            self.register_alias_table[dest] = back_end_ins.tag
+            queue_entry = QueueEntry(dest=dest,
                                      value=None,
                                      typ=None,
                                      done=False,
                                      spec_exec=self.spec_exec)
 
-        self.future_queue[back_end_ins.tag] = queue_entry
+        self.slots[back_end_ins.tag.slot] = queue_entry
 
         # Feed to stage further down pipeline.
         typ = self.type_lookup[type(front_end_ins)]
@@ -206,8 +229,7 @@ class ReorderBuffer(PipelineStage, Subscriber):
                 # Unable to commit any more this cycle.
                 break
 
-            id = self.ID_PREFIX + str(self.current_head_id)
-            head = self.current_queue[id]
+            head = self.slots[self.current_head_id]
             if not head.done or head.spec_exec:
                 # Value still being computed or still speculative.
                 break
@@ -240,12 +262,24 @@ class ReorderBuffer(PipelineStage, Subscriber):
         """Future queue state becomes the current queue state."""
         self.current_head_id = self.future_head_id
         self.current_tail_id = self.future_tail_id
-        self.current_queue = self.future_queue
-        self.future_queue = copy(self.current_queue)
+
+    def idle_cycles(self):
+        """Return 0 if the head instruction can commit, else math.inf."""
+        if (self.future_tail_id != self.current_tail_id
+                or self.future_head_id != self.current_head_id):
+            return 0
+        if self.current_head_id is None:
+            return math.inf
+        if self.current_head_id == self.current_tail_id:
+            return 0
+        head = self.slots[self.current_head_id]
+        if not head.done or head.spec_exec:
+            return math.inf
+        return 0
 
     def receive(self, result):
         """Update the value of the QueueEntry ID that matches the result tag."""
-        entry = self.future_queue[result.tag]
+        entry = self.slots[result.tag.slot]
         if entry.typ != Conditional:
             entry.value = result.value
         else:
@@ -260,8 +294,7 @@ class ReorderBuffer(PipelineStage, Subscriber):
         self.current_tail_id = 0
         self.future_head_id = None
         self.future_tail_id = 0
-        self.current_queue = {}
-        self.future_queue = {}
+        self.slots = [None] * self.CAPACITY
 
         self.register_alias_table = {}
 
@@ -282,11 +315,11 @@ class ReorderBuffer(PipelineStage, Subscriber):
         Returns:
             IntegerLogical Instruction.
         """
-        operand_1 = self._translate_operand(front_end_ins.r1)
-        operand_2 = self._translate_operand(front_end_ins.r2)
+        index = self.register_file.index
+        operand_1 = self._translate_operand(index[front_end_ins.r1])
+        operand_2 = self._translate_operand(index[front_end_ins.r2])
 
         queue_id = self._get_queue_id()
-        self.register_alias_table[front_end_ins.rd] = queue_id
 
         ins = IntegerLogical(queue_id,
                               self.operation_lookup[type(front_end_ins)],
@@ -306,11 +339,11 @@ class ReorderBuffer(PipelineStage, Subscriber):
         Returns:
             IntegerLogical Instruction.
         """
-        operand_1 = self._translate_operand(front_end_ins.r1)
+        operand_1 = self._translate_operand(
+            self.register_file.index[front_end_ins.r1])
         operand_2 = front_end_ins.imm
 
         queue_id = self._get_queue_id()
-        self.register_alias_table[front_end_ins.rd] = queue_id
 
         return IntegerLogical(queue_id,
                               self.operation_lookup[type(front_end_ins)],
@@ -330,10 +363,10 @@ class ReorderBuffer(PipelineStage, Subscriber):
             MemoryAccess Instruction.
         """
 
+        index = self.register_file.index
         if isinstance(front_end_ins, Load):
-            address = self._translate_operand(front_end_ins.r1)
+            address = self._translate_operand(index[front_end_ins.r1])
             queue_id = self._get_queue_id()
-            self.register_alias_table[front_end_ins.rd] = queue_id
             uid = self.memory_uid
             self.memory_uid += 1
             return back_end_load.Load(queue_id,
@@ -341,8 +374,8 @@ class ReorderBuffer(PipelineStage, Subscriber):
                                       uid,
                                       self.spec_exec)
         elif isinstance(front_end_ins, Store):
-            address = self._translate_operand(front_end_ins.r1)
-            value = self._translate_operand(front_end_ins.rs)
+            address = self._translate_operand(index[front_end_ins.r1])
+            value = self._translate_operand(index[front_end_ins.rs])
             uid = self.memory_uid
             self.memory_uid += 1
             queue_id = self._get_queue_id()
@@ -366,8 +399,9 @@ class ReorderBuffer(PipelineStage, Subscriber):
         Returns:
             Conditional Instruction.
         """
-        operand_1 = self._translate_operand(front_end_ins.r1)
-        operand_2 = self._translate_operand(front_end_ins.r2)
+        index = self.register_file.index
+        operand_1 = self._translate_operand(index[front_end_ins.r1])
+        operand_2 = self._translate_operand(index[front_end_ins.r2])
         queue_id = self._get_queue_id()
 
         return Conditional(queue_id,
@@ -395,14 +429,14 @@ class ReorderBuffer(PipelineStage, Subscriber):
         """Allocate and return a ROB ID.
 
         Returns:
-            ROB ID (string).
+            ROB ID (Tag).
 
         Raises:
             AssertionError if no ROB ID available (internal queue is full).
         """
         assert self.future_tail_id is not None,\
             'No free slot in ROB'
-        id = self.ID_PREFIX + str(self.future_tail_id)
+        id = self.tags[self.future_tail_id]
         # Establish the invariant.
         if self.future_head_id is None:
             self.future_head_id = self.future_tail_id
@@ -411,24 +445,26 @@ class ReorderBuffer(PipelineStage, Subscriber):
             self.future_tail_id = None
         return id
 
-    def _translate_operand(self, register_name):
-        """Convert the register name to an operand (value or ROB ID).
+    def _translate_operand(self, register_index):
+        """Convert the register index to an operand (value or ROB ID).
+
+        Args:
+            register_index: RegisterFile index of the source Register.
 
         Returns:
-            Value stored in register_name or the ID of a QueueEntry in the ROB
+            Value stored in the Register or the ID of a QueueEntry in the ROB
             that will yield the value.
         """
-        if register_name in self.register_alias_table:
-            rob_id = self.register_alias_table[register_name]
-            entry = self.future_queue[rob_id]
+        rob_id = self.register_alias_table.get(register_index)
+        if rob_id is not None:
+            entry = self.slots[rob_id.slot]
             if entry.done:
                 return entry.value
             return rob_id
-        return self.register_file[register_name]
+        return self.register_file.values[register_index]
 
     def _process_store_entry(self, entry):
-        id = self.ID_PREFIX + str(self.current_head_id)
-        del self.future_queue[id]
+        self.slots[self.current_head_id] = None
         # ROB ID now free.
         if self.future_tail_id is None:
             self.future_tail_id = self.current_head_id
@@ -438,17 +474,15 @@ class ReorderBuffer(PipelineStage, Subscriber):
 
     def _process_queue_entry(self, entry):
         # Write value to RegisterFile and remove from future queue.
-        self.register_file[entry.dest] = entry.value
-
-        id = self.ID_PREFIX + str(self.current_head_id)
+        self.register_file.values[entry.dest] = entry.value
 
-        del self.current_queue[id]
-        del self.future_queue[id]
+        id = self.tags[self.current_head_id]
+        self.slots[self.current_head_id] = None
         # If RAT points to this ROB ID then we can remove the RAT entry as
         # the value is now in the RegisterFile.
         try:
             rat_id = self.register_alias_table[entry.dest]
-            if rat_id == id:
+            if rat_id is id:
                 del self.register_alias_table[entry.dest]
         except KeyError:
             pass
@@ -477,7 +511,7 @@ class ReorderBuffer(PipelineStage, Subscriber):
             self.spec_exec = False
 
             while id != self.current_head_id and id != self.future_tail_id:
-                entry = self.future_queue[self.ID_PREFIX + str(id)]
+                entry = self.slots[id]
                 entry.spec_exec = False
                 if entry.typ == back_end_store.Store or entry.typ == back_end_load.Load:
                     self.load_store_queue.speculative_execution_off(entry.uid)
@@ -487,8 +521,7 @@ class ReorderBuffer(PipelineStage, Subscriber):
                 id = (id + 1) % self.CAPACITY
 
             # ROB ID now free.
-            del self.current_queue[self.ID_PREFIX + str(self.current_head_id)]
-            del self.future_queue[self.ID_PREFIX + str(self.current_head_id)]
+            self.slots[self.current_head_id] = None
             if self.future_tail_id is None:
                 self.future_tail_id = self.current_head_id
             self.current_head_id = (self.current_head_id + 1) % self.CAPACITY
@@ -507,7 +540,7 @@ class QueueEntry:
     """An entry in a ReorderBuffer's circular queue.
 
     Attributes:
-        dest: Target to store value in.
+        dest: RegisterFile index to store value in.
         value: Value to save to dest. None indicates that it is still to be
             computed by the processor. (default None)
         done: False if the QueueEntry is still waiting for the Instruction to
@@ -1,8 +1,9 @@
+from bisect import insort
 from collections import defaultdict
-from copy import copy
-from itertools import filterfalse
 import inspect
+import math
 
+from procsim.back_end.execution_unit import ExecutionUnit
 from procsim.back_end.subscriber import Subscriber
 from procsim.pipeline_stage import PipelineStage
 
@@ -10,20 +11,48 @@ class ReservationStation(PipelineStage, Subscriber):
     """A ReservationStation that buffers Instructions until all of their
     execution requirements are met.
 
+    Buffered Instructions waiting on operands are indexed by the tag of each
+    operand they wait on, so a published Result only wakes its consumers.
+    Instructions with all operands available are kept in a ready list in the
+    order they were fed, which is the order they are considered for dispatch.
+
     Args:
         capacity: Size of the buffer.  (Max Instructions that can be contained
             within the ReservationStation at any one time.)
+        broadcast_bus: If not None, the ReservationStation listens on this
+            BroadcastBus for only the tags its Instructions wait on and must
+            not also be subscribed to it. (default None)
+
+    Attributes:
+        execution_units: {capability: set(ExecutionUnit)} dict.
+        free_units: {capability: {ExecutionUnit: None}} dict holding, as an
+            ordered set, the units of each capability that can be fed.
+        dispatch_table: {Instruction class: [free unit dict]} dict, in the
+            order the class's capabilities are tried. Built on first use and
+            cleared when a unit is registered.
+        waiters: {tag: [Instruction]} dict of Instructions waiting on a tag.
+        ready: List of (sequence number, Instruction) tuples, oldest first,
+            for Instructions that can be dispatched.
     """
 
-    def __init__(self, capacity=32, width=4):
+    def __init__(self, capacity=32, width=4, broadcast_bus=None):
         super().__init__()
+        self.broadcast_bus = broadcast_bus
         self.execution_units = defaultdict(set)
+        self.free_units = {}
+        self.dispatch_table = {}
         if capacity < 1:
             raise ValueError('capacity must be >= 1')
         self.CAPACITY = capacity
         self.width = width
-        self.current_buffer = []
-        self.future_buffer = []
+        self.waiters = {}
+        self.ready = []
+        # Instructions with sequence number >= current_seq were fed this
+        # cycle and are not visible to operate until trigger.
+        self.current_seq = 0
+        self.future_seq = 0
+        self.current_size = 0
+        self.future_size = 0
 
     def feed(self, instruction):
         """Insert an Instruction into the ReservationStation.
@@ -31,9 +60,20 @@ class ReservationStation(PipelineStage, Subscriber):
         Args:
             instruction: Instruction to insert.
         """
-        assert len(self.future_buffer) < self.CAPACITY,\
+        assert self.future_size < self.CAPACITY,\
             'ReservationStation fed when full'
-        self.future_buffer.append(instruction)
+        seq = self.future_seq
+        self.future_seq += 1
+        self.future_size += 1
+        instruction.seq = seq
+        tags = instruction.waiting_tags()
+        if not tags:
+            self.ready.append((seq, instruction))
+            return
+        for tag in set(tags):
+            self.waiters.setdefault(tag, []).append(instruction)
+            if self.broadcast_bus is not None:
+                self.broadcast_bus.listen(tag, self)
 
     def full(self):
         """Return True if the ReservationStation is full.
@@ -42,40 +82,84 @@ class ReservationStation(PipelineStage, Subscriber):
             True if the ReservationStation is unable to be fed more
             Instructions.
         """
-        return len(self.future_buffer) == self.CAPACITY
+        return self.future_size == self.CAPACITY
 
     def operate(self):
-        """Issue fed Instructions to capable and non-full ExecutionUnits.
+        """Issue ready Instructions to capable and non-full ExecutionUnits.
 
         Raises:
             AssertionError if no ExecutionUnits exist that are capable of
             executing the Instruction.
         """
         n_dispatch = 0
-
-        for i, instruction in enumerate(self.current_buffer):
-            if n_dispatch == self.width:
+        # Instruction types with no idle capable unit this cycle.
+        blocked = set()
+
+        ready = self.ready
+        i = 0
+        while i < len(ready) and n_dispatch < self.width:
+            seq, instruction = ready[i]
+            if seq >= self.current_seq:
                 break
-            if not instruction.can_dispatch():
-                continue
-            exist = False
-            for cap in inspect.getmro(type(instruction)):
-                units = self.execution_units[cap]
-                exist = exist or units
-
-                idle = {u for u in units if not u.full()}
-                if idle:
-                    unit = next(iter(idle))
+            typ = type(instruction)
+            if typ not in blocked:
+                unit = self._idle_unit(instruction)
+                if unit is not None:
                     unit.feed(instruction)
-                    del self.future_buffer[i - n_dispatch]
+                    del ready[i]
+                    self.future_size -= 1
                     n_dispatch += 1
-                    break
-            assert exist, 'Instruction %r has no ExecutionUnit' % instruction
+                    continue
+                blocked.add(typ)
+            i += 1
+
+    def _idle_unit(self, instruction):
+        """Return a non-full ExecutionUnit capable of executing instruction.
+
+        Returns:
+            ExecutionUnit or None if all capable units are full.
+
+        Raises:
+            AssertionError if no capable ExecutionUnits exist.
+        """
+        pools = self._pools(type(instruction))
+        assert pools, 'Instruction %r has no ExecutionUnit' % instruction
+        for pool in pools:
+            if pool:
+                return next(iter(pool))
+        return None
+
+    def _pools(self, typ):
+        """Return the dispatch table entry for an Instruction class."""
+        pools = self.dispatch_table.get(typ)
+        if pools is None:
+            pools = [self.free_units[cap] for cap in inspect.getmro(typ)
+                     if self.execution_units.get(cap)]
+            self.dispatch_table[typ] = pools
+        return pools
 
     def trigger(self):
-        """Free up buffer space by removing the issued Instructions."""
-        self.current_buffer = self.future_buffer
-        self.future_buffer = copy(self.current_buffer)
+        """Fed Instructions become visible to operate."""
+        self.current_seq = self.future_seq
+        self.current_size = self.future_size
+
+    def idle(self):
+        """Return True if the ReservationStation holds no Instructions."""
+        return self.current_size == 0 and self.future_size == 0
+
+    def idle_cycles(self):
+        """Return 0 if an Instruction can be dispatched, else math.inf."""
+        if (self.future_seq != self.current_seq
+                or self.future_size != self.current_size):
+            return 0
+        for typ in {type(instruction) for (_, instruction) in self.ready}:
+            pools = self._pools(typ)
+            if not pools:
+                # operate raises for Instructions without an ExecutionUnit.
+                return 0
+            if any(pools):
+                return 0
+        return math.inf
 
     def register(self, execution_unit):
         """Enable the ReservationStation to issue Instructions to the unit.
@@ -84,15 +168,49 @@ class ReservationStation(PipelineStage, Subscriber):
             execution_unit: ExecutionUnit to register with the
                 ReservationStation.
         """
-        self.execution_units[execution_unit.capability()].add(execution_unit)
+        cap = execution_unit.capability()
+        self.execution_units[cap].add(execution_unit)
+        pool = self.free_units.setdefault(cap, {})
+        if isinstance(execution_unit, ExecutionUnit):
+            execution_unit.track(pool)
+        else:
+            # Untracked units are assumed to never become full.
+            pool[execution_unit] = None
+        self.dispatch_table = {}
 
     def receive(self, result):
-        for instruction in self.future_buffer:
+        """Forward the Result to Instructions waiting on its tag."""
+        waiting = self.waiters.pop(result.tag, None)
+        if waiting is None:
+            return
+        for instruction in waiting:
             instruction.receive(result)
+            if instruction.can_dispatch():
+                insort(self.ready, (instruction.seq, instruction))
+
+    def receive_batch(self, results):
+        """Forward each Result to the Instructions waiting on its tag."""
+        woken = {}
+        for result in results:
+            waiting = self.waiters.pop(result.tag, None)
+            if waiting is None:
+                continue
+            for instruction in waiting:
+                instruction.receive(result)
+                woken[instruction] = None
+        ready = [(instruction.seq, instruction) for instruction in woken
+                 if instruction.can_dispatch()]
+        if ready:
+            self.ready.extend(ready)
+            self.ready.sort()
 
     def flush(self):
-        self.current_buffer = []
-        self.future_buffer = []
+        self.waiters = {}
+        self.ready = []
+        self.current_size = 0
+        self.future_size = 0
+        if self.broadcast_bus is not None:
+            self.broadcast_bus.flush()
         for units in self.execution_units.values():
             for unit in units:
                 unit.flush()
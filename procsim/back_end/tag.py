@@ -0,0 +1,22 @@
+class Tag:
+    """Identifies a ReorderBuffer slot.
+
+    Each slot has a single Tag that is reused by every instruction allocated
+    to it, so Tags compare by identity. Tags are deliberately not ints: an int
+    operand is a ready value whereas a Tag operand is a value still to be
+    produced by the instruction in that slot.
+
+    Args:
+        slot: Index of the slot in the ReorderBuffer.
+    """
+
+    __slots__ = ('slot',)
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __repr__(self):
+        return 'Tag(%r)' % self.slot
+
+    def __str__(self):
+        return 'ROB%d' % self.slot
@@ -1,5 +1,3 @@
-from collections import defaultdict
-
 from procsim.branch.branch_info import BranchInfo
 from procsim.branch.predictor import Predictor
 
@@ -12,25 +10,35 @@ class BranchHistoryTable(Predictor):
     Args:
         n_entries: Size of the history table.
         n_prediction_bits: Number of bits to use for the saturating counter.
+
+    Attributes:
+        history_table: {entry: counter} dict holding the counters that have
+            been updated. Other entries are weakly taken.
     """
 
     def __init__(self, n_entries, n_prediction_bits):
         super().__init__()
         self.n_entries = n_entries
         self.n_prediction_bits = n_prediction_bits
-        self.history_table = defaultdict(lambda: 2**(n_prediction_bits - 1))
+        self.initial_counter = 2**(n_prediction_bits - 1)
+        self.history_table = {}
 
-    def predict(self, program_counter, instruction_str):
-        blth = self._parse_conditional(instruction_str)
+    def predict(self, program_counter, instruction):
+        blth = self._parse_conditional(instruction)
 
-        counter = self.history_table[program_counter % self.n_entries]
-        taken = counter >= 2**(self.n_prediction_bits - 1)
+        taken = self.taken(program_counter)
 
         return BranchInfo(taken, blth.imm, program_counter + 1, program_counter)
 
+    def taken(self, addr):
+        """Return True if the counter of the branch at addr predicts taken."""
+        counter = self.history_table.get(addr % self.n_entries,
+                                         self.initial_counter)
+        return counter >= self.initial_counter
+
     def receive(self, addr, taken):
         idx = addr % self.n_entries
-        counter = self.history_table[idx]
+        counter = self.history_table.get(idx, self.initial_counter)
         if taken:
             counter += 1
         else:
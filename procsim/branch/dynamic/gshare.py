@@ -0,0 +1,76 @@
+from procsim.branch.branch_info import BranchInfo
+from procsim.branch.global_history import GlobalHistory
+from procsim.branch.predictor import Predictor
+
+class GShare(Predictor):
+    """A gshare Predictor with N prediction bits.
+
+    Saturating counters are indexed by the program counter XOR a global
+    history register holding the outcomes of the most recent conditional
+    branches, so branches whose outcome depends on the path taken to reach
+    them get separate counters. Counters are initialized to weakly taken,
+    2**(n_prediction_bits - 1).
+
+    Predictions index with the speculative history and update it, received
+    branches update the counters indexed with the committed history, see
+    GlobalHistory.
+
+    Args:
+        n_entries: Size of the history table.
+        n_prediction_bits: Number of bits to use for the saturating counter.
+        n_history_bits: Number of branch outcomes in the global history.
+
+    Attributes:
+        global_history: GlobalHistory of n_history_bits outcomes.
+        history_table: {entry: counter} dict holding the counters that have
+            been updated. Other entries are weakly taken.
+    """
+
+    def __init__(self, n_entries, n_prediction_bits, n_history_bits):
+        super().__init__()
+        self.n_entries = n_entries
+        self.n_prediction_bits = n_prediction_bits
+        self.n_history_bits = n_history_bits
+        self.initial_counter = 2**(n_prediction_bits - 1)
+        self.global_history = GlobalHistory(n_history_bits)
+        self.history_table = {}
+
+    def predict(self, program_counter, instruction):
+        blth = self._parse_conditional(instruction)
+
+        taken = self.taken(program_counter, self.global_history.speculative)
+        self.global_history.predicted(taken)
+
+        return BranchInfo(taken, blth.imm, program_counter + 1, program_counter)
+
+    def taken(self, addr, history=None):
+        """Return True if the counter of the branch at addr predicts taken.
+
+        Args:
+            addr: Address of the conditional branch.
+            history: Global history to index with. (default None, the
+                committed history)
+        """
+        if history is None:
+            history = self.global_history.committed
+        counter = self.history_table.get((addr ^ history) % self.n_entries,
+                                         self.initial_counter)
+        return counter >= self.initial_counter
+
+    def receive(self, addr, taken):
+        idx = (addr ^ self.global_history.committed) % self.n_entries
+        counter = self.history_table.get(idx, self.initial_counter)
+        if taken:
+            counter += 1
+        else:
+            counter -= 1
+        # Saturating counter.
+        counter = max(0, min(2**self.n_prediction_bits - 1, counter))
+        self.history_table[idx] = counter
+        self.global_history.received(taken)
+
+    def overridden(self, taken):
+        self.global_history.overridden(taken)
+
+    def flush(self):
+        self.global_history.flush()
@@ -0,0 +1,149 @@
+from collections import deque
+
+from procsim.branch.branch_info import BranchInfo
+from procsim.branch.predictor import Predictor
+
+class LoopPredictor(Predictor):
+    """A loop Predictor that predicts the exits of counted loops.
+
+    Each entry of a direct-mapped table, tagged with the branch address,
+    learns the trip count of a loop branch: the number of times it is taken
+    before it is not taken once. Once a trip count has been repeated
+    confidence_threshold times in a row, the LoopPredictor predicts taken
+    until the trip count is reached and not taken on the final iteration,
+    overriding the base Predictor. Otherwise the base Predictor's prediction
+    is used, or taken if there is none.
+
+    The base Predictor predicts and receives every branch, so it keeps
+    training while the LoopPredictor overrides it, and is told the direction
+    fetched when overridden, see Predictor.overridden. Each entry keeps a
+    speculative iteration count, updated with each prediction, and a
+    committed count, updated by received branches, which flush restores.
+
+    Args:
+        base_predictor: Predictor to use for branches whose trip count is not
+            known, or None to predict taken. (default None)
+        n_entries: Size of the loop table. (default 64)
+        confidence_threshold: Number of repetitions of a trip count before it
+            is used. (default 2)
+
+    Attributes:
+        entries: {index: _LoopEntry} dict of allocated table entries.
+        n_overrides: Number of received branches the LoopPredictor predicted
+            differently to the base Predictor.
+        n_flushes_removed: Number of overrides that were correct, so removed
+            a pipeline flush the base Predictor would have caused.
+        n_flushes_added: Number of overrides that were incorrect.
+    """
+
+    def __init__(self, base_predictor=None, n_entries=64,
+                 confidence_threshold=2):
+        super().__init__()
+        self.base_predictor = base_predictor
+        self.n_entries = n_entries
+        self.confidence_threshold = confidence_threshold
+        self.entries = {}
+        self.n_overrides = 0
+        self.n_flushes_removed = 0
+        self.n_flushes_added = 0
+        # (loop_taken, base_taken) of each predicted branch not yet received.
+        self.in_flight = deque()
+
+    def predict(self, program_counter, instruction):
+        if self.base_predictor is None:
+            blth = self._parse_conditional(instruction)
+            branch_info = BranchInfo(True, blth.imm, program_counter + 1,
+                                     program_counter)
+        else:
+            branch_info = self.base_predictor.predict(program_counter,
+                                                      instruction)
+        base_taken = branch_info.taken
+
+        loop_taken = None
+        entry = self._entry(program_counter)
+        if entry is not None:
+            if entry.confidence >= self.confidence_threshold:
+                loop_taken = entry.speculative_iteration < entry.trip_count
+                branch_info.taken = loop_taken
+                if loop_taken != base_taken and self.base_predictor is not None:
+                    self.base_predictor.overridden(loop_taken)
+            if branch_info.taken:
+                entry.speculative_iteration += 1
+            else:
+                entry.speculative_iteration = 0
+        self.in_flight.append((loop_taken, base_taken))
+
+        return branch_info
+
+    def receive(self, addr, taken):
+        if self.in_flight:
+            (loop_taken, base_taken) = self.in_flight.popleft()
+            if loop_taken is not None and loop_taken != base_taken:
+                self.n_overrides += 1
+                if loop_taken == taken:
+                    self.n_flushes_removed += 1
+                else:
+                    self.n_flushes_added += 1
+
+        entry = self._entry(addr)
+        if entry is None:
+            if taken:
+                entry = _LoopEntry(addr)
+                self.entries[addr % self.n_entries] = entry
+        if entry is not None:
+            if taken:
+                entry.iteration += 1
+                if (entry.trip_count is not None
+                        and entry.iteration > entry.trip_count):
+                    # The loop ran longer than its trip count.
+                    entry.confidence = 0
+            else:
+                if entry.iteration == entry.trip_count:
+                    entry.confidence += 1
+                else:
+                    entry.trip_count = entry.iteration
+                    entry.confidence = 0
+                entry.iteration = 0
+            if not self.in_flight:
+                # Also covers outcomes received without a prediction, such as
+                # from an Emulator.
+                entry.speculative_iteration = entry.iteration
+
+        if self.base_predictor is not None:
+            self.base_predictor.receive(addr, taken)
+
+    def overridden(self, taken):
+        if self.base_predictor is not None:
+            self.base_predictor.overridden(taken)
+
+    def flush(self):
+        self.in_flight.clear()
+        for entry in self.entries.values():
+            entry.speculative_iteration = entry.iteration
+        if self.base_predictor is not None:
+            self.base_predictor.flush()
+
+    def report(self):
+        """Return a human readable multi-line summary of the overrides."""
+        return '\n'.join(['Loop Predictor Overrides: %d' % self.n_overrides,
+                          'Loop Predictor Flushes Removed: %d'
+                          % self.n_flushes_removed,
+                          'Loop Predictor Flushes Added: %d'
+                          % self.n_flushes_added])
+
+    def _entry(self, addr):
+        """Return the entry of the branch at addr or None."""
+        entry = self.entries.get(addr % self.n_entries)
+        if entry is not None and entry.addr == addr:
+            return entry
+        return None
+
+class _LoopEntry:
+    """Trip count state of one loop branch."""
+
+    def __init__(self, addr):
+        self.addr = addr
+        self.trip_count = None
+        self.confidence = 0
+        self.iteration = 0
+        self.speculative_iteration = 0
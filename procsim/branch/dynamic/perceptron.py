@@ -0,0 +1,112 @@
+import numpy as np
+
+from procsim.branch.branch_info import BranchInfo
+from procsim.branch.global_history import GlobalHistory
+from procsim.branch.predictor import Predictor
+
+class Perceptron(Predictor):
+    """A perceptron Predictor.
+
+    Each entry of the weight table, indexed by branch address, is a
+    perceptron with a bias weight and one weight per outcome in the global
+    history. The history is read as a vector of +1 for taken and -1 for not
+    taken, and the branch is predicted taken if the bias plus the dot product
+    of the weights and the history vector is non-negative. A received branch
+    trains its perceptron if it was mispredicted or the magnitude of the
+    output was at most threshold, adding the outcome (+1 or -1) times the
+    history vector to the weights. Weights saturate at n_weight_bits signed
+    integers.
+
+    Predictions use the speculative history and received branches train
+    using the committed history, see GlobalHistory.
+
+    Args:
+        n_entries: Number of perceptrons.
+        n_history_bits: Number of branch outcomes in the global history.
+        n_weight_bits: Number of bits per weight. (default 8)
+        threshold: Training threshold. (default None, 1.93 * n_history_bits
+            + 14)
+
+    Attributes:
+        VECTOR_CACHE_SIZE: Maximum number of cached history vectors.
+        weights: (n_entries, n_history_bits + 1) NumPy array of weights, bias
+            first.
+        global_history: GlobalHistory of n_history_bits outcomes.
+    """
+
+    VECTOR_CACHE_SIZE = 2**16
+
+    def __init__(self, n_entries, n_history_bits, n_weight_bits=8,
+                 threshold=None):
+        super().__init__()
+        self.n_entries = n_entries
+        self.n_history_bits = n_history_bits
+        self.max_weight = 2**(n_weight_bits - 1) - 1
+        self.min_weight = -2**(n_weight_bits - 1)
+        if threshold is None:
+            threshold = int(1.93 * n_history_bits + 14)
+        self.threshold = threshold
+        self.weights = np.zeros((n_entries, n_history_bits + 1),
+                                dtype=np.int32)
+        self.global_history = GlobalHistory(n_history_bits)
+        self._vectors = {}
+
+    def predict(self, program_counter, instruction):
+        blth = self._parse_conditional(instruction)
+
+        taken = self.output(program_counter,
+                            self.global_history.speculative) >= 0
+        self.global_history.predicted(taken)
+
+        return BranchInfo(taken, blth.imm, program_counter + 1, program_counter)
+
+    def output(self, addr, history=None):
+        """Return the perceptron output for the branch at addr.
+
+        Args:
+            addr: Address of the conditional branch.
+            history: Global history to use. (default None, the committed
+                history)
+        """
+        if history is None:
+            history = self.global_history.committed
+        return int(self.weights[addr % self.n_entries].dot(
+            self._vector(history)))
+
+    def receive(self, addr, taken):
+        history = self.global_history.committed
+        output = self.output(addr, history)
+        if (output >= 0) != taken or abs(output) <= self.threshold:
+            idx = addr % self.n_entries
+            vector = self._vector(history)
+            if taken:
+                weights = self.weights[idx] + vector
+            else:
+                weights = self.weights[idx] - vector
+            np.clip(weights, self.min_weight, self.max_weight,
+                    out=self.weights[idx])
+        self.global_history.received(taken)
+
+    def overridden(self, taken):
+        self.global_history.overridden(taken)
+
+    def flush(self):
+        self.global_history.flush()
+
+    def _vector(self, history):
+        """Return 1 followed by the history as +1 (taken) and -1 (not taken).
+
+        The most recent outcome comes first.
+        """
+        vector = self._vectors.get(history)
+        if vector is None:
+            if len(self._vectors) >= self.VECTOR_CACHE_SIZE:
+                self._vectors.clear()
+            # Histories may be wider than a NumPy int64, so bits are
+            # extracted from the Python int.
+            bits = [(history >> i) & 1 for i in range(self.n_history_bits)]
+            vector = np.empty(self.n_history_bits + 1, dtype=np.int32)
+            vector[0] = 1
+            vector[1:] = 2 * np.array(bits, dtype=np.int32) - 1
+            self._vectors[history] = vector
+        return vector
@@ -0,0 +1,205 @@
+from array import array
+
+from procsim.branch.branch_info import BranchInfo
+from procsim.branch.global_history import GlobalHistory
+from procsim.branch.predictor import Predictor
+
+class TAGE(Predictor):
+    """A TAgged GEometric history length (TAGE) Predictor.
+
+    A bimodal base table of 2 bit counters indexed by branch address is
+    backed by n_tables tagged tables. Tagged table i is indexed and tagged
+    with a hash of the branch address and the most recent
+    history_lengths[i] outcomes of the global history, where the lengths
+    grow geometrically from min_history_length to max_history_length.
+
+    The prediction is given by the matching entry of the longest history
+    table, the provider, or by the base table if no tagged entry matches.
+    Tagged entries hold a 3 bit signed counter, predicting taken when
+    non-negative, and a 2 bit usefulness counter that is incremented when the
+    provider is correct and the next longest match, the alternate, is not,
+    and decremented in the opposite case. On a misprediction an entry is
+    allocated in a longer history table whose usefulness is 0. If there is
+    none, the usefulness of those entries is decremented instead. All
+    usefulness counters are halved every RESET_PERIOD received branches so
+    stale entries can be replaced.
+
+    Tables are preallocated arrays. Predictions use the speculative history
+    and received branches update the tables using the committed history, see
+    GlobalHistory.
+
+    Args:
+        n_base_entries: Size of the base table.
+        n_entries: Size of each tagged table.
+        n_tables: Number of tagged tables.
+        min_history_length: History length of the first tagged table.
+        max_history_length: History length of the last tagged table.
+        n_tag_bits: Number of bits in each tag, at most 15. (default 8)
+
+    Attributes:
+        RESET_PERIOD: Number of received branches between usefulness resets.
+        HASH_CACHE_SIZE: Maximum number of cached table hashes.
+        history_lengths: List of the history lengths of the tagged tables.
+        global_history: GlobalHistory of max_history_length outcomes.
+        base_table: Array of base counters, each in 0..3.
+        counters: List of arrays of tagged counters, each in -4..3.
+        tags: List of arrays of tags.
+        useful: List of arrays of usefulness counters, each in 0..3.
+    """
+
+    RESET_PERIOD = 2**18
+    HASH_CACHE_SIZE = 2**16
+
+    def __init__(self, n_base_entries, n_entries, n_tables, min_history_length,
+                 max_history_length, n_tag_bits=8):
+        super().__init__()
+        if not 0 < min_history_length <= max_history_length:
+            raise ValueError('history lengths must satisfy '
+                             '0 < min_history_length <= max_history_length')
+        self.n_base_entries = n_base_entries
+        self.n_entries = n_entries
+        self.n_tables = n_tables
+        self.n_tag_bits = n_tag_bits
+        self.tag_mask = 2**n_tag_bits - 1
+        self.n_index_bits = max(1, (n_entries - 1).bit_length())
+        self.history_lengths = geometric_lengths(n_tables,
+                                                 min_history_length,
+                                                 max_history_length)
+        self.global_history = GlobalHistory(max_history_length)
+        self.base_table = array('b', [2]) * n_base_entries
+        self.counters = [array('b', [0]) * n_entries for _ in range(n_tables)]
+        self.tags = [array('H', [0]) * n_entries for _ in range(n_tables)]
+        self.useful = [array('b', [0]) * n_entries for _ in range(n_tables)]
+        self.n_received = 0
+        self._hashes = {}
+
+    def predict(self, program_counter, instruction):
+        blth = self._parse_conditional(instruction)
+
+        history = self.global_history.speculative
+        taken = self._lookup(program_counter, history)[2]
+        self.global_history.predicted(taken)
+
+        return BranchInfo(taken, blth.imm, program_counter + 1, program_counter)
+
+    def receive(self, addr, taken):
+        history = self.global_history.committed
+        (indices, tags) = self._hash(addr, history)
+        (provider, alternate, predicted_taken,
+         alternate_taken) = self._lookup(addr, history, indices, tags)
+
+        if provider is None:
+            base_idx = addr % self.n_base_entries
+            self.base_table[base_idx] = _saturate(
+                self.base_table[base_idx] + (1 if taken else -1), 0, 3)
+        else:
+            idx = indices[provider]
+            if predicted_taken != alternate_taken:
+                useful = self.useful[provider]
+                useful[idx] = _saturate(
+                    useful[idx] + (1 if predicted_taken == taken else -1), 0, 3)
+            counters = self.counters[provider]
+            counters[idx] = _saturate(counters[idx] + (1 if taken else -1),
+                                      -4, 3)
+
+        if predicted_taken != taken:
+            self._allocate(indices, tags, provider, taken)
+
+        self.n_received += 1
+        if self.n_received % self.RESET_PERIOD == 0:
+            for useful in self.useful:
+                for idx in range(self.n_entries):
+                    useful[idx] >>= 1
+
+        self.global_history.received(taken)
+
+    def overridden(self, taken):
+        self.global_history.overridden(taken)
+
+    def flush(self):
+        self.global_history.flush()
+
+    def _hash(self, addr, history):
+        """Return the index and tag of addr in each tagged table.
+
+        Hashes are cached as a branch is usually received with the history
+        it was predicted with, and loops repeat the same histories.
+        """
+        key = (addr, history)
+        hashes = self._hashes.get(key)
+        if hashes is not None:
+            return hashes
+        if len(self._hashes) >= self.HASH_CACHE_SIZE:
+            self._hashes.clear()
+        indices = []
+        tags = []
+        for length in self.history_lengths:
+            index_fold = _fold(history, length, self.n_index_bits)
+            tag_fold = _fold(history, length, self.n_tag_bits)
+            tag_fold ^= _fold(history, length, self.n_tag_bits - 1) << 1
+            indices.append((addr ^ (addr >> self.n_index_bits) ^ index_fold)
+                           % self.n_entries)
+            # Tag 0 marks an entry that has never been allocated.
+            tags.append(1 + ((addr ^ tag_fold) & self.tag_mask))
+        hashes = self._hashes[key] = (indices, tags)
+        return hashes
+
+    def _lookup(self, addr, history, indices=None, tags=None):
+        """Return (provider, alternate, taken, alternate_taken).
+
+        provider and alternate are the tagged tables of the longest and
+        second longest matching histories, or None.
+        """
+        if indices is None:
+            (indices, tags) = self._hash(addr, history)
+        provider = None
+        alternate = None
+        for table in range(self.n_tables - 1, -1, -1):
+            if self.tags[table][indices[table]] == tags[table]:
+                if provider is None:
+                    provider = table
+                else:
+                    alternate = table
+                    break
+
+        base_taken = self.base_table[addr % self.n_base_entries] >= 2
+        if alternate is None:
+            alternate_taken = base_taken
+        else:
+            alternate_taken = self.counters[alternate][indices[alternate]] >= 0
+        if provider is None:
+            return provider, alternate, base_taken, base_taken
+        taken = self.counters[provider][indices[provider]] >= 0
+        return provider, alternate, taken, alternate_taken
+
+    def _allocate(self, indices, tags, provider, taken):
+        """Allocate an entry in a longer history table than provider."""
+        start = 0 if provider is None else provider + 1
+        for table in range(start, self.n_tables):
+            idx = indices[table]
+            if self.useful[table][idx] == 0:
+                self.tags[table][idx] = tags[table]
+                self.counters[table][idx] = 0 if taken else -1
+                return
+        for table in range(start, self.n_tables):
+            self.useful[table][indices[table]] -= 1
+
+def geometric_lengths(n, minimum, maximum):
+    """Return n integer lengths growing geometrically from minimum to maximum."""
+    if n == 1:
+        return [maximum]
+    ratio = (maximum / minimum) ** (1 / (n - 1))
+    return [int(round(minimum * ratio**i)) for i in range(n)]
+
+def _fold(history, length, n_bits):
+    """Return the most recent length bits of history XOR folded to n_bits."""
+    history &= (1 << length) - 1
+    mask = (1 << n_bits) - 1
+    folded = 0
+    while history:
+        folded ^= history & mask
+        history >>= n_bits
+    return folded
+
+def _saturate(value, minimum, maximum):
+    return max(minimum, min(maximum, value))
@@ -0,0 +1,80 @@
+from procsim.branch.branch_info import BranchInfo
+from procsim.branch.predictor import Predictor
+
+class Tournament(Predictor):
+    """A tournament Predictor choosing between a local and a global Predictor.
+
+    Both components predict every branch. A chooser table of saturating
+    counters, indexed by branch address, selects which prediction is used:
+    counters at or above 2**(n_prediction_bits - 1) select the global
+    component. Counters are initialized to weakly select the local component.
+    When the components disagree about a received branch, its chooser counter
+    moves towards the one that was correct. The component predictions are
+    looked up again when the branch is received. The component that was not
+    followed is told the fetched direction, see Predictor.overridden.
+
+    Args:
+        local_predictor: BranchHistoryTable indexed by branch address.
+        global_predictor: GShare indexed by global history.
+        n_entries: Size of the chooser table.
+        n_prediction_bits: Number of bits to use for the chooser counters.
+
+    Attributes:
+        chooser_table: {entry: counter} dict holding the chooser counters
+            that have been updated. Other entries weakly select the local
+            component.
+    """
+
+    def __init__(self, local_predictor, global_predictor, n_entries,
+                 n_prediction_bits):
+        super().__init__()
+        self.local_predictor = local_predictor
+        self.global_predictor = global_predictor
+        self.n_entries = n_entries
+        self.n_prediction_bits = n_prediction_bits
+        self.threshold = 2**(n_prediction_bits - 1)
+        self.initial_counter = self.threshold - 1
+        self.chooser_table = {}
+
+    def predict(self, program_counter, instruction):
+        local_info = self.local_predictor.predict(program_counter, instruction)
+        global_info = self.global_predictor.predict(program_counter, instruction)
+        if self._counter(program_counter) >= self.threshold:
+            taken = global_info.taken
+            if local_info.taken != taken:
+                self.local_predictor.overridden(taken)
+        else:
+            taken = local_info.taken
+            if global_info.taken != taken:
+                self.global_predictor.overridden(taken)
+        return BranchInfo(taken,
+                          local_info.taken_addr,
+                          local_info.not_taken_addr,
+                          program_counter)
+
+    def receive(self, addr, taken):
+        local_correct = self.local_predictor.taken(addr) == taken
+        global_correct = self.global_predictor.taken(addr) == taken
+        if local_correct != global_correct:
+            counter = self._counter(addr)
+            if global_correct:
+                counter += 1
+            else:
+                counter -= 1
+            # Saturating counter.
+            counter = max(0, min(2**self.n_prediction_bits - 1, counter))
+            self.chooser_table[addr % self.n_entries] = counter
+        self.local_predictor.receive(addr, taken)
+        self.global_predictor.receive(addr, taken)
+
+    def overridden(self, taken):
+        self.local_predictor.overridden(taken)
+        self.global_predictor.overridden(taken)
+
+    def flush(self):
+        self.local_predictor.flush()
+        self.global_predictor.flush()
+
+    def _counter(self, addr):
+        return self.chooser_table.get(addr % self.n_entries,
+                                      self.initial_counter)
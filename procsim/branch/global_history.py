@@ -0,0 +1,51 @@
+class GlobalHistory:
+    """Outcomes of the most recent conditional branches.
+
+    The speculative history includes the predicted outcomes of branches that
+    have been predicted but not yet received, so a branch fetched behind
+    others still sees their predicted outcomes. Received branches update the
+    committed history, which flush restores when in-flight branches are
+    discarded. Branches are received in program order after all older
+    branches, so the committed history when a branch is received is the
+    history it was predicted with.
+
+    Args:
+        n_bits: Number of outcomes kept.
+
+    Attributes:
+        speculative: Outcomes of all predicted branches, most recent outcome
+            in bit 0.
+        committed: Outcomes of all received branches.
+        n_in_flight: Number of predicted branches not yet received.
+    """
+
+    def __init__(self, n_bits):
+        self.n_bits = n_bits
+        self.mask = 2**n_bits - 1
+        self.speculative = 0
+        self.committed = 0
+        self.n_in_flight = 0
+
+    def predicted(self, taken):
+        """Shift the predicted outcome of a branch into the speculative history."""
+        self.speculative = ((self.speculative << 1) | taken) & self.mask
+        self.n_in_flight += 1
+
+    def overridden(self, taken):
+        """Replace the most recent predicted outcome with taken."""
+        if self.n_in_flight > 0:
+            self.speculative = (self.speculative & ~1) | taken
+
+    def received(self, taken):
+        """Shift the actual outcome of a branch into the committed history."""
+        self.committed = ((self.committed << 1) | taken) & self.mask
+        self.n_in_flight = max(0, self.n_in_flight - 1)
+        if self.n_in_flight == 0:
+            # Also covers outcomes received without a prediction, such as
+            # from an Emulator.
+            self.speculative = self.committed
+
+    def flush(self):
+        """Discard the outcomes of branches not yet received."""
+        self.speculative = self.committed
+        self.n_in_flight = 0
@@ -6,8 +6,13 @@ class Predictor(abc.ABC):
     """A Predictor predicts the result of a conditional branch instruction."""
 
     @abc.abstractmethod
-    def predict(self, program_counter, instruction_str):
-        """Return BranchInfo about the branch."""
+    def predict(self, program_counter, instruction):
+        """Return BranchInfo about the branch.
+
+        Args:
+            program_counter: Address of the conditional branch.
+            instruction: Blth Instruction or instruction string.
+        """
         pass
 
     @abc.abstractmethod
@@ -15,9 +20,29 @@ class Predictor(abc.ABC):
         """Receive information whether the branch at addr was taken or not."""
         pass
 
-    def _parse_conditional(self, instruction_str):
-        """Return a Blth instruction."""
-        fields = instruction_str.split(' ')
+    def overridden(self, taken):
+        """Receive the direction fetched for the most recent prediction.
+
+        Called by a Predictor combining this one when it predicted the
+        opposite direction to this one, so that speculative state follows
+        the fetched path. No flush repairs the state if the override was
+        correct.
+        """
+        pass
+
+    def flush(self):
+        """Discard speculative state of branches predicted but not received.
+
+        Called when the pipeline is flushed after a misprediction, once the
+        mispredicted branch has been received.
+        """
+        pass
+
+    def _parse_conditional(self, instruction):
+        """Return a Blth instruction, parsing it if given a string."""
+        if isinstance(instruction, Blth):
+            return instruction
+        fields = instruction.split(' ')
         if fields[0] != 'blth':
-            raise ValueError('unable to parse %r' % instruction_str)
+            raise ValueError('unable to parse %r' % instruction)
         return Blth(fields[1], fields[2], int(fields[3]))
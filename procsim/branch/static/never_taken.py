@@ -7,6 +7,6 @@ class NeverTaken(Static):
     def __init__(self):
         super().__init__()
 
-    def predict(self, program_counter, instruction_str):
-        blth = self._parse_conditional(instruction_str)
+    def predict(self, program_counter, instruction):
+        blth = self._parse_conditional(instruction)
         return BranchInfo(False, blth.imm, program_counter + 1, program_counter)
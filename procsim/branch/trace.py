@@ -0,0 +1,170 @@
+import numpy as np
+
+from procsim.front_end.program import compile_program
+from procsim.functional.emulator import Emulator
+
+class BranchTrace:
+    """The committed stream of conditional branches of a program run.
+
+    A trace is recorded once with a functional run and can then be replayed
+    against any Predictor without simulating the pipeline. Replay updates
+    the Predictor as soon as each branch is predicted, whereas the
+    ReorderBuffer updates it at commit, so a few branches in flight may be
+    predicted differently by the Simulator.
+
+    Args:
+        program: Tuple of front-end Instructions, used to pass each branch
+            Instruction to Predictor.predict.
+        addrs: Array of branch addresses in commit order.
+        taken: Boolean array of branch outcomes.
+        n_instructions: Number of instructions committed by the run,
+            including the branches.
+
+    Attributes:
+        RESULT_FIELDS: Keys of the result dicts returned by evaluate.
+    """
+
+    RESULT_FIELDS = ('n_branches', 'n_incorrect', 'accuracy', 'mpki')
+
+    def __init__(self, program, addrs, taken, n_instructions):
+        self.program = compile_program(program)
+        self.addrs = np.asarray(addrs, dtype=np.int64)
+        self.taken = np.asarray(taken, dtype=bool)
+        self.n_instructions = n_instructions
+
+    def __len__(self):
+        """Return the number of branches in the trace."""
+        return len(self.addrs)
+
+    @classmethod
+    def record(cls, program, register_file, memory=None,
+               max_instructions=None):
+        """Return the BranchTrace of a functional run of program.
+
+        The run modifies register_file and memory.
+
+        Args:
+            max_instructions: Stop once this many instructions have been
+                committed. (default None, run until halt)
+        """
+        recorder = _Recorder()
+        emulator = Emulator(program, register_file, memory,
+                            branch_predictor=recorder)
+        emulator.run(max_instructions=max_instructions)
+        return cls(emulator.program, recorder.addrs, recorder.taken,
+                   emulator.n_committed)
+
+    @classmethod
+    def load(cls, path):
+        """Return a BranchTrace saved with save."""
+        with np.load(path) as data:
+            program = [str(instruction) for instruction in data['program']]
+            return cls(program, data['addrs'], data['taken'],
+                       int(data['n_instructions']))
+
+    def save(self, path):
+        """Write the trace and its program to a compressed .npz file."""
+        np.savez_compressed(path,
+                            program=np.array([str(ins) for ins in self.program]),
+                            addrs=self.addrs,
+                            taken=self.taken,
+                            n_instructions=self.n_instructions)
+
+    def evaluate(self, predictor):
+        """Replay the trace against a Predictor.
+
+        Returns:
+            Dict with RESULT_FIELDS keys.
+        """
+        program = self.program
+        predict = predictor.predict
+        receive = predictor.receive
+        n_incorrect = 0
+        for (addr, taken) in zip(self.addrs.tolist(), self.taken.tolist()):
+            if predict(addr, program[addr]).taken != taken:
+                n_incorrect += 1
+            receive(addr, taken)
+        return self._result(n_incorrect)
+
+    def evaluate_branch_history_tables(self, geometries):
+        """Replay the trace against several BranchHistoryTables.
+
+        Each table is evaluated over the whole trace with NumPy, without a
+        Python loop over branches, and gives the same results as evaluate.
+
+        Args:
+            geometries: List of (n_entries, n_prediction_bits) tuples.
+
+        Returns:
+            List of dicts with RESULT_FIELDS keys, in geometries order.
+        """
+        return [self._result(self._n_incorrect_bht(n_entries, n_bits))
+                for (n_entries, n_bits) in geometries]
+
+    def _n_incorrect_bht(self, n_entries, n_bits):
+        """Return the number of branches a BranchHistoryTable mispredicts.
+
+        Updating a saturating counter is a clamped add,
+        x -> min(max(x + add, low), high), and applying one clamped add after
+        another is again a clamped add. The value of an entry before each
+        branch is therefore found with a prefix scan of the clamped adds of
+        the earlier branches using that entry.
+        """
+        n_branches = len(self)
+        if n_branches == 0:
+            return 0
+        threshold = 2 ** (n_bits - 1)
+        maximum = 2 ** n_bits - 1
+
+        # Group the branches by table entry, keeping commit order in a group.
+        index = self.addrs % n_entries
+        order = np.argsort(index, kind='mergesort')
+        index = index[order]
+        taken = self.taken[order]
+        positions = np.arange(n_branches)
+        first = np.ones(n_branches, dtype=bool)
+        first[1:] = index[1:] != index[:-1]
+        group_start = np.maximum.accumulate(np.where(first, positions, 0))
+
+        # Inclusive scan of the clamped adds within each group, doubling the
+        # span combined each step.
+        add = np.where(taken, 1, -1).astype(np.int64)
+        low = np.zeros(n_branches, dtype=np.int64)
+        high = np.full(n_branches, maximum, dtype=np.int64)
+        span = 1
+        longest = np.bincount(group_start).max()
+        while span < longest:
+            later = positions[span:][positions[:-span] >= group_start[span:]]
+            earlier = later - span
+            (add_1, low_1, high_1) = (add[earlier], low[earlier], high[earlier])
+            (add_2, low_2, high_2) = (add[later], low[later], high[later])
+            add[later] = add_1 + add_2
+            low[later] = np.maximum(low_1 + add_2, low_2)
+            high[later] = np.minimum(np.maximum(high_1 + add_2, low_2), high_2)
+            span *= 2
+
+        # Counters start weakly taken.
+        counter = np.full(n_branches, threshold, dtype=np.int64)
+        previous = positions[~first] - 1
+        counter[~first] = np.minimum(
+            np.maximum(threshold + add[previous], low[previous]),
+            high[previous])
+        return int(np.count_nonzero((counter >= threshold) != taken))
+
+    def _result(self, n_incorrect):
+        n_branches = len(self)
+        return {'n_branches': n_branches,
+                'n_incorrect': n_incorrect,
+                'accuracy': 1 - n_incorrect / max(1, n_branches),
+                'mpki': 1000 * n_incorrect / max(1, self.n_instructions)}
+
+class _Recorder:
+    """Receives branch outcomes from an Emulator in place of a Predictor."""
+
+    def __init__(self):
+        self.addrs = []
+        self.taken = []
+
+    def receive(self, addr, taken):
+        self.addrs.append(addr)
+        self.taken.append(taken)
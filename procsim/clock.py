@@ -1,18 +1,25 @@
-from procsim.clocked import Clocked
+from procsim.profiler import ProfiledComponent
 
 class Clock:
     """Simple processor clock to coordinate Clocked component execution.
 
+    Args:
+        profiler: If not None, a Profiler that records the time spent in each
+            registered component's operate and trigger methods. (default None)
+
     Attributes:
         n_ticks: Total number of tick calls.
     """
 
-    def __init__(self):
+    def __init__(self, profiler=None):
         self.components = []
         self.n_ticks = 0
+        self.profiler = profiler
 
     def register(self, component):
         """Register a Clocked component with the Clock."""
+        if self.profiler is not None:
+            component = ProfiledComponent(component, self.profiler)
         self.components.append(component)
 
     def operate(self):
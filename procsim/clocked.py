@@ -26,6 +26,30 @@ class Clocked(abc.ABC):
         """
         pass
 
+    def idle(self):
+        """Return True if operate and trigger would not change any state.
+
+        An ActivityClock skips both calls for idle components. Components that
+        cannot cheaply determine this should return False. (default False)
+        """
+        return False
+
+    def idle_cycles(self):
+        """Return the number of upcoming cycles in which operate is a no-op.
+
+        During these cycles trigger may only count down internal timers, see
+        skip. Return math.inf if the component will not act again until
+        another component changes its state. (default 0)
+        """
+        return 0
+
+    def skip(self, n_cycles):
+        """Advance internal timers as if tick had been called n_cycles times.
+
+        Only called when n_cycles <= idle_cycles().
+        """
+        pass
+
     def tick(self):
         """Operate and trigger the clocked component, in that order."""
         self.operate()
@@ -1,10 +1,11 @@
 from copy import copy
+import math
 
 from procsim.pipeline_stage import PipelineStage
-import procsim.front_end.instructions as ins
+from procsim.front_end.program import parse
 
 class Decode(PipelineStage):
-    """Decode decodes an instruction string to an instruction.
+    """Decode decodes a fetched instruction for the ReorderBuffer.
 
     Args:
         reorder_buffer: ReorderBuffer to feed results to.
@@ -32,11 +33,12 @@ class Decode(PipelineStage):
         self.future_timer = 0
 
     def feed(self, instruction):
-        """Feed the Decode stage an Instruction string to decode.
+        """Feed the Decode stage an Instruction to decode.
 
         Args:
-            instruction: A dictionary containing at least the instruction_str
-            key with value being a string to decode.
+            instruction: A dictionary containing either an instruction key
+            with a front-end Instruction or an instruction_str key with a
+            string to decode.
         """
         assert len(self.future_queue) < self.CAPACITY,\
             'Decode fed when full'
@@ -57,13 +59,13 @@ class Decode(PipelineStage):
         if self.current_timer > 0:
             return
         n_issue = 0
-        for instruct_str in self.current_queue:
+        for food in self.current_queue:
             if n_issue == self.width:
                 return
-            instruct = _decode(instruct_str)
+            instruct = _decode(food)
             if self.reorder_buffer.full(instruct):
                 return
-            self.reorder_buffer.feed(instruct)
+            self.reorder_buffer.feed(instruct, food.get('branch_info'))
             n_issue += 1
 
             del self.future_queue[0]
@@ -76,6 +78,27 @@ class Decode(PipelineStage):
         self.future_queue = copy(self.current_queue)
         self.future_timer = max(0, self.future_timer - 1)
 
+    def idle(self):
+        """Return True if Decode holds no instructions."""
+        return (not self.current_queue and not self.future_queue
+                and self.current_timer == 0 and self.future_timer == 0)
+
+    def idle_cycles(self):
+        """Return the number of cycles before an instruction may be issued."""
+        if self.future_queue != self.current_queue:
+            return 0
+        if not self.current_queue:
+            return math.inf
+        if self.current_timer > 0:
+            return self.current_timer
+        if self.reorder_buffer.full(_decode(self.current_queue[0])):
+            return math.inf
+        return 0
+
+    def skip(self, n_cycles):
+        self.current_timer -= n_cycles
+        self.future_timer = max(0, self.current_timer - 1)
+
     def flush(self):
         self.current_queue = []
         self.current_timer = 0
@@ -86,31 +109,20 @@ class Decode(PipelineStage):
         self.reorder_buffer.flush()
 
 def _decode(instruction):
-    """Return the instruction string decoded into an Instruction.
+    """Return the fetched instruction as a front-end Instruction.
+
+    Fetched Instructions are shared with the compiled program and are
+    returned unmodified. The BranchInfo of a conditional branch stays in the
+    instruction dictionary and is fed to the ReorderBuffer alongside it.
 
     Args:
-        instruction: Dictionary containing instruction_str to decode.
+        instruction: Dictionary containing an instruction or instruction_str
+            key.
 
     Returns:
-        Instruction if instruction_str is valid.
+        Instruction if valid.
     """
-    # Very naive parser.
-    gen_ins = {'add': lambda args: ins.Add(args[0], args[1], args[2]),
-               'addi': lambda args: ins.AddI(args[0], args[1], int(args[2])),
-               'sub': lambda args: ins.Sub(args[0], args[1], args[2]),
-               'subi': lambda args: ins.SubI(args[0], args[1], int(args[2])),
-               'mul': lambda args: ins.Mul(args[0], args[1], args[2]),
-               'muli': lambda args: ins.MulI(args[0], args[1], int(args[2])),
-               'ldr': lambda args: ins.Load(args[0], args[1]),
-               'str': lambda args: ins.Store(args[0], args[1]),
-               'j': lambda args: ins.Jump(int(args[0])),
-               'blth': lambda args: ins.Blth(args[0], args[1], int(args[2])),
-               'halt': lambda args: ins.Halt()}
-    fields = instruction['instruction_str'].split(' ')
-    try:
-        front_end_ins = gen_ins[fields[0]](fields[1:])
-        if fields[0] == 'blth':
-            front_end_ins.branch_info = instruction['branch_info']
-        return front_end_ins
-    except:
-        raise ValueError('unknown instruction %r' % instruction)
+    front_end_ins = instruction.get('instruction')
+    if front_end_ins is None:
+        front_end_ins = parse(instruction['instruction_str'])
+    return front_end_ins
@@ -1,5 +1,9 @@
+import math
+
 from procsim.clocked import Clocked
-from procsim.branch.branch_info import BranchInfo
+from procsim.front_end.instructions import Blth
+from procsim.front_end.instructions import Jump
+from procsim.front_end.program import compile_program
 
 class Fetch(Clocked):
     """Fetch instruction at address in program counter and feed to Decode stage.
@@ -11,8 +15,9 @@ class Fetch(Clocked):
 
     Args:
         register_file: RegisterFile to read program counter value from.
-        program: List of string Instructions.
-        decode: Decode unit to feed Fetched Instruction strings to.
+        program: List of string Instructions or front-end Instructions. Strings
+            are compiled once on construction.
+        decode: Decode unit to feed Fetched Instructions to.
         branch_predictor: Branch Predictor determines whether to speculative
             take a branch or not.
         width: Maximum number of instructions to fetch and per cycle. Note that
@@ -22,35 +27,37 @@ class Fetch(Clocked):
 
     def __init__(self, register_file, program, decode, branch_predictor, width=4):
         super().__init__()
-        self.program = program
+        self.program = compile_program(program)
         self.reg_file = register_file
         self.decode = decode
         self.branch_predictor = branch_predictor
         self.width = width
 
     def _fetch_next(self):
-        """Return next Instruction string and increment pc if possible.
+        """Return next Instruction and increment pc if possible.
 
-        Returns: Dictionary containing an instruction_str key or None if no
+        Returns: Dictionary containing an instruction key or None if no
             instruction can be fetched.
         """
-        program_counter = self.reg_file['pc']
+        registers = self.reg_file.values
+        pc = self.reg_file.PC
+        program_counter = registers[pc]
         if not self.decode.full() and program_counter < len(self.program):
             ins = self.program[program_counter]
-            food = {'instruction_str': ins}
+            food = {'instruction': ins}
             # Branch detection and handling.
-            if ins[0] == 'j':
-                self.reg_file['pc'] = self._parse_unconditional_address(ins)
+            if isinstance(ins, Jump):
+                registers[pc] = ins.imm
                 return None
-            elif ins[:4] == 'blth':
+            elif isinstance(ins, Blth):
                 branch_info = self.branch_predictor.predict(program_counter, ins)
                 if branch_info.taken:
-                    self.reg_file['pc'] = branch_info.taken_addr
+                    registers[pc] = branch_info.taken_addr
                 else:
-                    self.reg_file['pc'] = branch_info.not_taken_addr
+                    registers[pc] = branch_info.not_taken_addr
                 food['branch_info'] = branch_info
             else:
-                self.reg_file['pc'] += 1
+                registers[pc] = program_counter + 1
             return food
 
     def operate(self):
@@ -61,13 +68,17 @@ class Fetch(Clocked):
                 return
             self.decode.feed(food)
 
-    def _parse_unconditional_address(self, uncond_branch):
-        """Return target address of unconditional branch."""
-        fields = uncond_branch.split(' ')
-        return int(fields[1])
-
     def trigger(self):
         pass
 
+    def idle(self):
+        """Return True if no instruction can be fetched."""
+        return (self.decode.full()
+                or self.reg_file.values[self.reg_file.PC] >= len(self.program))
+
+    def idle_cycles(self):
+        return math.inf if self.idle() else 0
+
     def flush(self):
+        self.branch_predictor.flush()
         self.decode.flush()
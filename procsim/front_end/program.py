@@ -0,0 +1,127 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+import procsim.front_end.instructions as ins
+
+# Instruction constructor and operand conversion functions for each opcode.
+OPCODES = {'add': (ins.Add, (str, str, str)),
+           'addi': (ins.AddI, (str, str, int)),
+           'sub': (ins.Sub, (str, str, str)),
+           'subi': (ins.SubI, (str, str, int)),
+           'mul': (ins.Mul, (str, str, str)),
+           'muli': (ins.MulI, (str, str, int)),
+           'ldr': (ins.Load, (str, str)),
+           'str': (ins.Store, (str, str)),
+           'j': (ins.Jump, (int,)),
+           'blth': (ins.Blth, (str, str, int)),
+           'halt': (ins.Halt, ())}
+
+# Version of the compiled program format. Increment it whenever the
+# front-end Instructions change so stale on-disk caches are not loaded.
+CACHE_VERSION = 1
+
+# Compiled programs keyed by the hash of their text.
+_cache = {}
+
+def parse(instruction_str):
+    """Return the instruction string parsed into a front-end Instruction.
+
+    Args:
+        instruction_str: Instruction string such as 'addi r1 r1 1'.
+
+    Returns:
+        Front-end Instruction.
+
+    Raises:
+        ValueError: The opcode is unknown or the operands are invalid.
+    """
+    fields = instruction_str.split(' ')
+    try:
+        cls, converters = OPCODES[fields[0]]
+        if len(fields) - 1 != len(converters):
+            raise ValueError
+        return cls(*[convert(field)
+                     for (convert, field) in zip(converters, fields[1:])])
+    except (KeyError, ValueError):
+        raise ValueError('unknown instruction %r' % instruction_str) from None
+
+def program_hash(program):
+    """Return a hex digest identifying a list of instruction strings.
+
+    The digest covers CACHE_VERSION as well as the program text.
+    """
+    text = '\n'.join(str(instruction) for instruction in program)
+    text = 'procsim program v%d\n%s' % (CACHE_VERSION, text)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def compile_program(program, cache_dir=None):
+    """Return a program parsed into a tuple of front-end Instructions.
+
+    Compiled programs are cached in memory and, if cache_dir is given, pickled
+    to cache_dir so later runs skip parsing. A cache file that cannot be
+    loaded is ignored and rewritten. The returned Instructions are shared
+    between all users of the cache and must not be modified.
+
+    Args:
+        program: List of instruction strings. Programs that are already
+            compiled are returned as a tuple unchanged.
+        cache_dir: Directory for the on-disk cache or None to only cache in
+            memory. (default None)
+
+    Returns:
+        Tuple of front-end Instructions.
+
+    Raises:
+        ValueError: An instruction string is invalid.
+    """
+    if all(not isinstance(instruction, str) for instruction in program):
+        return tuple(program)
+
+    key = program_hash(program)
+    compiled = _cache.get(key)
+    if compiled is not None:
+        return compiled
+
+    path = None
+    if cache_dir is not None:
+        path = os.path.join(cache_dir, key + '.pickle')
+        try:
+            with open(path, 'rb') as f:
+                compiled = pickle.load(f)
+        except Exception:
+            # Any unreadable, truncated or stale file is a cache miss.
+            compiled = None
+        if not isinstance(compiled, tuple):
+            compiled = None
+
+    if compiled is None:
+        compiled = []
+        for (addr, instruction) in enumerate(program):
+            if not isinstance(instruction, str):
+                compiled.append(instruction)
+                continue
+            try:
+                compiled.append(parse(instruction))
+            except ValueError as err:
+                raise ValueError('address %d: %s' % (addr, err)) from None
+        compiled = tuple(compiled)
+        if path is not None:
+            _save(path, compiled)
+
+    _cache[key] = compiled
+    return compiled
+
+def _save(path, compiled):
+    """Atomically pickle a compiled program to path."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(compiled, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,78 @@
+import numpy as np
+
+from procsim.functional.emulator import Emulator
+
+class BasicBlockProfiler:
+    """Records basic block vectors (BBVs) of a program's execution.
+
+    The program runs on an Emulator and is divided into intervals of a fixed
+    number of committed instructions. The BBV of an interval counts the
+    instructions committed in each basic block during that interval, so
+    intervals executing the same code have similar vectors regardless of
+    the values computed.
+
+    Args:
+        program: List of instruction strings or compiled front-end
+            Instructions.
+        register_file: RegisterFile holding the initial Register values.
+        memory: Memory holding the initial values, or None if the program
+            does not access Memory. (default None)
+        interval: Number of committed instructions per interval.
+            (default 100000)
+
+    Attributes:
+        emulator: Emulator executing the program.
+        intervals: List of {start_address: n_committed} dicts, one per
+            interval.
+    """
+
+    def __init__(self, program, register_file, memory=None, interval=100000):
+        if interval <= 0:
+            raise ValueError('interval must be > 0')
+        self.interval = interval
+        self.emulator = Emulator(program, register_file, memory)
+        self.intervals = []
+
+    def run(self, max_instructions=None):
+        """Profile until the program halts or a limit is reached.
+
+        A final interval shorter than interval is kept.
+
+        Args:
+            max_instructions: Stop once this many instructions have been
+                committed in total. (default None, unlimited)
+
+        Returns:
+            The BBV matrix, see vectors.
+        """
+        emulator = self.emulator
+        while not emulator.halted:
+            n_interval = self.interval
+            if max_instructions is not None:
+                n_interval = min(n_interval,
+                                 max_instructions - emulator.n_committed)
+                if n_interval <= 0:
+                    break
+            emulator.block_counts = {}
+            emulator.run(max_instructions=n_interval)
+            if not emulator.block_counts:
+                break
+            self.intervals.append(emulator.block_counts)
+        emulator.block_counts = None
+        return self.vectors()
+
+    def block_starts(self):
+        """Return the sorted start addresses of all executed basic blocks."""
+        return sorted(set().union(*self.intervals))
+
+    def vectors(self):
+        """Return an (n_intervals, n_blocks) array of instruction counts.
+
+        Columns are ordered as block_starts.
+        """
+        columns = {start: i for (i, start) in enumerate(self.block_starts())}
+        vectors = np.zeros((len(self.intervals), len(columns)))
+        for (row, counts) in enumerate(self.intervals):
+            for (start, n_committed) in counts.items():
+                vectors[row, columns[start]] = n_committed
+        return vectors
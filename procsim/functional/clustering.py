@@ -0,0 +1,130 @@
+import numpy as np
+
+def normalize(vectors):
+    """Return vectors scaled so each row sums to 1.
+
+    Rows that sum to 0 are left as zeros.
+    """
+    vectors = np.asarray(vectors, dtype=float)
+    totals = vectors.sum(axis=1, keepdims=True)
+    totals[totals == 0] = 1
+    return vectors / totals
+
+def random_projection(vectors, n_dims=15, seed=None):
+    """Return vectors projected onto n_dims random dimensions.
+
+    Distances between rows are approximately preserved. Vectors with at most
+    n_dims columns are returned unchanged.
+    """
+    vectors = np.asarray(vectors, dtype=float)
+    if vectors.shape[1] <= n_dims:
+        return vectors
+    random = np.random.RandomState(seed)
+    projection = random.uniform(-1, 1, size=(vectors.shape[1], n_dims))
+    return vectors.dot(projection)
+
+def squared_distances(points, centroids):
+    """Return an (n_points, n_centroids) array of squared distances."""
+    differences = points[:, np.newaxis, :] - centroids[np.newaxis, :, :]
+    return (differences ** 2).sum(axis=2)
+
+def kmeans(points, k, seed=None, max_iterations=100):
+    """Cluster points into k clusters using k-means with k-means++ seeding.
+
+    Args:
+        points: (n_points, n_dims) array.
+        k: Number of clusters, at most n_points.
+        seed: Random seed. (default None)
+        max_iterations: Maximum number of Lloyd iterations. (default 100)
+
+    Returns:
+        (centroids, labels) where centroids is a (k, n_dims) array and labels
+        gives the cluster index of each point.
+    """
+    points = np.asarray(points, dtype=float)
+    n_points = len(points)
+    if not 0 < k <= n_points:
+        raise ValueError('k must be in 1..%d, not %r' % (n_points, k))
+    random = np.random.RandomState(seed)
+
+    centroids = [points[random.randint(n_points)]]
+    for _ in range(1, k):
+        nearest = squared_distances(points, np.array(centroids)).min(axis=1)
+        total = nearest.sum()
+        if total == 0:
+            index = random.randint(n_points)
+        else:
+            index = random.choice(n_points, p=nearest / total)
+        centroids.append(points[index])
+    centroids = np.array(centroids)
+
+    labels = None
+    for _ in range(max_iterations):
+        distances = squared_distances(points, centroids)
+        new_labels = distances.argmin(axis=1)
+        if labels is not None and (new_labels == labels).all():
+            break
+        labels = new_labels
+        for cluster in range(k):
+            members = points[labels == cluster]
+            if len(members):
+                centroids[cluster] = members.mean(axis=0)
+            else:
+                # Move an empty cluster to the point furthest from its own.
+                furthest = distances[np.arange(n_points), labels].argmax()
+                centroids[cluster] = points[furthest]
+    return centroids, labels
+
+def squared_error(points, centroids, labels):
+    """Return the total squared distance of points to their centroids."""
+    return float(((points - centroids[labels]) ** 2).sum())
+
+def select_intervals(vectors, max_k=10, n_dims=15, seed=0, threshold=0.9):
+    """Return representative intervals and their weights.
+
+    Intervals with similar basic block vectors (BBVs) execute the same code
+    and so tend to have similar performance, so simulating one interval per
+    cluster, weighted by the cluster size, estimates whole-program
+    performance.
+
+    The BBVs are normalized, randomly projected and clustered for each k up
+    to max_k. The smallest k that explains threshold of the squared error of
+    a single cluster is chosen. Each cluster is represented by the interval
+    closest to its centroid.
+
+    Args:
+        vectors: (n_intervals, n_blocks) array of BBVs, see
+            BasicBlockProfiler.vectors.
+        max_k: Maximum number of clusters. (default 10)
+        n_dims: Number of dimensions to project onto. (default 15)
+        seed: Random seed of the projection and clustering. (default 0)
+        threshold: Fraction of the squared error the chosen k must
+            explain. (default 0.9)
+
+    Returns:
+        List of (interval, weight) tuples ordered by interval. Weights are
+        the fraction of intervals in each cluster and sum to 1.
+    """
+    points = random_projection(normalize(vectors), n_dims, seed)
+    n_points = len(points)
+    if n_points == 0:
+        return []
+
+    total_error = None
+    for k in range(1, min(max_k, n_points) + 1):
+        centroids, labels = kmeans(points, k, seed)
+        error = squared_error(points, centroids, labels)
+        if total_error is None:
+            total_error = error
+        if error <= (1 - threshold) * total_error:
+            break
+
+    distances = squared_distances(points, centroids)
+    selected = []
+    for cluster in range(len(centroids)):
+        members = np.flatnonzero(labels == cluster)
+        if len(members) == 0:
+            continue
+        representative = members[distances[members, cluster].argmin()]
+        selected.append((int(representative), len(members) / n_points))
+    return sorted(selected)
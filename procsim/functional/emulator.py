@@ -0,0 +1,393 @@
+import functools
+import sys
+import time
+
+from procsim.front_end.program import compile_program
+import procsim.front_end.instructions as ins
+
+# Opcodes of decoded instructions.
+ADD, ADDI, SUB, SUBI, MUL, MULI, LOAD, STORE, JUMP, BLTH, HALT = range(11)
+# Kind of a compiled block ending in a branch back to its own start.
+LOOP = -1
+
+class Emulator:
+    """Executes a program's instructions in order with no pipeline model.
+
+    The Emulator produces the same architectural state (general purpose
+    Registers and Memory) as a Simulator running the same program, so it can
+    be used both to run long programs quickly and as a reference for the
+    Simulator's final state. The pc is left at the address of the halt
+    instruction, whereas a Simulator's Fetch unit runs ahead of it.
+
+    Args:
+        program: List of instruction strings or compiled front-end
+            Instructions.
+        register_file: RegisterFile holding the initial Register values,
+            including the pc to start from.
+        memory: Memory holding the initial values, or None if the program
+            does not access Memory. (default None)
+        branch_predictor: If not None, a Predictor that receives the outcome
+            of every conditional branch, keeping it warm for a later detailed
+            simulation. (default None)
+        compile_blocks: If True, translate each basic block into a Python
+            function the first time it is executed and run blocks rather
+            than single instructions. (default True)
+
+    Attributes:
+        code: Program decoded into (opcode, operand, ...) tuples with Register
+            operands resolved to RegisterFile indices.
+        halted: True once the program has executed a halt instruction.
+        n_committed: Number of instructions executed, not counting jumps and
+            halt. This matches ReorderBuffer.n_committed.
+        n_jumps: Number of unconditional jumps executed.
+        n_branches: Number of conditional branches executed.
+        n_taken: Number of conditional branches taken.
+        host_time: Host seconds spent in run.
+        block_counts: If not None, a {start_address: n_committed} dict that
+            run adds the instructions committed in each basic block to. A
+            basic block ends at a branch, a jump or the end of a run.
+            (default None)
+        blocks: {start_address: block} dict of compiled basic blocks. See
+            compile_block.
+    """
+
+    def __init__(self, program, register_file, memory=None,
+                 branch_predictor=None, compile_blocks=True):
+        self.program = compile_program(program)
+        self.register_file = register_file
+        self.memory = memory
+        self.branch_predictor = branch_predictor
+        self.compile_blocks = compile_blocks
+        self.code = [decode(instruction, register_file)
+                     for instruction in self.program]
+        self.halted = False
+        self.n_committed = 0
+        self.n_jumps = 0
+        self.n_branches = 0
+        self.n_taken = 0
+        self.host_time = 0.0
+        self.block_counts = None
+        self.blocks = {}
+        # Shared with compiled blocks, see compile_block.
+        self._state = [0, 0, False]
+        self._hits = [0] * len(self.code)
+        self._table = [functools.partial(self._compile_and_run, pc)
+                       for pc in range(len(self.code))]
+
+    @classmethod
+    def from_module(cls, module):
+        """Return an Emulator for a program module.
+
+        Args:
+            module: Module with PROGRAM, REGISTER_FILE and MEMORY attributes.
+        """
+        return cls(module.PROGRAM, module.REGISTER_FILE, module.MEMORY)
+
+    def run(self, max_instructions=None):
+        """Execute until halt, the end of the program or a limit is reached.
+
+        Args:
+            max_instructions: Stop once this many more instructions have been
+                committed. (default None, unlimited)
+
+        Returns:
+            True if the program has halted.
+        """
+        if self.halted:
+            return True
+        start_time = time.perf_counter()
+        if self.compile_blocks:
+            n_committed = self._run_blocks(max_instructions)
+            if max_instructions is not None:
+                max_instructions -= n_committed
+        if not self.halted:
+            self._interpret(max_instructions)
+        self.host_time += time.perf_counter() - start_time
+        return self.halted
+
+    def _run_blocks(self, max_instructions):
+        """Run compiled blocks until the program halts or a block would pass
+        the limit.
+
+        Returns:
+            Number of instructions committed.
+        """
+        n_code = len(self.code)
+        registers = self.register_file.values
+        PC = self.register_file.PC
+        state = self._state
+        if max_instructions is None:
+            state[0] = sys.maxsize
+        else:
+            state[0] = max_instructions
+        n_taken = state[1]
+        hits = self._hits
+        previous_hits = list(hits)
+        table = self._table
+
+        pc = registers[PC]
+        if 0 <= pc < n_code:
+            # Blocks return the next address, or its complement to stop.
+            while pc >= 0:
+                pc = table[pc](registers)
+            pc = ~pc
+        registers[PC] = pc
+        self.halted = state[2]
+
+        n_committed = 0
+        counts = self.block_counts
+        for (start, n_hits) in enumerate(hits):
+            n_hits -= previous_hits[start]
+            if not n_hits:
+                continue
+            _, n_block, ends_with = self.blocks[start]
+            n_committed += n_hits * n_block
+            if ends_with == JUMP:
+                self.n_jumps += n_hits
+            elif ends_with == BLTH or ends_with == LOOP:
+                self.n_branches += n_hits
+            if counts is not None and n_block:
+                counts[start] = counts.get(start, 0) + n_hits * n_block
+        self.n_committed += n_committed
+        self.n_taken += state[1] - n_taken
+        return n_committed
+
+    def _compile_and_run(self, start, registers):
+        """Compile the block at start, replacing its stub, and run it."""
+        block = self.blocks[start] = self.compile_block(start)
+        self._table[start] = block[0]
+        return block[0](registers)
+
+    def compile_block(self, start):
+        """Return the basic block starting at address start as a function.
+
+        The block runs up to and including the first branch, jump or halt,
+        or to the end of the program. A block ending in a branch back to its
+        own start is compiled as a loop. Blocks chain by returning the next
+        address and stop by returning its complement (~address) if the
+        program halts or leaves its end, or if running the block would pass
+        the instruction limit. The branch Predictor and Memory are bound when
+        the block is compiled.
+
+        Returns:
+            (function, n_committed, ends_with) tuple. function takes the
+            RegisterFile values. n_committed is the number of instructions
+            committed by one run (or loop iteration) of the block and
+            ends_with the opcode of the block's last instruction, LOOP, or
+            None if the block runs off the end of the program.
+        """
+        code = self.code
+        n_code = len(code)
+        train = self.branch_predictor is not None
+        body = []
+        n_committed = 0
+        ends_with = None
+        addr = start
+        while addr < n_code:
+            instruction = code[addr]
+            op = instruction[0]
+            if op in _BLOCK_OPERATORS:
+                operand = ('r[%d]' if op in _REGISTER_OPERATIONS else '%d')
+                body.append(('r[%d] = r[%d] %s ' + operand)
+                            % (instruction[1], instruction[2],
+                               _BLOCK_OPERATORS[op], instruction[3]))
+            elif op == LOAD:
+                body.append('r[%d] = memory[r[%d]]' % instruction[1:])
+            elif op == STORE:
+                body.append('memory[r[%d]] = r[%d]' % (instruction[2],
+                                                       instruction[1]))
+            else:
+                if op == BLTH:
+                    n_committed += 1
+                ends_with = LOOP if op == BLTH and instruction[3] == start else op
+                break
+            n_committed += 1
+            addr += 1
+
+        def goto(target):
+            if 0 <= target < n_code:
+                return 'return %d' % target
+            return 'return ~%d' % target
+
+        # state holds [instructions left before the limit, taken branches,
+        # halted]. hits counts runs of each block.
+        lines = []
+        if ends_with == LOOP:
+            lines.append('k = state[0] // %d' % n_committed)
+            lines.append('if not k:')
+            lines.append('    return ~%d' % start)
+            lines.append('n = 1')
+            lines.append('while True:')
+            lines.extend('    ' + line for line in body)
+            lines.append('    if r[%d] < r[%d]:' % instruction[1:3])
+            if train:
+                lines.append('        train(%d, True)' % addr)
+            lines.append('        if n < k:')
+            lines.append('            n += 1')
+            lines.append('            continue')
+            lines.append('        state[0] -= n * %d' % n_committed)
+            lines.append('        state[1] += n')
+            lines.append('        hits[%d] += n' % start)
+            lines.append('        return %d' % start)
+            if train:
+                lines.append('    train(%d, False)' % addr)
+            lines.append('    state[0] -= n * %d' % n_committed)
+            lines.append('    state[1] += n - 1')
+            lines.append('    hits[%d] += n' % start)
+            lines.append('    ' + goto(addr + 1))
+        else:
+            if ends_with == JUMP or ends_with == HALT:
+                # The limit is reached before a trailing jump or halt.
+                lines.append('if state[0] <= %d:' % n_committed)
+            else:
+                lines.append('if state[0] < %d:' % n_committed)
+            lines.append('    return ~%d' % start)
+            if n_committed:
+                lines.append('state[0] -= %d' % n_committed)
+            lines.append('hits[%d] += 1' % start)
+            lines.extend(body)
+            if ends_with == BLTH:
+                lines.append('if r[%d] < r[%d]:' % instruction[1:3])
+                if train:
+                    lines.append('    train(%d, True)' % addr)
+                lines.append('    state[1] += 1')
+                lines.append('    ' + goto(instruction[3]))
+                if train:
+                    lines.append('train(%d, False)' % addr)
+                lines.append(goto(addr + 1))
+            elif ends_with == JUMP:
+                lines.append(goto(instruction[1]))
+            elif ends_with == HALT:
+                lines.append('state[2] = True')
+                lines.append('return ~%d' % addr)
+            else:
+                lines.append('return ~%d' % addr)
+
+        source = ('def block(r, memory=memory, train=train, state=state, '
+                  'hits=hits):\n'
+                  + ''.join('    %s\n' % line for line in lines))
+        namespace = {'memory': self.memory,
+                     'train': self.branch_predictor.receive if train else None,
+                     'state': self._state,
+                     'hits': self._hits}
+        exec(compile(source, '<block %d>' % start, 'exec'), namespace)
+        return (namespace['block'], n_committed, ends_with)
+
+    def _interpret(self, max_instructions):
+        """Execute one instruction at a time. See run."""
+        code = self.code
+        n_code = len(code)
+        registers = self.register_file.values
+        PC = self.register_file.PC
+        memory = self.memory
+        train = None
+        if self.branch_predictor is not None:
+            train = self.branch_predictor.receive
+        pc = registers[PC]
+        blocks = self.block_counts
+        block_start = pc
+        block_base = 0
+        n_committed = 0
+        n_jumps = 0
+        n_branches = 0
+        n_taken = 0
+        limit = -1 if max_instructions is None else max_instructions
+
+        while n_committed != limit and 0 <= pc < n_code:
+            instruction = code[pc]
+            op = instruction[0]
+            if op == ADDI:
+                registers[instruction[1]] = registers[instruction[2]] + instruction[3]
+            elif op == ADD:
+                registers[instruction[1]] = (registers[instruction[2]]
+                                             + registers[instruction[3]])
+            elif op == BLTH:
+                n_branches += 1
+                n_committed += 1
+                if blocks is not None:
+                    blocks[block_start] = (blocks.get(block_start, 0)
+                                           + n_committed - block_base)
+                    block_base = n_committed
+                if registers[instruction[1]] < registers[instruction[2]]:
+                    if train is not None:
+                        train(pc, True)
+                    n_taken += 1
+                    pc = instruction[3]
+                else:
+                    if train is not None:
+                        train(pc, False)
+                    pc += 1
+                block_start = pc
+                continue
+            elif op == LOAD:
+                registers[instruction[1]] = memory[registers[instruction[2]]]
+            elif op == STORE:
+                memory[registers[instruction[2]]] = registers[instruction[1]]
+            elif op == MUL:
+                registers[instruction[1]] = (registers[instruction[2]]
+                                             * registers[instruction[3]])
+            elif op == MULI:
+                registers[instruction[1]] = registers[instruction[2]] * instruction[3]
+            elif op == SUB:
+                registers[instruction[1]] = (registers[instruction[2]]
+                                             - registers[instruction[3]])
+            elif op == SUBI:
+                registers[instruction[1]] = registers[instruction[2]] - instruction[3]
+            elif op == JUMP:
+                n_jumps += 1
+                if blocks is not None and n_committed != block_base:
+                    blocks[block_start] = (blocks.get(block_start, 0)
+                                           + n_committed - block_base)
+                    block_base = n_committed
+                pc = instruction[1]
+                block_start = pc
+                continue
+            else:
+                self.halted = True
+                break
+            n_committed += 1
+            pc += 1
+
+        if blocks is not None and n_committed != block_base:
+            blocks[block_start] = (blocks.get(block_start, 0)
+                                   + n_committed - block_base)
+        registers[PC] = pc
+        self.n_committed += n_committed
+        self.n_jumps += n_jumps
+        self.n_branches += n_branches
+        self.n_taken += n_taken
+
+def decode(instruction, register_file):
+    """Return a front-end Instruction as an (opcode, operand, ...) tuple.
+
+    Register operands are replaced by their index in register_file.
+
+    Raises:
+        ValueError if the Instruction type is unknown.
+        KeyError if a Register is not in register_file.
+    """
+    index = register_file.index_of
+    typ = type(instruction)
+    if typ in _REGISTER_OPCODES:
+        return (_REGISTER_OPCODES[typ], index(instruction.rd),
+                index(instruction.r1), index(instruction.r2))
+    if typ in _IMMEDIATE_OPCODES:
+        return (_IMMEDIATE_OPCODES[typ], index(instruction.rd),
+                index(instruction.r1), instruction.imm)
+    if typ is ins.Load:
+        return (LOAD, index(instruction.rd), index(instruction.r1))
+    if typ is ins.Store:
+        return (STORE, index(instruction.rs), index(instruction.r1))
+    if typ is ins.Jump:
+        return (JUMP, instruction.imm)
+    if typ is ins.Blth:
+        return (BLTH, index(instruction.r1), index(instruction.r2),
+                instruction.imm)
+    if typ is ins.Halt:
+        return (HALT,)
+    raise ValueError('unknown instruction %r' % instruction)
+
+_REGISTER_OPCODES = {ins.Add: ADD, ins.Sub: SUB, ins.Mul: MUL}
+_REGISTER_OPERATIONS = (ADD, SUB, MUL)
+_BLOCK_OPERATORS = {ADD: '+', ADDI: '+', SUB: '-', SUBI: '-', MUL: '*', MULI: '*'}
+_IMMEDIATE_OPCODES = {ins.AddI: ADDI, ins.SubI: SUBI, ins.MulI: MULI}
@@ -1,42 +1,252 @@
-import logging
+from array import array
+import ast
+import mmap
+import operator
+import os
+import sys
 
 from procsim.register import Register
 
+# Magic string and version prefixing .npy files.
+NPY_MAGIC = b'\x93NUMPY'
+# .npy dtype descriptions of int64 in native byte order.
+NPY_INT64 = ('<i8', '=i8') if sys.byteorder == 'little' else ('>i8', '=i8')
+
 class Memory:
     """Simple random-access memory model.
 
-    Memory values are initialized to None.
+    Values are signed 64-bit integers held in an array('q'). A separate
+    bitmap records which locations have been written; uninitialized
+    locations read as None. Writing a value that does not fit in 64 bits
+    converts the values to a list of Python ints, so programs computing
+    wider values still run, at the cost of the array-only operations.
 
     Args:
         size: Number of addressable locations.
+
+    Attributes:
+        values: array('q') of values, a memoryview of a memory-mapped
+            image or, once a wider value is written, a list of ints.
+            Uninitialized locations hold 0.
+        initialized: bytearray that is non-zero for written locations.
     """
 
     def __init__(self, size):
         if size <= 0:
             raise ValueError('memory size must be > 0')
-        self.memory = [None] * size
+        self.values = array('q', bytes(8 * size))
+        self.initialized = bytearray(size)
 
     def __len__(self):
         """Return the number of addressable locations."""
-        return len(self.memory)
+        return len(self.values)
 
     def __getitem__(self, address):
         """Get the value at the given Memory address."""
-        address = self._validate_address(address)
-        return self.memory[address]
+        if type(address) is not int:
+            address = self._validate_address(address)
+        elif not 0 <= address < len(self.values):
+            raise IndexError('memory address %r out of range' % address)
+        if self.initialized[address]:
+            return self.values[address]
+        return None
 
     def __setitem__(self, address, value):
-        """Set the value at the given Memory address."""
-        if not isinstance(value, int):
-            logging.warning('memory address %r set to non-int value %r' % (address, value))
-        address = self._validate_address(address)
-        self.memory[address] = value
+        """Set the value at the given Memory address.
+
+        Raises:
+            TypeError if value is not an integer.
+        """
+        if type(address) is not int:
+            address = self._validate_address(address)
+        elif not 0 <= address < len(self.values):
+            raise IndexError('memory address %r out of range' % address)
+        if type(value) is not int:
+            try:
+                value = operator.index(value)
+            except TypeError:
+                raise TypeError('memory value must be an int, not %r'
+                                % type(value)) from None
+        try:
+            self.values[address] = value
+        except (OverflowError, ValueError):
+            # Wider than 64 bits. Memory-mapped values raise ValueError.
+            self.values = list(self.values)
+            self.values[address] = value
+        self.initialized[address] = 1
+
+    def load_array(self, values, start=0):
+        """Set consecutive locations from a sequence of ints.
+
+        Args:
+            values: Iterable of ints, array('q') or an object supporting the
+                buffer protocol with native 64-bit signed items (e.g. a NumPy
+                int64 array). Other buffers, including non-native byte
+                orders, are converted element by element.
+            start: Address of the first location to set. (default 0)
+        """
+        values = _as_array(values)
+        stop = start + len(values)
+        if not 0 <= start <= stop <= len(self.values):
+            raise IndexError('memory addresses %r to %r out of range'
+                             % (start, stop))
+        self.values[start:stop] = values
+        self.initialized[start:stop] = b'\x01' * len(values)
+
+    def dump_array(self, start=0, stop=None):
+        """Return a copy of locations start to stop as an array('q').
+
+        Uninitialized locations are returned as 0.
+
+        Raises:
+            OverflowError if a value does not fit in 64 bits.
+        """
+        values = self.values[start:stop]
+        if isinstance(values, memoryview):
+            values = array('q', values.tobytes())
+        elif isinstance(values, list):
+            values = array('q', values)
+        return values
+
+    def memoryview(self):
+        """Return a writable memoryview of the values.
+
+        Writes through the view do not mark locations initialized.
+
+        Raises:
+            OverflowError if a value wider than 64 bits has been written.
+        """
+        self._check_narrow()
+        return memoryview(self.values)
+
+    @classmethod
+    def from_image(cls, path, size=None):
+        """Return a Memory initialized from a .npy or raw binary image file.
+
+        The image must hold int64 values in native byte order; a raw file is
+        read as consecutive values from offset 0. The file is memory-mapped
+        copy-on-write, so pages are read lazily and writes never reach the
+        file. All locations in the image are initialized.
+
+        Args:
+            path: Path of the image. Files ending in .npy are parsed as NumPy
+                arrays, anything else is read as raw int64 values.
+            size: Number of addressable locations. Locations past the end of
+                the image are uninitialized. If larger than the image, the
+                image is read into memory instead of mapped. (default None,
+                the image size)
+
+        Raises:
+            ValueError if the image is not int64 or is larger than size.
+        """
+        with open(path, 'rb') as f:
+            offset = _npy_data_offset(f) if path.endswith('.npy') else 0
+            n_bytes = os.fstat(f.fileno()).st_size - offset
+            if n_bytes % 8 != 0:
+                raise ValueError('image %r is not a whole number of int64 '
+                                 'values' % path)
+            n_values = n_bytes // 8
+            if size is None:
+                size = n_values
+            if size < n_values:
+                raise ValueError('image %r has %d values, more than size %d'
+                                 % (path, n_values, size))
+
+            memory = cls(size) if size > n_values or n_values == 0 else None
+            if memory is not None:
+                f.seek(offset)
+                memory.values[:n_values] = array('q', f.read(n_bytes))
+            else:
+                memory = cls.__new__(cls)
+                memory._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                memory.values = memoryview(memory._mmap)[offset:].cast('q')
+                memory.initialized = bytearray(size)
+        memory.initialized[:n_values] = b'\x01' * n_values
+        return memory
+
+    def save_image(self, path):
+        """Write all values to a .npy or raw binary image file.
+
+        Uninitialized locations are written as 0. See from_image.
+
+        Args:
+            path: Path of the image. Files ending in .npy are written as
+                NumPy arrays, anything else as raw int64 values.
+
+        Raises:
+            OverflowError if a value wider than 64 bits has been written.
+        """
+        self._check_narrow()
+        with open(path, 'wb') as f:
+            if path.endswith('.npy'):
+                f.write(_npy_header(len(self)))
+            f.write(memoryview(self.values).cast('B'))
+
+    def __getstate__(self):
+        # Memory-mapped values are copied so the Memory can be pickled.
+        values = self.values
+        if isinstance(values, memoryview):
+            values = self.dump_array()
+        return {'values': values, 'initialized': self.initialized}
+
+    def __setstate__(self, state):
+        self.values = state['values']
+        self.initialized = state['initialized']
+
+    def tolist(self):
+        """Return the values as a list with None for uninitialized locations."""
+        return [value if initialized else None
+                for (value, initialized) in zip(self.values, self.initialized)]
+
+    def _check_narrow(self):
+        if isinstance(self.values, list):
+            raise OverflowError('memory holds values wider than 64 bits')
 
     def _validate_address(self, address):
         if not isinstance(address, (int, Register)):
             raise TypeError('memory address must be an integer or Register, not %r' % type(address))
         if isinstance(address, Register):
             address = address.read()
-        if not 0 <= address < len(self.memory):
+        if not 0 <= address < len(self.values):
             raise IndexError('memory address %r out of range' % address)
         return address
+
+def _as_array(values):
+    """Return values as an array('q'), copying a compatible buffer directly."""
+    if isinstance(values, array) and values.typecode == 'q':
+        return values
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array('q', values)
+    result = array('q')
+    # Only buffers in native byte order, with no '<', '>', '=' or '!' prefix,
+    # can be copied as raw bytes.
+    if (view.itemsize == result.itemsize
+            and view.format.lstrip('@') in ('q', 'l', 'n')
+            and view.c_contiguous):
+        result.frombytes(view.cast('B'))
+        return result
+    return array('q', map(int, values))
+
+def _npy_data_offset(f):
+    """Return the offset of the data in an open .npy file of int64 values."""
+    magic = f.read(8)
+    if magic[:6] != NPY_MAGIC:
+        raise ValueError('%r is not a .npy file' % f.name)
+    header_len_size = 2 if magic[6] == 1 else 4
+    header_len = int.from_bytes(f.read(header_len_size), 'little')
+    header = ast.literal_eval(f.read(header_len).decode('latin1'))
+    if header['descr'] not in NPY_INT64 or header['fortran_order']:
+        raise ValueError('%r must hold a C-ordered native int64 array, not %r'
+                         % (f.name, header['descr']))
+    return 8 + header_len_size + header_len
+
+def _npy_header(n_values):
+    """Return a version 1.0 .npy header for a 1-D int64 array."""
+    header = ("{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }"
+              % (NPY_INT64[0], n_values))
+    # Pad so the data is 64-byte aligned, ending the header with a newline.
+    padding = 63 - (10 + len(header)) % 64
+    header = (header + ' ' * padding + '\n').encode('latin1')
+    return NPY_MAGIC + b'\x01\x00' + len(header).to_bytes(2, 'little') + header
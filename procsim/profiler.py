@@ -0,0 +1,83 @@
+from time import perf_counter
+
+from procsim.clocked import Clocked
+
+class Profiler:
+    """Records call counts and wall time per component and method.
+
+    Attributes:
+        stats: {(component name, method name): [n_calls, seconds]} dict.
+            Components of the same class share one entry.
+    """
+
+    def __init__(self):
+        self.stats = {}
+
+    def stat(self, component, method):
+        """Return the mutable [n_calls, seconds] entry for a component method.
+
+        Args:
+            component: Component instance or name.
+            method: Method name.
+        """
+        if not isinstance(component, str):
+            component = type(component).__name__
+        return self.stats.setdefault((component, method), [0, 0.0])
+
+    def report(self):
+        """Return a per-stage breakdown as a list of lines, slowest first.
+
+        Percentages are of the total operate and trigger time. Bus publish and
+        receive times are nested inside the operate calls that publish.
+        """
+        total = sum(seconds for (_, method), (_, seconds) in self.stats.items()
+                    if method in ('operate', 'trigger'))
+        lines = ['%-36s %10s %10s %10s %6s' % ('component.method', 'calls',
+                                               'time (s)', 'us/call', '%')]
+        ordered = sorted(self.stats.items(), key=lambda item: -item[1][1])
+        for (component, method), (n_calls, seconds) in ordered:
+            lines.append('%-36s %10d %10.3f %10.2f %6.1f' % (
+                component + '.' + method,
+                n_calls,
+                seconds,
+                1e6 * seconds / max(1, n_calls),
+                100 * seconds / max(total, 1e-9)))
+        return lines
+
+class ProfiledComponent(Clocked):
+    """Wraps a Clocked component and times its operate and trigger calls.
+
+    Args:
+        component: Clocked component to wrap.
+        profiler: Profiler to record timings in.
+    """
+
+    def __init__(self, component, profiler):
+        self.component = component
+        self.operate_stat = profiler.stat(component, 'operate')
+        self.trigger_stat = profiler.stat(component, 'trigger')
+
+    def operate(self):
+        start = perf_counter()
+        try:
+            self.component.operate()
+        finally:
+            self.operate_stat[0] += 1
+            self.operate_stat[1] += perf_counter() - start
+
+    def trigger(self):
+        start = perf_counter()
+        try:
+            self.component.trigger()
+        finally:
+            self.trigger_stat[0] += 1
+            self.trigger_stat[1] += perf_counter() - start
+
+    def idle(self):
+        return self.component.idle()
+
+    def idle_cycles(self):
+        return self.component.idle_cycles()
+
+    def skip(self, n_cycles):
+        self.component.skip(n_cycles)
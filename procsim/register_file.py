@@ -3,7 +3,9 @@ from procsim.register import Register
 class RegisterFile:
     """A RegisterFile containing general purpose Registers and a program counter.
 
-    The program counter is indexed using 'pc'.
+    The program counter is indexed using 'pc'. Register values are held in a
+    list; components on the hot path may resolve a name to its index once
+    with index_of and then use read and write, or the values list directly.
 
     Args:
         n_gpr_registers: Number of general purpose Registers in the
@@ -13,33 +15,73 @@ class RegisterFile:
             (default 'r')
         init_values: {register_name: value} dict to initialize the Register
             values from.
+
+    Attributes:
+        names: List of Register names in index order. The pc is last.
+        index: {register_name: index} dict.
+        values: List of Register values in index order. The list is updated in
+            place and never replaced, so references to it stay valid.
+        PC: Index of the program counter.
     """
     def __init__(self, n_gpr_registers, gpr_prefix='r', init_values=None):
         self.prefix = gpr_prefix
-        self.registers = {gpr_prefix + str(i): Register()
-                          for i in range(n_gpr_registers)}
-        self.registers['pc'] = Register()
+        self.names = [gpr_prefix + str(i) for i in range(n_gpr_registers)]
+        self.names.append('pc')
+        self.index = {name: i for (i, name) in enumerate(self.names)}
+        self.values = [0] * len(self.names)
+        self.PC = self.index['pc']
         if init_values is not None:
             for name, value in init_values.items():
                 self[name] = value
 
     def __eq__(self, other):
         """Return True if all Register names and values, including pc, are equal."""
-        return self.registers == other.registers
+        return self.names == other.names and self.values == other.values
 
     def __getitem__(self, name):
         """Get a Register's value."""
-        return self.registers[name].read()
+        return self.values[self.index[name]]
 
     def __setitem__(self, name, value):
-        """Set a Register's value."""
-        self.registers[name].write(value)
+        """Set a Register's value to an immediate or Register value."""
+        if isinstance(value, Register):
+            value = value.read()
+        self.values[self.index[name]] = value
+
+    def index_of(self, name):
+        """Return the index of the named Register.
+
+        Raises:
+            KeyError if no Register has the name.
+        """
+        return self.index[name]
+
+    def read(self, index):
+        """Return the value of the Register at index."""
+        return self.values[index]
+
+    def write(self, index, value):
+        """Set the value of the Register at index to an immediate value."""
+        self.values[index] = value
+
+    def snapshot(self):
+        """Return a tuple of all Register values in index order."""
+        return tuple(self.values)
+
+    def restore(self, snapshot):
+        """Set all Register values from a tuple returned by snapshot."""
+        if len(snapshot) != len(self.values):
+            raise ValueError('snapshot has %d values, expected %d'
+                             % (len(snapshot), len(self.values)))
+        self.values[:] = snapshot
 
     def __len__(self):
         """Return the number of Registers in the RegisterFile."""
-        return len(self.registers)
+        return len(self.values)
 
     def __repr__(self):
-        return 'RegisterFile(%d, gpr_prefix=%r, init_values=%r)' % (len(self.registers) - 1,
+        init_values = {name: Register(value)
+                       for (name, value) in zip(self.names, self.values)}
+        return 'RegisterFile(%d, gpr_prefix=%r, init_values=%r)' % (len(self.values) - 1,
                                                                     self.prefix,
-                                                                    self.registers)
+                                                                    init_values)
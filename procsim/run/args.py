@@ -1,13 +1,52 @@
 import argparse
 
-def get_args():
-    """Return an argparse Namespace containing program arguments."""
-    DESCRIPTION = 'Superscalar out-of-order processor simulator.'
+from procsim.run.config import Config
 
-    parser = argparse.ArgumentParser(prog='procsim',
-                                     description=DESCRIPTION)
-    parser.add_argument('PROGRAM')
+def add_predictor_table_args(parser):
+    """Add the branch Predictor geometry arguments to an ArgumentParser."""
+    parser.add_argument('--gshare-table',
+                        nargs=3,
+                        default=[2**8, 2, 8],
+                        type=int,
+                        dest='gshare_table',
+                        metavar=('N_ENTRIES', 'N_PREDICTION_BITS',
+                                 'N_HISTORY_BITS'))
+
+    parser.add_argument('--tournament-table',
+                        nargs=2,
+                        default=[2**8, 2],
+                        type=int,
+                        dest='tournament_table',
+                        metavar=('N_ENTRIES', 'N_PREDICTION_BITS'))
+
+    parser.add_argument('--tage-table',
+                        nargs=5,
+                        default=[2**10, 2**10, 4, 4, 32],
+                        type=int,
+                        dest='tage_table',
+                        metavar=('N_BASE_ENTRIES', 'N_ENTRIES', 'N_TABLES',
+                                 'MIN_HISTORY_LENGTH', 'MAX_HISTORY_LENGTH'))
+
+    parser.add_argument('--perceptron-table',
+                        nargs=2,
+                        default=[2**8, 12],
+                        type=int,
+                        dest='perceptron_table',
+                        metavar=('N_ENTRIES', 'N_HISTORY_BITS'))
+
+    parser.add_argument('--loop-table',
+                        nargs=2,
+                        default=[64, 2],
+                        type=int,
+                        dest='loop_table',
+                        metavar=('N_ENTRIES', 'CONFIDENCE_THRESHOLD'))
 
+    parser.add_argument('--loop-override',
+                        action='store_true',
+                        dest='loop_override')
+
+def add_config_args(parser):
+    """Add the arguments read by Config.from_args to an ArgumentParser."""
     branch_predictors = parser.add_mutually_exclusive_group()
     branch_predictors.add_argument('--branch-history-table',
                                    nargs=2,
@@ -24,6 +63,23 @@ def get_args():
     branch_predictors.add_argument('--back-taken-forward-not',
                                    action='store_true',
                                    dest='back_taken_forward_not')
+    branch_predictors.add_argument('--gshare',
+                                   action='store_true',
+                                   dest='gshare')
+    branch_predictors.add_argument('--tournament',
+                                   action='store_true',
+                                   dest='tournament')
+    branch_predictors.add_argument('--tage',
+                                   action='store_true',
+                                   dest='tage')
+    branch_predictors.add_argument('--perceptron',
+                                   action='store_true',
+                                   dest='perceptron')
+    branch_predictors.add_argument('--loop',
+                                   action='store_true',
+                                   dest='loop')
+
+    add_predictor_table_args(parser)
 
     parser.add_argument('--n-integer-units',
                         action='store',
@@ -57,6 +113,24 @@ def get_args():
                         action='store_false',
                         dest='no_forwarding')
 
+    parser.add_argument('--fast-forward',
+                        action='store_true',
+                        dest='fast_forward')
+
+    parser.add_argument('--batched-bus',
+                        action='store_true',
+                        dest='batched_bus')
+
+def get_args():
+    """Return an argparse Namespace containing program arguments."""
+    DESCRIPTION = 'Superscalar out-of-order processor simulator.'
+
+    parser = argparse.ArgumentParser(prog='procsim',
+                                     description=DESCRIPTION)
+    parser.add_argument('PROGRAM')
+
+    add_config_args(parser)
+
     parser.add_argument('--step-execution',
                         action='store_true',
                         dest='step_execution')
@@ -69,4 +143,374 @@ def get_args():
                         action='store_false',
                         dest='console_output')
 
-    return parser.parse_args()
+    parser.add_argument('--batch',
+                        action='store_true',
+                        dest='batch')
+
+    parser.add_argument('--max-cycles',
+                        action='store',
+                        default=None,
+                        type=int,
+                        dest='max_cycles',
+                        metavar='N')
+
+    parser.add_argument('--max-instructions',
+                        action='store',
+                        default=None,
+                        type=int,
+                        dest='max_instructions',
+                        metavar='N')
+
+    parser.add_argument('--functional',
+                        action='store_true',
+                        dest='functional')
+
+    parser.add_argument('--save-checkpoint',
+                        action='store',
+                        default=None,
+                        dest='save_checkpoint',
+                        metavar='PATH')
+
+    parser.add_argument('--load-checkpoint',
+                        action='store',
+                        default=None,
+                        dest='load_checkpoint',
+                        metavar='PATH')
+
+    parser.add_argument('--profile',
+                        action='store_true',
+                        dest='profile')
+
+    parser.add_argument('--cprofile-output',
+                        action='store',
+                        default=None,
+                        dest='cprofile_output',
+                        metavar='PATH')
+
+    parser.add_argument('--program-cache',
+                        action='store',
+                        default=None,
+                        dest='program_cache',
+                        metavar='DIR')
+
+    args = parser.parse_args()
+    if args.batch:
+        args.console_output = False
+        args.step_execution = False
+        args.plot = False
+    return args
+
+
+def get_sweep_args(argv=None):
+    """Return an argparse Namespace containing sweep arguments.
+
+    Args:
+        argv: List of argument strings. (default None, use sys.argv)
+    """
+    DESCRIPTION = 'Run a design-space sweep over microarchitecture parameters.'
+
+    parser = argparse.ArgumentParser(prog='procsim sweep',
+                                     description=DESCRIPTION)
+    parser.add_argument('PROGRAMS',
+                        nargs='+')
+
+    parser.add_argument('--superscalar-width',
+                        nargs='+',
+                        default=[4],
+                        type=int,
+                        dest='superscalar_width')
+
+    parser.add_argument('--capacity',
+                        nargs='+',
+                        default=[32],
+                        type=int,
+                        dest='capacity')
+
+    parser.add_argument('--n-integer-units',
+                        nargs='+',
+                        default=[4],
+                        type=int,
+                        dest='n_integer_units')
+
+    parser.add_argument('--n-branch-units',
+                        nargs='+',
+                        default=[1],
+                        type=int,
+                        dest='n_branch_units')
+
+    parser.add_argument('--branch-predictor',
+                        nargs='+',
+                        default=['branch_history_table'],
+                        choices=Config.BRANCH_PREDICTORS,
+                        dest='branch_predictor')
+
+    parser.add_argument('--branch-history-table',
+                        nargs=2,
+                        default=[2**8, 2],
+                        type=int,
+                        dest='branch_history_table',
+                        metavar=('N_ENTRIES', 'N_PREDICTION_BITS'))
+
+    parser.add_argument('--sample',
+                        action='store',
+                        default=None,
+                        type=int,
+                        dest='sample',
+                        metavar='N')
+
+    parser.add_argument('--seed',
+                        action='store',
+                        default=None,
+                        type=int,
+                        dest='seed')
+
+    parser.add_argument('--processes',
+                        action='store',
+                        default=None,
+                        type=int,
+                        dest='processes')
+
+    parser.add_argument('--max-cycles',
+                        action='store',
+                        default=None,
+                        type=int,
+                        dest='max_cycles',
+                        metavar='N')
+
+    parser.add_argument('--max-instructions',
+                        action='store',
+                        default=None,
+                        type=int,
+                        dest='max_instructions',
+                        metavar='N')
+
+    parser.add_argument('--fast-forward',
+                        action='store_true',
+                        dest='fast_forward')
+
+    parser.add_argument('--output',
+                        action='store',
+                        default=None,
+                        dest='output',
+                        metavar='PATH')
+
+    parser.add_argument('--format',
+                        action='store',
+                        default=None,
+                        choices=['csv', 'json'],
+                        dest='format')
+
+    return parser.parse_args(argv)
+
+def get_benchmark_args(argv=None):
+    """Return an argparse Namespace containing benchmark arguments.
+
+    Args:
+        argv: List of argument strings. (default None, use sys.argv)
+    """
+    DESCRIPTION = 'Measure simulator throughput on the bundled programs.'
+
+    parser = argparse.ArgumentParser(prog='procsim benchmark',
+                                     description=DESCRIPTION)
+    parser.add_argument('BENCHMARKS',
+                        nargs='*')
+
+    parser.add_argument('--baseline',
+                        action='store',
+                        default=None,
+                        dest='baseline',
+                        metavar='PATH')
+
+    parser.add_argument('--save-baseline',
+                        action='store',
+                        default=None,
+                        dest='save_baseline',
+                        metavar='PATH')
+
+    parser.add_argument('--repeat',
+                        action='store',
+                        default=1,
+                        type=int,
+                        dest='repeat',
+                        metavar='N')
+
+    return parser.parse_args(argv)
+
+def get_sample_args(argv=None):
+    """Return an argparse Namespace containing sampled simulation arguments.
+
+    Args:
+        argv: List of argument strings. (default None, use sys.argv)
+    """
+    DESCRIPTION = ('Estimate performance from detailed windows separated by '
+                   'functional execution.')
+
+    parser = argparse.ArgumentParser(prog='procsim sample',
+                                     description=DESCRIPTION)
+    parser.add_argument('PROGRAM')
+
+    add_config_args(parser)
+
+    parser.add_argument('--interval',
+                        action='store',
+                        default=100000,
+                        type=int,
+                        dest='interval',
+                        metavar='N')
+
+    parser.add_argument('--warmup',
+                        action='store',
+                        default=1000,
+                        type=int,
+                        dest='warmup',
+                        metavar='N')
+
+    parser.add_argument('--window',
+                        action='store',
+                        default=1000,
+                        type=int,
+                        dest='window',
+                        metavar='N')
+
+    parser.add_argument('--confidence',
+                        action='store',
+                        default=0.95,
+                        type=float,
+                        dest='confidence')
+
+    parser.add_argument('--max-instructions',
+                        action='store',
+                        default=None,
+                        type=int,
+                        dest='max_instructions',
+                        metavar='N')
+
+    return parser.parse_args(argv)
+
+def get_simpoint_args(argv=None):
+    """Return an argparse Namespace containing representative interval arguments.
+
+    Args:
+        argv: List of argument strings. (default None, use sys.argv)
+    """
+    DESCRIPTION = ('Select representative intervals by clustering basic '
+                   'block vectors.')
+
+    parser = argparse.ArgumentParser(prog='procsim simpoint',
+                                     description=DESCRIPTION)
+    parser.add_argument('PROGRAM')
+
+    add_config_args(parser)
+
+    parser.add_argument('--interval',
+                        action='store',
+                        default=100000,
+                        type=int,
+                        dest='interval',
+                        metavar='N')
+
+    parser.add_argument('--max-k',
+                        action='store',
+                        default=10,
+                        type=int,
+                        dest='max_k',
+                        metavar='K')
+
+    parser.add_argument('--n-dims',
+                        action='store',
+                        default=15,
+                        type=int,
+                        dest='n_dims',
+                        metavar='N')
+
+    parser.add_argument('--seed',
+                        action='store',
+                        default=0,
+                        type=int,
+                        dest='seed')
+
+    parser.add_argument('--max-instructions',
+                        action='store',
+                        default=None,
+                        type=int,
+                        dest='max_instructions',
+                        metavar='N')
+
+    parser.add_argument('--checkpoint-dir',
+                        action='store',
+                        default=None,
+                        dest='checkpoint_dir',
+                        metavar='DIR')
+
+    parser.add_argument('--warmup',
+                        action='store',
+                        default=1000,
+                        type=int,
+                        dest='warmup',
+                        metavar='N')
+
+    parser.add_argument('--simulate',
+                        action='store_true',
+                        dest='simulate')
+
+    return parser.parse_args(argv)
+
+def get_branch_eval_args(argv=None):
+    """Return an argparse Namespace containing branch trace arguments.
+
+    Args:
+        argv: List of argument strings. (default None, use sys.argv)
+    """
+    DESCRIPTION = ('Replay the conditional branches of a program against '
+                   'branch predictors.')
+
+    parser = argparse.ArgumentParser(prog='procsim branches',
+                                     description=DESCRIPTION)
+    parser.add_argument('SOURCE')
+
+    parser.add_argument('--predictor',
+                        nargs='+',
+                        default=['branch_history_table'],
+                        choices=Config.BRANCH_PREDICTORS,
+                        dest='predictor')
+
+    parser.add_argument('--n-entries',
+                        nargs='+',
+                        default=[2**8],
+                        type=int,
+                        dest='n_entries')
+
+    parser.add_argument('--n-prediction-bits',
+                        nargs='+',
+                        default=[2],
+                        type=int,
+                        dest='n_prediction_bits')
+
+    add_predictor_table_args(parser)
+
+    parser.add_argument('--max-instructions',
+                        action='store',
+                        default=None,
+                        type=int,
+                        dest='max_instructions',
+                        metavar='N')
+
+    parser.add_argument('--save-trace',
+                        action='store',
+                        default=None,
+                        dest='save_trace',
+                        metavar='PATH')
+
+    parser.add_argument('--output',
+                        action='store',
+                        default=None,
+                        dest='output',
+                        metavar='PATH')
+
+    parser.add_argument('--format',
+                        action='store',
+                        default='csv',
+                        choices=['csv', 'json'],
+                        dest='format')
+
+    return parser.parse_args(argv)
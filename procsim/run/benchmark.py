@@ -0,0 +1,159 @@
+from copy import deepcopy
+import importlib
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+from procsim.run.args import get_benchmark_args
+from procsim.run.config import Config
+from procsim.run.simulator import Simulator
+
+# Configuration used for the wide-machine benchmarks. Large buffers stress
+# the ReorderBuffer, ReservationStation and LoadStoreQueue.
+WIDE = {'superscalar_width': 8,
+        'capacity': 256,
+        'n_integer_units': 8,
+        'n_branch_units': 2}
+
+class Benchmark:
+    """A program simulated under a fixed Config.
+
+    Args:
+        name: Unique benchmark name.
+        program: Program module name.
+        config: Config keyword arguments. (default None, Config defaults)
+        max_cycles: Cycle limit for long-running programs. (default None)
+    """
+
+    def __init__(self, name, program, config=None, max_cycles=None):
+        self.name = name
+        self.program = program
+        self.config = config or {}
+        self.max_cycles = max_cycles
+
+    def __repr__(self):
+        return 'Benchmark(%r, %r, %r, %r)' % (self.name, self.program,
+                                              self.config, self.max_cycles)
+
+BENCHMARKS = [Benchmark('fib', 'programs.fib'),
+              Benchmark('bubble_sort', 'programs.bubble_sort'),
+              Benchmark('vector_addition', 'programs.vector_addition'),
+              Benchmark('inner_product', 'programs.inner_product'),
+              Benchmark('dancing_branch', 'programs.dancing_branch'),
+              Benchmark('superscalar_test', 'programs.superscalar_test'),
+              Benchmark('superscalar_test_wide', 'programs.superscalar_test', WIDE),
+              Benchmark('edge_detection', 'programs.edge_detection',
+                        max_cycles=20000),
+              Benchmark('edge_detection_wide', 'programs.edge_detection', WIDE,
+                        max_cycles=20000)]
+
+# Baseline used when --baseline is not given, relative to the repository root.
+DEFAULT_BASELINE = os.path.join('benchmarks', 'baseline.json')
+
+# Results that must be identical between runs of the same benchmark.
+SIMULATED = ('n_cycles', 'n_committed', 'n_branch_correct', 'n_branch_incorrect')
+
+def run_benchmark(benchmark):
+    """Simulate a Benchmark in this process and return its measurements.
+
+    Returns:
+        Dict of simulated results, wall time, setup time, simulated cycles and
+        committed instructions per host second and peak RSS in KiB.
+    """
+    start_time = time.perf_counter()
+    program = importlib.import_module(benchmark.program)
+    simulator = Simulator(Config(**benchmark.config),
+                          program.PROGRAM,
+                          deepcopy(program.REGISTER_FILE),
+                          deepcopy(program.MEMORY))
+    setup_time = time.perf_counter() - start_time
+    stats = simulator.run(max_cycles=benchmark.max_cycles)
+    result = {name: getattr(stats, name) for name in SIMULATED}
+    result['setup_time'] = setup_time
+    result['wall_time'] = stats.host_time
+    result['cycles_per_second'] = stats.cycles_per_second
+    result['instructions_per_second'] = (stats.n_committed
+                                         / max(stats.host_time, 1e-9))
+    result['peak_rss'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+def run_benchmarks(benchmarks, repeat=1):
+    """Run each Benchmark repeat times, each time in a freshly spawned process.
+
+    Spawned rather than forked children are used so the peak RSS of each
+    run does not include memory inherited from this process.
+
+    Returns:
+        {benchmark name: result} dict keeping the fastest of the repeats.
+    """
+    results = {}
+    tasks = [b for b in benchmarks for _ in range(repeat)]
+    # One task per child so that peak RSS is measured per benchmark.
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        for benchmark, result in zip(tasks, pool.imap(run_benchmark, tasks)):
+            best = results.get(benchmark.name)
+            if best is None or result['wall_time'] < best['wall_time']:
+                results[benchmark.name] = result
+    return results
+
+def compare(results, baseline):
+    """Return report lines comparing results against baseline results.
+
+    A benchmark whose simulated results differ from the baseline is flagged
+    as a MISMATCH: the simulator's behaviour, not only its speed, changed.
+    """
+    lines = ['%-22s %12s %12s %10s %10s %8s' % ('benchmark', 'cycles/s',
+                                                 'instrs/s', 'wall (s)',
+                                                 'rss (MiB)', 'speedup')]
+    for name, result in results.items():
+        speedup = ''
+        base = baseline.get(name)
+        if base is not None:
+            if any(base[key] != result[key] for key in SIMULATED):
+                speedup = 'MISMATCH'
+            else:
+                speedup = '%.2fx' % (result['cycles_per_second']
+                                     / base['cycles_per_second'])
+        lines.append('%-22s %12.1f %12.1f %10.3f %10.1f %8s' % (
+            name,
+            result['cycles_per_second'],
+            result['instructions_per_second'],
+            result['wall_time'],
+            result['peak_rss'] / 1024,
+            speedup))
+    return lines
+
+def main(argv=None):
+    args = get_benchmark_args(argv)
+    benchmarks = BENCHMARKS
+    if args.BENCHMARKS:
+        known = {b.name: b for b in BENCHMARKS}
+        unknown = [name for name in args.BENCHMARKS if name not in known]
+        if unknown:
+            sys.exit('unknown benchmark(s) %s' % ', '.join(unknown))
+        benchmarks = [known[name] for name in args.BENCHMARKS]
+
+    results = run_benchmarks(benchmarks, repeat=args.repeat)
+
+    baseline = {}
+    baseline_path = args.baseline
+    if baseline_path is None and os.path.exists(DEFAULT_BASELINE):
+        baseline_path = DEFAULT_BASELINE
+    if baseline_path is not None:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+    print('\n'.join(compare(results, baseline)))
+
+    if args.save_baseline is not None:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    mismatched = [name for name, result in results.items()
+                  if name in baseline
+                  and any(baseline[name][key] != result[key] for key in SIMULATED)]
+    return 1 if mismatched else 0
@@ -0,0 +1,98 @@
+from copy import deepcopy
+import importlib
+import itertools
+import sys
+
+from procsim.branch.trace import BranchTrace
+from procsim.run.args import get_branch_eval_args
+from procsim.run.config import Config
+from procsim.run.simulator import build_branch_predictor
+from procsim.run.sweep import write_csv
+from procsim.run.sweep import write_json
+
+def load_trace(source, max_instructions=None):
+    """Return a BranchTrace from a saved .npz trace or a program module name.
+
+    Program modules are run functionally on copies of their REGISTER_FILE
+    and MEMORY.
+    """
+    if source.endswith('.npz'):
+        return BranchTrace.load(source)
+    module = importlib.import_module(source)
+    return BranchTrace.record(module.PROGRAM,
+                              deepcopy(module.REGISTER_FILE),
+                              deepcopy(module.MEMORY),
+                              max_instructions=max_instructions)
+
+def evaluate(trace, predictors, geometries, config=None):
+    """Return a result row dict for each predictor and table geometry.
+
+    Args:
+        trace: BranchTrace to replay.
+        predictors: List of Config.BRANCH_PREDICTORS names.
+        geometries: List of (n_entries, n_prediction_bits) tuples used for
+            the 'branch_history_table' predictor.
+        config: Config giving the geometry of the other predictors and
+            whether a LoopPredictor overrides them. (default None, the
+            Config defaults)
+    """
+    if config is None:
+        config = Config()
+    rows = []
+    for name in predictors:
+        if name == 'branch_history_table':
+            if config.loop_override:
+                results = [trace.evaluate(build_branch_predictor(
+                               _config(config, name, geometry)))
+                           for geometry in geometries]
+            else:
+                results = trace.evaluate_branch_history_tables(geometries)
+            for ((n_entries, n_bits), result) in zip(geometries, results):
+                row = {'predictor': name,
+                       'n_entries': n_entries,
+                       'n_prediction_bits': n_bits}
+                row.update(result)
+                rows.append(row)
+        else:
+            predictor = build_branch_predictor(_config(config, name))
+            row = {'predictor': name,
+                   'n_entries': None,
+                   'n_prediction_bits': None}
+            row.update(trace.evaluate(predictor))
+            rows.append(row)
+    return rows
+
+def _config(config, name, branch_history_table=None):
+    """Return a copy of config using the named predictor."""
+    parameters = config.as_dict()
+    parameters['branch_predictor'] = name
+    if branch_history_table is not None:
+        parameters['branch_history_table'] = branch_history_table
+    return Config(**parameters)
+
+def main(argv=None):
+    args = get_branch_eval_args(argv)
+    try:
+        trace = load_trace(args.SOURCE, args.max_instructions)
+    except Exception as err:
+        sys.exit('unable to load %r, %r' % (args.SOURCE, err))
+    if args.save_trace is not None:
+        trace.save(args.save_trace)
+
+    geometries = list(itertools.product(args.n_entries,
+                                        args.n_prediction_bits))
+    # A Tournament's local table takes the first geometry.
+    config = Config(branch_history_table=geometries[0],
+                    gshare=args.gshare_table,
+                    tournament=args.tournament_table,
+                    tage=args.tage_table,
+                    perceptron=args.perceptron_table,
+                    loop=args.loop_table,
+                    loop_override=args.loop_override)
+    rows = evaluate(trace, args.predictor, geometries, config)
+    write = write_json if args.format == 'json' else write_csv
+    if args.output is None:
+        write(rows, sys.stdout)
+    else:
+        with open(args.output, 'w', newline='') as out:
+            write(rows, out)
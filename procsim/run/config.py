@@ -0,0 +1,120 @@
+class Config:
+    """Microarchitecture configuration for a Simulator.
+
+    The defaults match the procsim command line defaults.
+
+    Args:
+        superscalar_width: Maximum number of instructions fetched, decoded,
+            dispatched and committed per cycle. (default 4)
+        capacity: Size of the Decode, ReorderBuffer, ReservationStation and
+            LoadStoreQueue buffers. (default 32)
+        n_integer_units: Number of IntegerUnits. (default 4)
+        n_branch_units: Number of BranchUnits. (default 1)
+        branch_predictor: Name of the branch Predictor, one of
+            BRANCH_PREDICTORS. (default 'branch_history_table')
+        branch_history_table: (n_entries, n_prediction_bits) of the
+            BranchHistoryTable Predictor. (default (256, 2))
+        gshare: (n_entries, n_prediction_bits, n_history_bits) of the GShare
+            Predictor. (default (256, 2, 8))
+        tournament: (n_entries, n_prediction_bits) of the chooser table of
+            the Tournament Predictor, whose components are sized by
+            branch_history_table and gshare. (default (256, 2))
+        tage: (n_base_entries, n_entries, n_tables, min_history_length,
+            max_history_length) of the TAGE Predictor.
+            (default (1024, 1024, 4, 4, 32))
+        perceptron: (n_entries, n_history_bits) of the Perceptron Predictor.
+            (default (256, 12))
+        loop: (n_entries, confidence_threshold) of the LoopPredictor.
+            (default (64, 2))
+        loop_override: If True, a LoopPredictor overrides the branch
+            Predictor on loop exits. (default False)
+        data_forwarding: If True, Stores forward values to later Loads.
+            (default True)
+        bypassing: If True, Loads and Stores may bypass Stores in the
+            LoadStoreQueue. (default True)
+        fast_forward: If True, use an ActivityClock. (default False)
+        batched_bus: If True, Results published in a cycle are delivered
+            together at the end of the cycle, one cycle later than otherwise.
+            (default False)
+    """
+
+    BRANCH_PREDICTORS = ('branch_history_table',
+                         'always_taken',
+                         'never_taken',
+                         'back_taken_forward_not',
+                         'gshare',
+                         'tournament',
+                         'tage',
+                         'perceptron',
+                         'loop')
+
+    def __init__(self,
+                 superscalar_width=4,
+                 capacity=32,
+                 n_integer_units=4,
+                 n_branch_units=1,
+                 branch_predictor='branch_history_table',
+                 branch_history_table=(2**8, 2),
+                 gshare=(2**8, 2, 8),
+                 tournament=(2**8, 2),
+                 tage=(2**10, 2**10, 4, 4, 32),
+                 perceptron=(2**8, 12),
+                 loop=(64, 2),
+                 loop_override=False,
+                 data_forwarding=True,
+                 bypassing=True,
+                 fast_forward=False,
+                 batched_bus=False):
+        if branch_predictor not in self.BRANCH_PREDICTORS:
+            raise ValueError('unknown branch predictor %r' % branch_predictor)
+        self.superscalar_width = superscalar_width
+        self.capacity = capacity
+        self.n_integer_units = n_integer_units
+        self.n_branch_units = n_branch_units
+        self.branch_predictor = branch_predictor
+        self.branch_history_table = tuple(branch_history_table)
+        self.gshare = tuple(gshare)
+        self.tournament = tuple(tournament)
+        self.tage = tuple(tage)
+        self.perceptron = tuple(perceptron)
+        self.loop = tuple(loop)
+        self.loop_override = loop_override
+        self.data_forwarding = data_forwarding
+        self.bypassing = bypassing
+        self.fast_forward = fast_forward
+        self.batched_bus = batched_bus
+
+    @classmethod
+    def from_args(cls, args):
+        """Return a Config from an argparse Namespace returned by get_args."""
+        branch_predictor = 'branch_history_table'
+        for name in cls.BRANCH_PREDICTORS:
+            if getattr(args, name, False) is True:
+                branch_predictor = name
+        return cls(superscalar_width=args.superscalar_width,
+                   capacity=args.capacity,
+                   n_integer_units=args.n_integer_units,
+                   n_branch_units=args.n_branch_units,
+                   branch_predictor=branch_predictor,
+                   branch_history_table=args.branch_history_table,
+                   gshare=args.gshare_table,
+                   tournament=args.tournament_table,
+                   tage=args.tage_table,
+                   perceptron=args.perceptron_table,
+                   loop=args.loop_table,
+                   loop_override=args.loop_override,
+                   data_forwarding=args.no_forwarding,
+                   bypassing=args.no_bypassing,
+                   fast_forward=args.fast_forward,
+                   batched_bus=args.batched_bus)
+
+    def as_dict(self):
+        """Return the Config as a {parameter: value} dict."""
+        return dict(self.__dict__)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and self.__dict__ == other.__dict__
+
+    def __repr__(self):
+        return 'Config(%s)' % ', '.join('%s=%r' % item
+                                        for item in self.__dict__.items())
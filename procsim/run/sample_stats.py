@@ -0,0 +1,123 @@
+import math
+import statistics
+
+class SampleStats:
+    """Whole-program performance extrapolated from detailed windows.
+
+    Each window's cycles per instruction (CPI) is one sample. The estimate of
+    the program's CPI is the sample mean, with a normal confidence interval
+    of the mean.
+
+    Args:
+        n_committed: Number of instructions committed by the whole run.
+        windows: List of (n_committed, n_cycles) tuples, one per measured
+            detailed window.
+        halted: True if the program executed a halt instruction.
+        host_time: Host seconds spent in both functional and detailed
+            simulation.
+        confidence: Confidence level of the interval. (default 0.95)
+
+    Attributes:
+        cpi_samples: CPI of each window.
+    """
+
+    def __init__(self, n_committed, windows, halted, host_time,
+                 confidence=0.95):
+        self.n_committed = n_committed
+        self.windows = list(windows)
+        self.halted = halted
+        self.host_time = host_time
+        self.confidence = confidence
+        self.cpi_samples = [n_cycles / n_window
+                            for (n_window, n_cycles) in self.windows]
+
+    @property
+    def n_windows(self):
+        return len(self.windows)
+
+    @property
+    def n_measured(self):
+        """Number of instructions committed in measured windows."""
+        return sum(n_window for (n_window, _) in self.windows)
+
+    @property
+    def cycles_per_instruction(self):
+        if not self.cpi_samples:
+            return math.nan
+        return statistics.mean(self.cpi_samples)
+
+    @property
+    def cpi_half_width(self):
+        """Half width of the CPI confidence interval, inf if unknown."""
+        if len(self.cpi_samples) < 2:
+            return math.inf
+        z = normal_quantile(0.5 + self.confidence / 2)
+        stdev = statistics.stdev(self.cpi_samples)
+        return z * stdev / math.sqrt(len(self.cpi_samples))
+
+    @property
+    def instructions_per_cycle(self):
+        cpi = self.cycles_per_instruction
+        return 1 / cpi if cpi > 0 else math.nan
+
+    @property
+    def ipc_interval(self):
+        """(low, high) confidence interval of the instructions per cycle."""
+        cpi = self.cycles_per_instruction
+        half_width = self.cpi_half_width
+        if math.isnan(cpi):
+            return (math.nan, math.nan)
+        low = 1 / (cpi + half_width)
+        high = 1 / (cpi - half_width) if cpi > half_width else math.inf
+        return (low, high)
+
+    @property
+    def n_cycles(self):
+        """Estimated number of cycles of a detailed run."""
+        return self.n_committed * self.cycles_per_instruction
+
+    def as_dict(self):
+        """Return all attributes and derived statistics as a dict."""
+        stats = dict(self.__dict__)
+        stats['n_windows'] = self.n_windows
+        stats['n_measured'] = self.n_measured
+        stats['cycles_per_instruction'] = self.cycles_per_instruction
+        stats['cpi_half_width'] = self.cpi_half_width
+        stats['instructions_per_cycle'] = self.instructions_per_cycle
+        stats['ipc_interval'] = self.ipc_interval
+        stats['n_cycles'] = self.n_cycles
+        return stats
+
+    def report(self):
+        """Return a human readable multi-line summary."""
+        lines = []
+        if not self.halted:
+            lines.append('Stopped: limit reached before halt')
+        lines.append('Instructions Committed: %d' % self.n_committed)
+        lines.append('Windows: %d' % self.n_windows)
+        lines.append('Instructions Measured: %d' % self.n_measured)
+        lines.append('Estimated Cycles: %.0f' % self.n_cycles)
+        lines.append('Instructions/Cycle: %.2f (%.0f%% CI %.2f to %.2f)'
+                     % ((self.instructions_per_cycle, 100 * self.confidence)
+                        + self.ipc_interval))
+        lines.append('Host Time: %.3fs' % self.host_time)
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return 'SampleStats(%s)' % ', '.join('%s=%r' % item
+                                             for item in self.__dict__.items())
+
+def normal_quantile(p):
+    """Return the p quantile of the standard normal distribution.
+
+    The CDF is inverted by bisection, as statistics.NormalDist needs
+    Python 3.8.
+    """
+    low, high = -40.0, 40.0
+    for _ in range(100):
+        middle = (low + high) / 2
+        if (1 + math.erf(middle / math.sqrt(2))) / 2 < p:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
@@ -0,0 +1,153 @@
+from copy import deepcopy
+import importlib
+import sys
+import time
+
+from procsim.functional.emulator import Emulator
+from procsim.run.args import get_sample_args
+from procsim.run.config import Config
+from procsim.run.sample_stats import SampleStats
+from procsim.run.simulator import Simulator
+from procsim.run.simulator import build_branch_predictor
+
+class Sampler:
+    """Estimates a program's performance from periodic detailed windows.
+
+    The program runs on an Emulator. At the start of every interval of
+    committed instructions, a Simulator is built on copies of the current
+    Registers, Memory and branch Predictor and simulates a warm-up followed
+    by a measured window. The Emulator then executes the whole interval, so
+    architectural state never depends on the detailed model.
+
+    The Emulator trains the branch Predictor on every conditional branch, so
+    each window starts with a Predictor as warm as in a full detailed run.
+    Pipeline buffers start empty, which the warm-up hides.
+
+    Args:
+        config: Config of the detailed Simulator. (default Config())
+        program: List of instruction strings or compiled front-end
+            Instructions.
+        register_file: RegisterFile holding the initial Register values.
+        memory: Memory holding the initial values, or None if the program
+            does not access Memory. (default None)
+        interval: Number of instructions between the starts of consecutive
+            windows. (default 100000)
+        warmup: Number of instructions simulated before each window is
+            measured. (default 1000)
+        window: Number of instructions measured per window. (default 1000)
+        confidence: Confidence level of the reported interval.
+            (default 0.95)
+
+    Attributes:
+        emulator: Emulator executing the program.
+        branch_predictor: Predictor trained by the Emulator.
+        windows: List of (n_committed, n_cycles) tuples of measured windows.
+    """
+
+    def __init__(self, config, program, register_file, memory=None,
+                 interval=100000, warmup=1000, window=1000, confidence=0.95):
+        if window <= 0 or warmup < 0:
+            raise ValueError('window must be > 0 and warmup >= 0')
+        if interval < warmup + window:
+            raise ValueError('interval must be at least warmup + window')
+        if config is None:
+            config = Config()
+        self.config = config
+        self.interval = interval
+        self.warmup = warmup
+        self.window = window
+        self.confidence = confidence
+        self.branch_predictor = build_branch_predictor(config)
+        self.emulator = Emulator(program,
+                                 register_file,
+                                 memory,
+                                 branch_predictor=self.branch_predictor)
+        self.windows = []
+        self.host_time = 0.0
+
+    @classmethod
+    def from_module(cls, config, module, **kwargs):
+        """Return a Sampler for a program module.
+
+        Args:
+            config: Config of the detailed Simulator.
+            module: Module with PROGRAM, REGISTER_FILE and MEMORY attributes.
+            kwargs: Additional Sampler arguments.
+        """
+        return cls(config, module.PROGRAM, module.REGISTER_FILE,
+                   module.MEMORY, **kwargs)
+
+    def run(self, max_instructions=None):
+        """Sample until the program halts or a limit is reached.
+
+        Args:
+            max_instructions: Stop once this many instructions have been
+                committed in total. (default None, unlimited)
+
+        Returns:
+            SampleStats for the whole run so far.
+        """
+        emulator = self.emulator
+        start_time = time.perf_counter()
+        while not emulator.halted:
+            n_interval = self.interval
+            if max_instructions is not None:
+                n_interval = min(n_interval,
+                                 max_instructions - emulator.n_committed)
+                if n_interval <= 0:
+                    break
+            self.measure()
+            n_committed = emulator.n_committed
+            emulator.run(max_instructions=n_interval)
+            if emulator.n_committed == n_committed and not emulator.halted:
+                # The program ran off its end without halting.
+                break
+        self.host_time += time.perf_counter() - start_time
+        return self.stats()
+
+    def measure(self):
+        """Simulate a window in detail from the current state.
+
+        Returns:
+            The window's (n_committed, n_cycles), or None if the program
+            halted before the window started.
+        """
+        emulator = self.emulator
+        simulator = Simulator(self.config,
+                              emulator.program,
+                              deepcopy(emulator.register_file),
+                              deepcopy(emulator.memory),
+                              branch_predictor=deepcopy(self.branch_predictor))
+        warm = simulator.run(max_instructions=self.warmup)
+        if warm.halted:
+            return None
+        end = simulator.run(max_instructions=warm.n_committed + self.window)
+        window = (end.n_committed - warm.n_committed,
+                  end.n_cycles - warm.n_cycles)
+        if window[0] == 0:
+            return None
+        self.windows.append(window)
+        return window
+
+    def stats(self):
+        """Return SampleStats describing the run so far."""
+        return SampleStats(n_committed=self.emulator.n_committed,
+                           windows=self.windows,
+                           halted=self.emulator.halted,
+                           host_time=self.host_time,
+                           confidence=self.confidence)
+
+def main(argv=None):
+    args = get_sample_args(argv)
+    try:
+        program = importlib.import_module(args.PROGRAM)
+    except Exception as err:
+        sys.exit('unable to load program %r, %r' % (args.PROGRAM, err))
+    sampler = Sampler.from_module(Config.from_args(args),
+                                  program,
+                                  interval=args.interval,
+                                  warmup=args.warmup,
+                                  window=args.window,
+                                  confidence=args.confidence)
+    stats = sampler.run(max_instructions=args.max_instructions)
+    print(stats.report())
@@ -0,0 +1,140 @@
+from copy import deepcopy
+import importlib
+import json
+import os
+import sys
+import tempfile
+
+from procsim.functional.basic_block_profiler import BasicBlockProfiler
+from procsim.functional.clustering import select_intervals
+from procsim.functional.emulator import Emulator
+from procsim.run.args import get_simpoint_args
+from procsim.run.config import Config
+from procsim.run.simulator import Simulator
+from procsim.run.simulator import build_branch_predictor
+
+def profile(module, interval, max_instructions=None):
+    """Return the basic block vectors of a program module.
+
+    The module's REGISTER_FILE and MEMORY are copied, not modified.
+    """
+    profiler = BasicBlockProfiler(module.PROGRAM,
+                                  deepcopy(module.REGISTER_FILE),
+                                  deepcopy(module.MEMORY),
+                                  interval=interval)
+    return profiler.run(max_instructions=max_instructions)
+
+def write_checkpoints(config, module, interval, selected, directory, warmup=0):
+    """Write a Simulator checkpoint for each selected interval.
+
+    The program is executed on an Emulator that trains the branch Predictor,
+    so each checkpoint starts with a warm Predictor. Each checkpoint starts
+    warmup instructions before its interval, or at the start of the program.
+
+    Args:
+        config: Config of the checkpointed Simulators.
+        module: Program module.
+        interval: Number of instructions per interval.
+        selected: List of (interval, weight) tuples in interval order, as
+            returned by select_intervals.
+        directory: Directory to write the checkpoints to.
+        warmup: Number of instructions to simulate before each interval.
+            (default 0)
+
+    Returns:
+        List of point dicts with keys interval, weight, start, warmup and
+        checkpoint, the checkpoint's path.
+    """
+    os.makedirs(directory, exist_ok=True)
+    branch_predictor = build_branch_predictor(config)
+    emulator = Emulator(module.PROGRAM,
+                        deepcopy(module.REGISTER_FILE),
+                        deepcopy(module.MEMORY),
+                        branch_predictor=branch_predictor)
+    points = []
+    for (index, weight) in selected:
+        start = max(0, index * interval - warmup)
+        emulator.run(max_instructions=start - emulator.n_committed)
+        simulator = Simulator(config,
+                              emulator.program,
+                              deepcopy(emulator.register_file),
+                              deepcopy(emulator.memory),
+                              branch_predictor=deepcopy(branch_predictor))
+        path = os.path.join(directory, 'interval_%d.ckpt' % index)
+        simulator.save_checkpoint(path)
+        points.append({'interval': index,
+                       'weight': weight,
+                       'start': start,
+                       'warmup': index * interval - start,
+                       'checkpoint': path})
+    return points
+
+def simulate(points, interval):
+    """Simulate each checkpointed interval and return the weighted CPI.
+
+    A point whose interval commits no instructions, such as one starting at
+    the end of the program, is dropped and the weights of the remaining
+    points are renormalized to sum to 1.
+
+    Args:
+        points: List of point dicts returned by write_checkpoints. Each point
+            is given a dropped key and, unless dropped, a cpi key.
+        interval: Number of instructions per interval.
+
+    Returns:
+        Estimated whole-program cycles per instruction, or 0.0 if every point
+        was dropped.
+    """
+    cpi = 0.0
+    total_weight = 0.0
+    for point in points:
+        simulator = Simulator.load_checkpoint(point['checkpoint'])
+        warm = simulator.run(max_instructions=point['warmup'])
+        end = simulator.run(max_instructions=warm.n_committed + interval)
+        n_committed = end.n_committed - warm.n_committed
+        point['dropped'] = n_committed == 0
+        if not point['dropped']:
+            point['cpi'] = (end.n_cycles - warm.n_cycles) / n_committed
+            cpi += point['weight'] * point['cpi']
+            total_weight += point['weight']
+    if total_weight == 0:
+        return 0.0
+    return cpi / total_weight
+
+def main(argv=None):
+    args = get_simpoint_args(argv)
+    try:
+        module = importlib.import_module(args.PROGRAM)
+    except Exception as err:
+        sys.exit('unable to load program %r, %r' % (args.PROGRAM, err))
+
+    vectors = profile(module, args.interval, args.max_instructions)
+    selected = select_intervals(vectors,
+                                max_k=args.max_k,
+                                n_dims=args.n_dims,
+                                seed=args.seed)
+    print('Intervals: %d' % len(vectors))
+    for (index, weight) in selected:
+        print('Interval %d: weight %.3f' % (index, weight))
+
+    if args.checkpoint_dir is None and not args.simulate:
+        return
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = args.checkpoint_dir or tmp_dir
+        points = write_checkpoints(Config.from_args(args),
+                                   module,
+                                   args.interval,
+                                   selected,
+                                   directory,
+                                   warmup=args.warmup)
+        if args.simulate:
+            cpi = simulate(points, args.interval)
+            for point in points:
+                if point['dropped']:
+                    print('Interval %d: dropped, no instructions committed'
+                          % point['interval'])
+            print('Estimated Cycles: %.0f' % (cpi * vectors.sum()))
+            print('Instructions/Cycle: %.2f' % (1 / cpi if cpi else 0))
+        if args.checkpoint_dir is not None:
+            with open(os.path.join(directory, 'simpoints.json'), 'w') as f:
+                json.dump(points, f, indent=2)
@@ -0,0 +1,353 @@
+import gzip
+import os
+import pickle
+import tempfile
+import time
+
+from procsim.activity_clock import ActivityClock
+from procsim.back_end.branch_unit import BranchUnit
+from procsim.back_end.broadcast_bus import BroadcastBus
+from procsim.back_end.integer_unit import IntegerUnit
+from procsim.back_end.load_store_queue import LoadStoreQueue
+from procsim.back_end.reorder_buffer import ReorderBuffer
+from procsim.back_end.reservation_station import ReservationStation
+from procsim.branch.dynamic.branch_history_table import BranchHistoryTable
+from procsim.branch.dynamic.gshare import GShare
+from procsim.branch.dynamic.loop_predictor import LoopPredictor
+from procsim.branch.dynamic.perceptron import Perceptron
+from procsim.branch.dynamic.tage import TAGE
+from procsim.branch.dynamic.tournament import Tournament
+from procsim.branch.static.always_taken import AlwaysTaken
+from procsim.branch.static.back_taken_forward_not import BackTakenForwardNot
+from procsim.branch.static.never_taken import NeverTaken
+from procsim.clock import Clock
+from procsim.end_of_program import EndOfProgram
+from procsim.front_end.decode import Decode
+from procsim.front_end.fetch import Fetch
+from procsim.front_end.program import compile_program
+from procsim.run.config import Config
+from procsim.run.stats import Stats
+
+# Version of the checkpoint format written by Simulator.save_checkpoint.
+CHECKPOINT_VERSION = 2
+
+class Simulator:
+    """A complete processor built from a Config, ready to run a program.
+
+    The Simulator owns and mutates register_file and memory. Pass copies to
+    run the same program more than once.
+
+    Args:
+        config: Config describing the microarchitecture. (default Config())
+        program: List of instruction strings or compiled front-end
+            Instructions.
+        register_file: RegisterFile holding the initial Register values.
+        memory: Memory holding the initial values, or None if the program
+            does not access Memory. (default None)
+        profiler: If not None, a Profiler recording per-component operate,
+            trigger and receive timings. (default None)
+        cprofile: If not None, a cProfile.Profile that is enabled only while
+            the simulation loop runs. (default None)
+        cache_dir: If not None, directory in which compiled programs are
+            cached between runs. (default None)
+        branch_predictor: If not None, a Predictor to use instead of one built
+            from config, e.g. one already trained on earlier execution.
+            (default None)
+
+    A Simulator can be pickled, copied with copy.deepcopy or saved with
+    save_checkpoint to resume it later or to run several experiments from the
+    same state. The cprofile profiler is not saved.
+
+    Attributes:
+        clock: Clock (or ActivityClock) all components are registered with.
+        halted: True once the program has executed a halt instruction.
+        host_time: Host seconds spent in step and run.
+    """
+
+    def __init__(self, config, program, register_file, memory=None,
+                 profiler=None, cprofile=None, cache_dir=None,
+                 branch_predictor=None):
+        if config is None:
+            config = Config()
+        self.config = config
+        self.program = compile_program(program, cache_dir)
+        self.register_file = register_file
+        self.memory = memory
+        self.profiler = profiler
+        self.cprofile = cprofile
+        self.branch_predictor = branch_predictor
+        self.halted = False
+        self.host_time = 0.0
+        self._build()
+
+    @classmethod
+    def from_module(cls, config, module):
+        """Return a Simulator for a program module.
+
+        Args:
+            config: Config describing the microarchitecture.
+            module: Module with PROGRAM, REGISTER_FILE and MEMORY attributes.
+        """
+        return cls(config, module.PROGRAM, module.REGISTER_FILE, module.MEMORY)
+
+    @classmethod
+    def load_checkpoint(cls, path):
+        """Return a Simulator restored from a file written by save_checkpoint.
+
+        Only load checkpoints from trusted sources: they are pickles.
+
+        Raises:
+            ValueError if the file is not a checkpoint of this version.
+        """
+        with gzip.open(path, 'rb') as f:
+            try:
+                checkpoint = pickle.load(f)
+            except (pickle.UnpicklingError, EOFError, OSError) as err:
+                raise ValueError('%r is not a checkpoint: %s' % (path, err))
+        if (not isinstance(checkpoint, dict)
+                or checkpoint.get('version') != CHECKPOINT_VERSION
+                or not isinstance(checkpoint.get('simulator'), cls)):
+            raise ValueError('%r is not a version %d checkpoint'
+                             % (path, CHECKPOINT_VERSION))
+        return checkpoint['simulator']
+
+    def save_checkpoint(self, path):
+        """Atomically write the complete machine state to a compressed file.
+
+        The checkpoint holds every component, including buffered instructions,
+        unit timers and the branch Predictor, as well as the RegisterFile,
+        Memory and cycle count. See load_checkpoint.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw,
+                                                           mode='wb',
+                                                           compresslevel=6) as f:
+                pickle.dump({'version': CHECKPOINT_VERSION, 'simulator': self},
+                            f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['cprofile'] = None
+        return state
+
+    def _build(self):
+        """Create and connect all processor components."""
+        config = self.config
+
+        if config.fast_forward:
+            self.clock = ActivityClock(self.profiler)
+        else:
+            self.clock = Clock(self.profiler)
+
+        self.broadcast_bus = BroadcastBus(batched=config.batched_bus)
+        if self.profiler is not None:
+            self.broadcast_bus.profile(self.profiler)
+
+        self.branch_units = [BranchUnit(self.broadcast_bus)
+                             for _ in range(config.n_branch_units)]
+
+        self.integer_units = [IntegerUnit(self.broadcast_bus)
+                              for _ in range(config.n_integer_units)]
+
+        self.reservation_station = ReservationStation(capacity=config.capacity,
+                                                      width=config.superscalar_width,
+                                                      broadcast_bus=self.broadcast_bus)
+
+        self.load_store_queue = LoadStoreQueue(self.memory,
+                                               self.broadcast_bus,
+                                               capacity=config.capacity,
+                                               width=config.superscalar_width,
+                                               data_forwarding=config.data_forwarding,
+                                               bypassing=config.bypassing)
+
+        if self.branch_predictor is None:
+            self.branch_predictor = build_branch_predictor(config)
+
+        self.reorder_buffer = ReorderBuffer(self.register_file,
+                                            self.reservation_station,
+                                            self.load_store_queue,
+                                            branch_predictor=self.branch_predictor,
+                                            capacity=config.capacity,
+                                            width=config.superscalar_width)
+
+        self.decode = Decode(self.reorder_buffer,
+                             capacity=config.capacity,
+                             width=config.superscalar_width)
+
+        self.fetch = Fetch(self.register_file,
+                           self.program,
+                           self.decode,
+                           self.branch_predictor,
+                           width=config.superscalar_width)
+
+        # Add additional connections. The ReservationStation and
+        # LoadStoreQueue listen on the bus for the tags they wait on.
+        self.broadcast_bus.subscribe(self.reorder_buffer)
+
+        for branch_unit in self.branch_units:
+            self.reservation_station.register(branch_unit)
+        for integer_unit in self.integer_units:
+            self.reservation_station.register(integer_unit)
+
+        for branch_unit in self.branch_units:
+            self.clock.register(branch_unit)
+        for integer_unit in self.integer_units:
+            self.clock.register(integer_unit)
+        self.clock.register(self.reservation_station)
+        self.clock.register(self.load_store_queue)
+        self.clock.register(self.reorder_buffer)
+        self.clock.register(self.decode)
+        self.clock.register(self.fetch)
+        # Last, so batched Results are delivered after every other trigger.
+        self.clock.register(self.broadcast_bus)
+
+        self.reorder_buffer.set_pipeline_flush_root(self.fetch)
+
+    def step(self, n_cycles=1):
+        """Simulate n_cycles clock cycles or until the program halts.
+
+        Returns:
+            True if the program has halted.
+        """
+        if self.halted:
+            return True
+        clock = self.clock
+        end = clock.n_ticks + n_cycles
+        start_time = time.perf_counter()
+        if self.cprofile is not None:
+            self.cprofile.enable()
+        try:
+            if self.config.fast_forward:
+                while clock.n_ticks < end:
+                    clock.tick(end - clock.n_ticks)
+            else:
+                tick = clock.tick
+                for _ in range(n_cycles):
+                    tick()
+        except EndOfProgram:
+            self.halted = True
+        finally:
+            if self.cprofile is not None:
+                self.cprofile.disable()
+        self.host_time += time.perf_counter() - start_time
+        return self.halted
+
+    def run(self, max_cycles=None, max_instructions=None):
+        """Simulate until the program halts or a limit is reached.
+
+        Args:
+            max_cycles: Stop once this many cycles have been simulated in
+                total. (default None, unlimited)
+            max_instructions: Stop once this many instructions have been
+                committed in total. (default None, unlimited)
+
+        Returns:
+            Stats for the whole run so far.
+        """
+        if self.halted:
+            return self.stats()
+        clock = self.clock
+        rob = self.reorder_buffer
+        tick = clock.tick
+        start_time = time.perf_counter()
+        if self.cprofile is not None:
+            self.cprofile.enable()
+        try:
+            if max_cycles is None and max_instructions is None:
+                while True:
+                    tick()
+            elif self.config.fast_forward:
+                while ((max_cycles is None or clock.n_ticks < max_cycles)
+                       and (max_instructions is None
+                            or rob.n_committed < max_instructions)):
+                    if max_cycles is None:
+                        tick()
+                    else:
+                        tick(max_cycles - clock.n_ticks)
+            elif max_instructions is None:
+                for _ in range(max(0, max_cycles - clock.n_ticks)):
+                    tick()
+            else:
+                while ((max_cycles is None or clock.n_ticks < max_cycles)
+                       and rob.n_committed < max_instructions):
+                    tick()
+        except EndOfProgram:
+            self.halted = True
+        finally:
+            if self.cprofile is not None:
+                self.cprofile.disable()
+        self.host_time += time.perf_counter() - start_time
+        return self.stats()
+
+    def stats(self):
+        """Return Stats describing the run so far."""
+        rob = self.reorder_buffer
+        return Stats(n_cycles=self.clock.n_ticks,
+                     n_issued=rob.n_issued,
+                     n_committed=rob.n_committed,
+                     n_branch_correct=rob.n_branch_correct,
+                     n_branch_incorrect=rob.n_branch_incorrect,
+                     halted=self.halted,
+                     host_time=self.host_time,
+                     n_messages=self.broadcast_bus.n_messages,
+                     n_deliveries=self.broadcast_bus.n_deliveries)
+
+def build_branch_predictor(config):
+    """Return a new branch Predictor as described by config."""
+    if config.branch_predictor == 'loop':
+        return _build_loop_predictor(config, None)
+    branch_predictor = _build_base_predictor(config)
+    if config.loop_override:
+        return _build_loop_predictor(config, branch_predictor)
+    return branch_predictor
+
+def _build_base_predictor(config):
+    if config.branch_predictor == 'always_taken':
+        return AlwaysTaken()
+    elif config.branch_predictor == 'never_taken':
+        return NeverTaken()
+    elif config.branch_predictor == 'back_taken_forward_not':
+        return BackTakenForwardNot()
+    elif config.branch_predictor == 'gshare':
+        return _build_gshare(config)
+    elif config.branch_predictor == 'tournament':
+        n_entries, n_prediction_bits = config.tournament
+        return Tournament(local_predictor=_build_branch_history_table(config),
+                          global_predictor=_build_gshare(config),
+                          n_entries=n_entries,
+                          n_prediction_bits=n_prediction_bits)
+    elif config.branch_predictor == 'tage':
+        (n_base_entries, n_entries, n_tables,
+         min_history_length, max_history_length) = config.tage
+        return TAGE(n_base_entries=n_base_entries,
+                    n_entries=n_entries,
+                    n_tables=n_tables,
+                    min_history_length=min_history_length,
+                    max_history_length=max_history_length)
+    elif config.branch_predictor == 'perceptron':
+        n_entries, n_history_bits = config.perceptron
+        return Perceptron(n_entries=n_entries, n_history_bits=n_history_bits)
+    return _build_branch_history_table(config)
+
+def _build_branch_history_table(config):
+    n_entries, n_prediction_bits = config.branch_history_table
+    return BranchHistoryTable(n_entries=n_entries,
+                              n_prediction_bits=n_prediction_bits)
+
+def _build_loop_predictor(config, base_predictor):
+    n_entries, confidence_threshold = config.loop
+    return LoopPredictor(base_predictor=base_predictor,
+                         n_entries=n_entries,
+                         confidence_threshold=confidence_threshold)
+
+def _build_gshare(config):
+    n_entries, n_prediction_bits, n_history_bits = config.gshare
+    return GShare(n_entries=n_entries,
+                  n_prediction_bits=n_prediction_bits,
+                  n_history_bits=n_history_bits)
@@ -0,0 +1,81 @@
+class Stats:
+    """Statistics describing a (possibly unfinished) Simulator run.
+
+    Attributes:
+        n_cycles: Number of simulated clock cycles.
+        n_issued: Number of instructions issued.
+        n_committed: Number of instructions committed.
+        n_branch_correct: Number of correctly predicted branch instructions.
+        n_branch_incorrect: Number of incorrectly predicted branch
+            instructions.
+        halted: True if the program executed a halt instruction.
+        host_time: Host seconds spent simulating.
+        n_messages: Number of Results published on the BroadcastBus.
+            (default 0)
+        n_deliveries: Number of Results received by components from the
+            BroadcastBus. (default 0)
+    """
+
+    def __init__(self, n_cycles, n_issued, n_committed, n_branch_correct,
+                 n_branch_incorrect, halted, host_time, n_messages=0,
+                 n_deliveries=0):
+        self.n_cycles = n_cycles
+        self.n_issued = n_issued
+        self.n_committed = n_committed
+        self.n_branch_correct = n_branch_correct
+        self.n_branch_incorrect = n_branch_incorrect
+        self.halted = halted
+        self.host_time = host_time
+        self.n_messages = n_messages
+        self.n_deliveries = n_deliveries
+
+    @property
+    def instructions_per_cycle(self):
+        return self.n_committed / max(1, self.n_cycles)
+
+    @property
+    def branch_accuracy(self):
+        n_branch = self.n_branch_correct + self.n_branch_incorrect
+        return max(1, self.n_branch_correct) / max(1, n_branch)
+
+    @property
+    def messages_per_cycle(self):
+        return self.n_messages / max(1, self.n_cycles)
+
+    @property
+    def deliveries_per_message(self):
+        return self.n_deliveries / max(1, self.n_messages)
+
+    @property
+    def cycles_per_second(self):
+        return self.n_cycles / max(self.host_time, 1e-9)
+
+    def as_dict(self):
+        """Return all attributes and derived statistics as a dict."""
+        stats = dict(self.__dict__)
+        stats['instructions_per_cycle'] = self.instructions_per_cycle
+        stats['branch_accuracy'] = self.branch_accuracy
+        stats['messages_per_cycle'] = self.messages_per_cycle
+        stats['deliveries_per_message'] = self.deliveries_per_message
+        stats['cycles_per_second'] = self.cycles_per_second
+        return stats
+
+    def report(self):
+        """Return a human readable multi-line summary."""
+        lines = []
+        if not self.halted:
+            lines.append('Stopped: limit reached before halt')
+        lines.append('Instructions Issued: %d' % self.n_issued)
+        lines.append('Instructions Committed: %d' % self.n_committed)
+        lines.append('Cycles: %d' % self.n_cycles)
+        lines.append('Instructions/Cycle: %.2f' % self.instructions_per_cycle)
+        lines.append('Branch Prediction Accuracy: %.2f' % self.branch_accuracy)
+        lines.append('Bus Messages/Cycle: %.2f' % self.messages_per_cycle)
+        lines.append('Bus Deliveries/Message: %.2f' % self.deliveries_per_message)
+        lines.append('Host Time: %.3fs' % self.host_time)
+        lines.append('Simulated Cycles/Second: %.1f' % self.cycles_per_second)
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return 'Stats(%s)' % ', '.join('%s=%r' % item
+                                       for item in self.__dict__.items())
@@ -0,0 +1,130 @@
+from copy import deepcopy
+import csv
+import importlib
+import itertools
+import json
+import multiprocessing
+import random
+import sys
+
+from procsim.run.args import get_sweep_args
+from procsim.run.config import Config
+from procsim.run.simulator import Simulator
+
+# Parameters that may be swept, in output column order.
+PARAMETERS = ('superscalar_width',
+              'capacity',
+              'n_integer_units',
+              'n_branch_units',
+              'branch_predictor')
+
+# Program modules loaded by this process, keyed by module name. Each sweep
+# point runs on copies of the module's REGISTER_FILE and MEMORY so a module is
+# only imported, and its memory only initialized, once per process.
+_programs = {}
+
+def load_program(name):
+    """Return the (cached) program module with the given name."""
+    if name not in _programs:
+        _programs[name] = importlib.import_module(name)
+    return _programs[name]
+
+def sweep_points(programs, grid, sample=None, seed=None, **config_kwargs):
+    """Return the list of (program, Config) points to simulate.
+
+    Args:
+        programs: List of program module names.
+        grid: {parameter: list of values} dict. Parameters are Config
+            arguments.
+        sample: If not None, return a random sample of this many points
+            instead of the full cartesian product. (default None)
+        seed: Random seed used when sampling. (default None)
+        config_kwargs: Additional fixed Config arguments.
+    """
+    names = sorted(grid)
+    points = []
+    for program in programs:
+        for values in itertools.product(*(grid[name] for name in names)):
+            kwargs = dict(config_kwargs)
+            kwargs.update(zip(names, values))
+            points.append((program, Config(**kwargs)))
+    if sample is not None and sample < len(points):
+        points = random.Random(seed).sample(points, sample)
+    return points
+
+def run_point(point, max_cycles=None, max_instructions=None):
+    """Simulate one (program, Config) point and return a result row dict."""
+    program_name, config = point
+    program = load_program(program_name)
+    simulator = Simulator(config,
+                          program.PROGRAM,
+                          deepcopy(program.REGISTER_FILE),
+                          deepcopy(program.MEMORY))
+    stats = simulator.run(max_cycles=max_cycles,
+                          max_instructions=max_instructions)
+    row = {'program': program_name}
+    row.update(config.as_dict())
+    row.update(stats.as_dict())
+    return row
+
+def _run_point(args):
+    return run_point(*args)
+
+def run_sweep(points, processes=None, max_cycles=None, max_instructions=None):
+    """Simulate all points on a process pool.
+
+    Args:
+        points: List of (program, Config) points.
+        processes: Number of worker processes. (default None, one per CPU)
+        max_cycles: Per point cycle limit. (default None, unlimited)
+        max_instructions: Per point committed instruction limit.
+            (default None, unlimited)
+
+    Returns:
+        List of result row dicts in the same order as points.
+    """
+    # Import programs before forking so that workers inherit them.
+    for program_name, _ in points:
+        load_program(program_name)
+    tasks = [(point, max_cycles, max_instructions) for point in points]
+    if processes == 1:
+        return [_run_point(task) for task in tasks]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(_run_point, tasks, chunksize=1)
+
+def write_csv(rows, out):
+    """Write result rows to the file object out as CSV."""
+    if not rows:
+        return
+    writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+
+def write_json(rows, out):
+    """Write result rows to the file object out as a JSON list."""
+    json.dump(rows, out, indent=2)
+    out.write('\n')
+
+def main(argv=None):
+    args = get_sweep_args(argv)
+    grid = {name: getattr(args, name) for name in PARAMETERS}
+    points = sweep_points(args.PROGRAMS,
+                          grid,
+                          sample=args.sample,
+                          seed=args.seed,
+                          branch_history_table=args.branch_history_table,
+                          fast_forward=args.fast_forward)
+    rows = run_sweep(points,
+                     processes=args.processes,
+                     max_cycles=args.max_cycles,
+                     max_instructions=args.max_instructions)
+
+    fmt = args.format
+    if fmt is None:
+        fmt = 'json' if args.output and args.output.endswith('.json') else 'csv'
+    write = write_json if fmt == 'json' else write_csv
+    if args.output is None:
+        write(rows, sys.stdout)
+    else:
+        with open(args.output, 'w', newline='') as out:
+            write(rows, out)
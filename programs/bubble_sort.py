@@ -11,7 +11,7 @@ for i in range(LEN_ARRAY):
 REGISTER_FILE = RegisterFile(6)
 
 def console_output():
-    return 'pc: %d memory: %r' % (REGISTER_FILE['pc'], MEMORY.memory)
+    return 'pc: %d memory: %r' % (REGISTER_FILE['pc'], MEMORY.tolist())
 
 # r0 is zero
 # r1 holds len_array - 1
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 from procsim.memory import Memory
 from procsim.register_file import RegisterFile
@@ -13,11 +12,8 @@ image = david.flatten()
 total = 2 + n_pixels * 4
 MEMORY = Memory(total)
 
-for i in range(total):
-    MEMORY.memory[i] = 0
-
-for i in range(n_pixels):
-    MEMORY.memory[1 + i] = int(image[i])
+MEMORY.load_array(np.zeros(total, dtype=np.int64))
+MEMORY.load_array(image.astype(np.int64), start=1)
 
 REGISTER_FILE = RegisterFile(31)
 
@@ -13,13 +13,11 @@ LEN_ARRAY = 8634
 MEMORY = Memory(LEN_ARRAY)
 # Initialize array with weights and biases.
 parameters = np.load('programs/mnist.npz')
-weights = parameters['weights'].flatten(order='F').astype(int)
-for i in range(7840):
-    MEMORY[i] = int(weights[i])
+weights = parameters['weights'].flatten(order='F').astype(np.int64)
+MEMORY.load_array(weights[:7840])
 
 biases = parameters['biases']
-for i in range(10):
-    MEMORY[i + 7840] = int(biases[i])
+MEMORY.load_array(biases[:10].astype(np.int64), start=7840)
 
 # User input and display.
 points = []
@@ -45,8 +43,7 @@ plt.pause(0.01)
 input('Continue?')
 image = image.flatten()
 
-for i in range(784):
-    MEMORY[i + 7850] = int(image[i])
+MEMORY.load_array(image[:784].astype(np.int64), start=7850)
 
 REGISTER_FILE = RegisterFile(15) # 15 GPR + 1 PC
 
@@ -17,9 +17,9 @@ REGISTER_FILE = RegisterFile(6)
 
 def console_output():
     return 'pc: %2d\n\t%r\n\t%r\n\t%r' % (REGISTER_FILE['pc'],
-                                          MEMORY.memory[:LEN_ARRAY],
-                                          MEMORY.memory[LEN_ARRAY:2*LEN_ARRAY],
-                                          MEMORY.memory[2*LEN_ARRAY:])
+                                          MEMORY.tolist()[:LEN_ARRAY],
+                                          MEMORY.tolist()[LEN_ARRAY:2*LEN_ARRAY],
+                                          MEMORY.tolist()[2*LEN_ARRAY:])
 
 # r0 holds len_array
 # r1 holds relative elem_idxs ([0...LEN_ARRAY - 1])
@@ -24,6 +24,12 @@ class TestBinaryInstructions(unittest.TestCase):
         ins.receive(Result('ROB0', 0))
         self.assertTrue(ins.can_dispatch())
 
+    def test_waiting_tags(self):
+        ins = Binary('ROB1', lambda o1, o2: o1 + o2, 'ROB2', 3)
+        self.assertEqual(ins.waiting_tags(), ['ROB2'])
+        ins.receive(Result('ROB2', 5))
+        self.assertEqual(ins.waiting_tags(), [])
+
     def test_execute(self):
         ins = Binary('ROB10', lambda o1, o2: o1 + o2, 'ROB3', 'ROB4')
         with self.assertRaises(ValueError):
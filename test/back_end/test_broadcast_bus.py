@@ -2,6 +2,7 @@ import random
 import unittest
 
 from procsim.back_end import broadcast_bus
+from procsim.back_end.result import Result
 
 class TestBroadcastBus(unittest.TestCase):
 
@@ -48,9 +49,68 @@ class TestBroadcastBus(unittest.TestCase):
         with self.assertRaises(AttributeError):
             bus.publish('test')
 
+    def test_listen(self):
+        """Ensure listeners receive only the next message with their tag."""
+        bus = broadcast_bus.BroadcastBus()
+        subscriber = SubscriberStub()
+        listener = SubscriberStub()
+        bus.subscribe(subscriber)
+        bus.listen('ROB1', listener)
+        bus.listen('ROB1', listener)
+
+        messages = [Result('ROB0', 0), Result('ROB1', 1), Result('ROB1', 2)]
+        for message in messages:
+            bus.publish(message)
+        self.assertListEqual(subscriber.messages, messages)
+        self.assertListEqual(listener.messages, [messages[1]])
+        self.assertEqual(bus.n_messages, 3)
+        self.assertEqual(bus.n_deliveries, 4)
+        self.assertEqual(dict(bus.deliveries_per_message), {1: 2, 2: 1})
+
+    def test_batched(self):
+        """Ensure batched messages are delivered together on trigger."""
+        bus = broadcast_bus.BroadcastBus(batched=True)
+        subscriber = SubscriberStub()
+        batch_subscriber = BatchSubscriberStub()
+        listener = BatchSubscriberStub()
+        bus.subscribe(subscriber)
+        bus.subscribe(batch_subscriber)
+        bus.listen('ROB2', listener)
+
+        messages = [Result('ROB1', 1), Result('ROB2', 2)]
+        for message in messages:
+            bus.publish(message)
+        self.assertListEqual(subscriber.messages, [])
+        self.assertFalse(bus.idle())
+
+        bus.tick()
+        self.assertListEqual(subscriber.messages, messages)
+        self.assertListEqual(batch_subscriber.batches, [messages])
+        self.assertListEqual(listener.batches, [[messages[1]]])
+        self.assertEqual(dict(bus.messages_per_cycle), {2: 1})
+        self.assertTrue(bus.idle())
+
+    def test_flush(self):
+        """Ensure flush discards pending messages and listeners."""
+        bus = broadcast_bus.BroadcastBus(batched=True)
+        listener = SubscriberStub()
+        bus.listen('ROB1', listener)
+        bus.publish(Result('ROB1', 1))
+        bus.flush()
+        bus.tick()
+        self.assertListEqual(listener.messages, [])
+        self.assertEqual(bus.listeners, {})
+
 class SubscriberStub:
     def __init__(self):
         self.messages = []
 
     def receive(self, message):
         self.messages.append(message)
+
+class BatchSubscriberStub:
+    def __init__(self):
+        self.batches = []
+
+    def receive_batch(self, messages):
+        self.batches.append(list(messages))
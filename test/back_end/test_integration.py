@@ -48,7 +48,6 @@ class TestIntegration(unittest.TestCase):
 
         self.bus.subscribe(self.rob)
         self.bus.subscribe(rs)
-        self.bus.subscribe(lsq)
 
     def test_straightline_integration(self):
         instructions = [Add('r2', 'r3', 'r4'),
@@ -49,6 +49,27 @@ class TestLoadStoreQueue(unittest.TestCase):
         self.assertEqual(load.address, 10)
         self.assertEqual(store.value, 10)
 
+    def test_listen(self):
+        """Ensure only the tags Instructions wait on are delivered, after flush too."""
+        load = Load('ROB1', 'ROB2', uid=0, spec_exec=True)
+        store = Store('ROB3', 'ROB4', 'ROB5', uid=1, spec_exec=False)
+        lsq = LoadStoreQueue(self.memory, self.bus, 32)
+        lsq.feed(load)
+        lsq.feed(store)
+        self.assertEqual(set(self.bus.listeners), {'ROB2', 'ROB4', 'ROB5'})
+
+        self.bus.publish(Result('ROB4', 3))
+        self.assertEqual(store.address, 3)
+        self.assertEqual(self.bus.deliveries_per_message, {1: 1})
+
+        self.bus.flush()
+        lsq.flush()
+        self.assertEqual(set(self.bus.listeners), {'ROB5'})
+        self.bus.publish(Result('ROB5', 7))
+        self.assertEqual(store.value, 7)
+        self.bus.publish(Result('ROB2', 1))
+        self.assertEqual(load.address, 'ROB2')
+
     def test_load_execute_correct_result_and_delay(self):
         """Test that the correct Load Result is published after DELAY ticks."""
         for _ in range(50):
@@ -6,6 +6,7 @@ from procsim.back_end.load_store_queue import LoadStoreQueue
 from procsim.back_end.reorder_buffer import ReorderBuffer
 from procsim.back_end.reservation_station import ReservationStation
 from procsim.back_end.result import Result
+from procsim.back_end.tag import Tag
 from procsim.branch.branch_info import BranchInfo
 from procsim.front_end.instructions.addi import AddI
 from procsim.front_end.instructions.add import Add
@@ -72,6 +73,25 @@ class TestReorderBuffer(unittest.TestCase):
             with self.assertRaises(AssertionError):
                 rob._get_queue_id()
 
+    def test_slot_tags(self):
+        """Ensure each slot has one non-int Tag that is reused after commit."""
+        log = FeedLog()
+        rob = ReorderBuffer(self.rf, log, self.lsq, capacity=4, width=4)
+        for _ in range(4):
+            rob.feed(self.generate_add(self.n_gpr_registers))
+        tags = [ins.tag for ins in log.log]
+        self.assertEqual([tag.slot for tag in tags], [0, 1, 2, 3])
+        for tag in tags:
+            self.assertIsInstance(tag, Tag)
+            self.assertNotIsInstance(tag, int)
+        rob.tick()
+        for tag in tags[:2]:
+            rob.receive(Result(tag, 5))
+        rob.tick()
+        self.assertEqual(rob.slots[:2], [None, None])
+        rob.feed(self.generate_add(self.n_gpr_registers))
+        self.assertIs(log.log[-1].tag, tags[0])
+
     def test_instructions_removed_from_queue_on_commit(self):
         """Test that commit frees a slot in the ROB."""
         for capacity in [1, 5, 25, 200]:
@@ -210,6 +230,40 @@ class TestReorderBuffer(unittest.TestCase):
             self.assertEqual(self.rf['r1'], 0)
         self.assertEqual(self.rf['pc'], 100)
 
+    def test_register_indices(self):
+        """Ensure register names are resolved to RegisterFile indices on feed."""
+        rs = FeedLog()
+        rob = ReorderBuffer(self.rf, rs, self.lsq, capacity=32)
+        self.rf['r2'] = 5
+        rob.feed(AddI('r1', 'r2', 1))
+        rob.feed(Add('r3', 'r1', 'r2'))
+        r1 = self.rf.index_of('r1')
+        self.assertEqual(rob.register_alias_table, {r1: rs.log[0].tag,
+                                                    self.rf.index_of('r3'): rs.log[1].tag})
+        self.assertEqual(rob.slots[rs.log[0].tag.slot].dest, r1)
+        self.assertEqual(rs.log[0].operand_1, 5)
+        self.assertIs(rs.log[1].operand_1, rs.log[0].tag)
+
+        rob.tick()
+        rob.receive(Result(rs.log[0].tag, 6))
+        rob.tick()
+        self.assertEqual(self.rf['r1'], 6)
+        self.assertNotIn(r1, rob.register_alias_table)
+
+    def test_conditional_branch_info(self):
+        """Ensure BranchInfo fed alongside a conditional is used."""
+        rs = FeedLog()
+        rob = ReorderBuffer(self.rf, rs, self.lsq, capacity=32)
+        cond = Blth('r4', 'r5', 2)
+        with self.assertRaises(ValueError):
+            rob.feed(cond)
+        self.assertEqual(rob.n_issued, 0)
+
+        branch_info = BranchInfo(False, 2, 1, 0)
+        rob.feed(cond, branch_info)
+        self.assertIs(rob.slots[rs.log[0].tag.slot].value, branch_info)
+        self.assertFalse(hasattr(cond, 'branch_info'))
+
     def test_flush(self):
         """Ensure flush of ReorderBuffer, LoadStoreQueue and ReservationStation."""
         rs = FlushableLog()
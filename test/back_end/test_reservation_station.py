@@ -2,9 +2,11 @@ import random
 import unittest
 
 from procsim.back_end.instructions.instruction import Instruction
+from procsim.back_end.integer_unit import IntegerUnit
 from procsim.back_end.instructions.integer_logical import IntegerLogical
 from procsim.back_end.reservation_station import ReservationStation
 from procsim.back_end.result import Result
+from test.back_end.bus_log import BusLog
 from test.feed_log import FeedLog
 from test.flushable_log import FlushableLog
 
@@ -116,6 +118,81 @@ class TestReservationStation(unittest.TestCase):
         self.rs.tick()
         self.assertListEqual(self.feed_log.log, [ins])
 
+    def test_wakeup_only_waiting(self):
+        """Ensure a Result only reaches Instructions waiting on its tag."""
+        waiting = IntegerLogical('ROB1', lambda o1, o2: o1 + o2, 'ROB2', 'ROB2')
+        other = IntegerLogical('ROB3', lambda o1, o2: o1 + o2, 'ROB4', 1)
+        self.rs.feed(waiting)
+        self.rs.feed(other)
+        self.assertEqual(self.rs.ready, [])
+        self.assertEqual(set(self.rs.waiters), {'ROB2', 'ROB4'})
+
+        self.rs.receive(Result('ROB2', 5))
+        self.assertEqual(self.rs.ready, [(0, waiting)])
+        self.assertEqual(other.operand_1, 'ROB4')
+        self.assertEqual(list(self.rs.waiters), ['ROB4'])
+
+    def test_listen_on_bus(self):
+        """Ensure a ReservationStation with a bus listens for waited-on tags."""
+        bus = BusLog()
+        rs = ReservationStation(capacity=10, broadcast_bus=bus)
+        ins = IntegerLogical('ROB1', lambda o1, o2: o1 + o2, 'ROB2', 'ROB3')
+        rs.feed(ins)
+        self.assertEqual(set(bus.listeners), {'ROB2', 'ROB3'})
+
+        bus.publish(Result('ROB2', 1))
+        bus.publish(Result('ROB4', 1))
+        self.assertEqual(ins.operand_1, 1)
+        self.assertEqual(list(bus.listeners), ['ROB3'])
+
+    def test_receive_batch(self):
+        """Ensure a batch of Results readies Instructions in age order."""
+        old = IntegerLogical('ROB1', lambda o1, o2: o1 + o2, 'ROB5', 'ROB6')
+        young = IntegerLogical('ROB2', lambda o1, o2: o1 + o2, 'ROB5', 1)
+        self.rs.feed(old)
+        self.rs.feed(young)
+        self.rs.receive_batch([Result('ROB5', 1), Result('ROB6', 2)])
+        self.assertEqual(self.rs.ready, [(0, old), (1, young)])
+
+    def test_dispatch_oldest_ready_first(self):
+        """Ensure ready Instructions are dispatched in the order fed."""
+        self.rs = ReservationStation(capacity=200, width=1)
+        self.rs.register(self.feed_log)
+        old = IntegerLogical('ROB1', lambda o1, o2: o1 + o2, 'ROB9', 1)
+        young = self.generate_add()
+        self.rs.feed(old)
+        self.rs.feed(young)
+        self.rs.trigger()
+        self.rs.receive(Result('ROB9', 1))
+        self.rs.tick()
+        self.rs.tick()
+        self.assertListEqual(self.feed_log.log, [old, young])
+
+    def test_free_units_tracked(self):
+        """Ensure units leave the free pool when fed and rejoin when done."""
+        units = [IntegerUnit(BusLog()) for _ in range(2)]
+        for unit in units:
+            self.rs.register(unit)
+        pool = self.rs.free_units[IntegerLogical]
+        self.assertEqual(list(pool), units)
+        self.assertEqual(self.rs.dispatch_table, {})
+
+        for _ in range(3):
+            self.rs.feed(self.generate_add())
+        self.rs.tick()
+        self.rs.tick()
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(self.rs.dispatch_table[IntegerLogical], [pool])
+
+        for unit in units:
+            for _ in range(IntegerLogical(None, None, 0, 0).DELAY + 1):
+                unit.tick()
+        self.assertEqual(set(pool), set(units))
+        self.rs.tick()
+        self.assertEqual(len(pool), 1)
+        self.rs.flush()
+        self.assertEqual(set(pool), set(units))
+
     def test_flush(self):
         """Ensure flush flushes the ReservationStation and all execution units."""
         log = FlushableLog()
@@ -0,0 +1,66 @@
+import unittest
+
+from procsim.branch.branch_info import BranchInfo
+from procsim.branch.dynamic.branch_history_table import BranchHistoryTable
+from procsim.branch.dynamic.gshare import GShare
+
+class TestGShare(unittest.TestCase):
+
+    def test_weak_taken_initialization(self):
+        """Ensure entries are initialized to weak taken."""
+        blth_str = 'blth r1 r2 100'
+
+        for n_prediction_bits in [1, 2, 4]:
+            gshare = GShare(128, n_prediction_bits, 4)
+            branch_info = gshare.predict(0, blth_str)
+            self.assertEqual(branch_info, BranchInfo(True, 100, 1, 0))
+            # Receive not taken so now weakly not taken, predict not taken.
+            gshare.receive(0, False)
+            self.assertEqual(gshare.global_history.speculative, 0)
+            branch_info = gshare.predict(0, blth_str)
+            self.assertEqual(branch_info, BranchInfo(False, 100, 1, 0))
+
+    def test_correlated_branch(self):
+        """Ensure an alternating branch is learnt, unlike by a BHT."""
+        blth_str = 'blth r1 r2 100'
+        outcomes = [i % 2 == 0 for i in range(200)]
+
+        n_incorrect = {}
+        for predictor in [GShare(16, 2, 4), BranchHistoryTable(16, 2)]:
+            n_incorrect[type(predictor)] = 0
+            for taken in outcomes:
+                if predictor.predict(3, blth_str).taken != taken:
+                    n_incorrect[type(predictor)] += 1
+                predictor.receive(3, taken)
+
+        self.assertLess(n_incorrect[GShare], 5)
+        self.assertGreater(n_incorrect[BranchHistoryTable], 50)
+
+    def test_speculative_history(self):
+        """Ensure predictions update the history until received or flushed."""
+        blth_str = 'blth r1 r2 100'
+        gshare = GShare(16, 2, 4)
+        for _ in range(3):
+            self.assertTrue(gshare.predict(0, blth_str).taken)
+        self.assertEqual(gshare.global_history.speculative, 0b111)
+        self.assertEqual(gshare.global_history.committed, 0)
+
+        # Oldest branch mispredicted, younger branches are flushed.
+        gshare.receive(0, False)
+        self.assertEqual(gshare.global_history.committed, 0)
+        gshare.flush()
+        self.assertEqual(gshare.global_history.speculative, 0)
+        self.assertEqual(gshare.global_history.n_in_flight, 0)
+
+        gshare.predict(0, blth_str)
+        gshare.receive(0, True)
+        self.assertEqual(gshare.global_history.speculative, 0b1)
+        self.assertEqual(gshare.global_history.committed, 0b1)
+
+    def test_receive_without_predict(self):
+        """Ensure outcomes received without predictions update the history."""
+        gshare = GShare(16, 2, 2)
+        for taken in [True, False, True]:
+            gshare.receive(0, taken)
+        self.assertEqual(gshare.global_history.speculative, 0b01)
+        self.assertEqual(gshare.global_history.committed, 0b01)
@@ -0,0 +1,94 @@
+import unittest
+
+from procsim.branch.branch_info import BranchInfo
+from procsim.branch.dynamic.branch_history_table import BranchHistoryTable
+from procsim.branch.dynamic.gshare import GShare
+from procsim.branch.dynamic.loop_predictor import LoopPredictor
+
+BLTH_STR = 'blth r1 r2 1'
+
+def run_loop(predictor, trip_count, n_loops, addr=4):
+    """Predict and receive n_loops executions of a loop branch.
+
+    Returns:
+        Number of mispredictions in the last loop.
+    """
+    for _ in range(n_loops):
+        n_incorrect = 0
+        for iteration in range(trip_count + 1):
+            taken = iteration < trip_count
+            if predictor.predict(addr, BLTH_STR).taken != taken:
+                n_incorrect += 1
+            predictor.receive(addr, taken)
+    return n_incorrect
+
+class TestLoopPredictor(unittest.TestCase):
+
+    def test_standalone(self):
+        """Ensure loop exits are predicted once the trip count is confident."""
+        predictor = LoopPredictor(confidence_threshold=2)
+        self.assertEqual(predictor.predict(4, BLTH_STR),
+                         BranchInfo(True, 1, 5, 4))
+        predictor.flush()
+        # Trip count learnt by the first loop and repeated by the next two.
+        self.assertEqual(run_loop(predictor, 5, 3), 1)
+        self.assertEqual(run_loop(predictor, 5, 1), 0)
+
+    def test_override(self):
+        """Ensure overrides of the base Predictor are counted."""
+        predictor = LoopPredictor(BranchHistoryTable(16, 2))
+        self.assertEqual(run_loop(predictor, 10, 5), 0)
+        self.assertEqual(predictor.n_overrides, 2)
+        self.assertEqual(predictor.n_flushes_removed, 2)
+        self.assertEqual(predictor.n_flushes_added, 0)
+
+    def test_trip_count_change(self):
+        """Ensure a new trip count falls back to the base Predictor."""
+        predictor = LoopPredictor(BranchHistoryTable(16, 2))
+        run_loop(predictor, 10, 5)
+        # Predicted exit at iteration 10 is wrong, then the base Predictor
+        # mispredicts the real exit.
+        self.assertEqual(run_loop(predictor, 12, 1), 2)
+        self.assertEqual(predictor.n_flushes_added, 1)
+        entry = predictor.entries[4]
+        self.assertEqual((entry.trip_count, entry.confidence), (12, 0))
+
+    def test_speculative_iteration(self):
+        """Ensure in-flight predictions count iterations until flushed."""
+        predictor = LoopPredictor(confidence_threshold=1)
+        run_loop(predictor, 3, 2)
+        predictions = [predictor.predict(4, BLTH_STR).taken for _ in range(4)]
+        self.assertEqual(predictions, [True, True, True, False])
+
+        # First branch mispredicted: later predictions are discarded.
+        predictor.receive(4, False)
+        predictor.flush()
+        self.assertEqual(predictor.entries[4].speculative_iteration, 0)
+        self.assertEqual(len(predictor.in_flight), 0)
+
+    def test_receive_without_predict(self):
+        predictor = LoopPredictor(confidence_threshold=1)
+        for _ in range(2):
+            for taken in [True, True, False]:
+                predictor.receive(4, taken)
+        self.assertEqual(predictor.entries[4].trip_count, 2)
+        self.assertTrue(predictor.predict(4, BLTH_STR).taken)
+        self.assertEqual(predictor.n_overrides, 0)
+
+    def test_report(self):
+        predictor = LoopPredictor(BranchHistoryTable(16, 2))
+        run_loop(predictor, 10, 5)
+        self.assertIn('Loop Predictor Flushes Removed: 2', predictor.report())
+
+    def test_override_base_history(self):
+        """Ensure a global history base Predictor follows an override."""
+        gshare = GShare(16, 2, 4)
+        predictor = LoopPredictor(gshare)
+        run_loop(predictor, 8, 3)
+        for iteration in range(9):
+            taken = iteration < 8
+            self.assertEqual(predictor.predict(4, BLTH_STR).taken, taken)
+            self.assertEqual(gshare.global_history.speculative & 1, taken)
+            # Correct predictions, so no flush.
+            predictor.receive(4, taken)
+        self.assertGreater(predictor.n_flushes_removed, 0)
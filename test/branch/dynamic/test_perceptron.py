@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from procsim.branch.branch_info import BranchInfo
+from procsim.branch.dynamic.branch_history_table import BranchHistoryTable
+from procsim.branch.dynamic.perceptron import Perceptron
+
+BLTH_STR = 'blth r1 r2 100'
+
+class TestPerceptron(unittest.TestCase):
+
+    def test_initial_prediction(self):
+        """Ensure zero weights predict taken."""
+        perceptron = Perceptron(16, 4)
+        self.assertEqual(perceptron.predict(3, BLTH_STR),
+                         BranchInfo(True, 100, 4, 3))
+
+    def test_train(self):
+        """Ensure weights move towards the outcome times the history."""
+        perceptron = Perceptron(16, 4)
+        perceptron.global_history.committed = 0b0101
+        perceptron.receive(3, False)
+        np.testing.assert_array_equal(perceptron.weights[3],
+                                      [-1, -1, 1, -1, 1])
+        self.assertEqual(perceptron.output(3, 0b0101), -5)
+        self.assertFalse(perceptron.weights[4].any())
+
+    def test_threshold(self):
+        """Ensure confident correct predictions do not train."""
+        perceptron = Perceptron(1, 2, threshold=2)
+        for _ in range(3):
+            perceptron.receive(0, True)
+        # The output with the all-taken history is now above threshold.
+        weights = perceptron.weights.copy()
+        perceptron.receive(0, True)
+        np.testing.assert_array_equal(perceptron.weights, weights)
+
+    def test_saturate(self):
+        perceptron = Perceptron(1, 2, n_weight_bits=3, threshold=100)
+        for _ in range(10):
+            perceptron.receive(0, True)
+        self.assertEqual(perceptron.weights.max(), 3)
+        for _ in range(20):
+            perceptron.receive(0, False)
+        self.assertEqual(perceptron.weights.min(), -4)
+
+    def test_correlated_branch(self):
+        """Ensure an alternating branch is learnt, unlike by a BHT."""
+        n_incorrect = {}
+        for predictor in [Perceptron(16, 4), BranchHistoryTable(16, 2)]:
+            n_incorrect[type(predictor)] = 0
+            for i in range(200):
+                taken = i % 2 == 0
+                if predictor.predict(3, BLTH_STR).taken != taken:
+                    n_incorrect[type(predictor)] += 1
+                predictor.receive(3, taken)
+        self.assertLess(n_incorrect[Perceptron], 5)
+        self.assertGreater(n_incorrect[BranchHistoryTable], 50)
+
+    def test_flush(self):
+        perceptron = Perceptron(16, 4)
+        perceptron.predict(0, BLTH_STR)
+        self.assertEqual(perceptron.global_history.speculative, 1)
+        perceptron.flush()
+        self.assertEqual(perceptron.global_history.speculative, 0)
@@ -0,0 +1,80 @@
+import random
+import unittest
+
+from procsim.branch.branch_info import BranchInfo
+from procsim.branch.dynamic.gshare import GShare
+from procsim.branch.dynamic.tage import TAGE
+from procsim.branch.dynamic.tage import geometric_lengths
+
+BLTH_STR = 'blth r1 r2 100'
+
+def make_tage():
+    return TAGE(64, 64, 4, 2, 32)
+
+class TestTAGE(unittest.TestCase):
+
+    def test_base_prediction(self):
+        """Ensure the base table predicts when no tagged entry matches."""
+        tage = make_tage()
+        self.assertEqual(tage.predict(5, BLTH_STR), BranchInfo(True, 100, 6, 5))
+        # Mispredicted, so base counter becomes weakly not taken and an entry
+        # is allocated.
+        tage.receive(5, False)
+        self.assertEqual(tage.base_table[5], 1)
+        self.assertEqual(sum(any(tags) for tags in tage.tags), 1)
+
+    def test_allocate_on_mispredict(self):
+        """Ensure a mispredict allocates in a longer history table."""
+        tage = make_tage()
+        tage.receive(5, False)
+        (indices, tags) = tage._hash(5, 0)
+        self.assertEqual(tage.tags[0][indices[0]], tags[0])
+        self.assertEqual(tage.counters[0][indices[0]], -1)
+
+        # The outcome kept the history at 0, so the shortest table's entry now
+        # provides the prediction. It mispredicts: allocate in a longer table.
+        (provider, _, taken, _) = tage._lookup(5, 0)
+        self.assertEqual((provider, taken), (0, False))
+        tage.receive(5, True)
+        self.assertEqual(tage.tags[1][indices[1]], tags[1])
+
+    def test_long_history_correlation(self):
+        """Ensure a branch correlated with one many branches earlier is learnt."""
+        rnd = random.Random(0)
+        n_incorrect = {}
+        for predictor in [make_tage(), GShare(256, 2, 8)]:
+            n = 0
+            for iteration in range(1000):
+                outcome = rnd.random() < 0.5
+                branches = ([(3, outcome)]
+                            + [(10 + i, True) for i in range(12)]
+                            + [(7, outcome)])
+                for (addr, taken) in branches:
+                    predicted = predictor.predict(addr, BLTH_STR).taken
+                    if addr == 7 and iteration >= 500 and predicted != taken:
+                        n += 1
+                    predictor.receive(addr, taken)
+            n_incorrect[type(predictor)] = n
+        self.assertLess(n_incorrect[TAGE], 10)
+        self.assertGreater(n_incorrect[GShare], 150)
+
+    def test_useful_reset(self):
+        tage = make_tage()
+        tage.RESET_PERIOD = 4
+        tage.useful[2][3] = 3
+        for _ in range(4):
+            tage.receive(0, True)
+        self.assertEqual(tage.useful[2][3], 1)
+
+    def test_flush(self):
+        tage = make_tage()
+        tage.predict(0, BLTH_STR)
+        self.assertEqual(tage.global_history.speculative, 1)
+        tage.flush()
+        self.assertEqual(tage.global_history.speculative, 0)
+
+    def test_geometric_lengths(self):
+        self.assertEqual(geometric_lengths(4, 4, 32), [4, 8, 16, 32])
+        self.assertEqual(geometric_lengths(1, 4, 32), [32])
+        with self.assertRaises(ValueError):
+            TAGE(64, 64, 4, 0, 32)
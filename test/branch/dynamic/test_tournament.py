@@ -0,0 +1,54 @@
+import unittest
+
+from procsim.branch.branch_info import BranchInfo
+from procsim.branch.dynamic.branch_history_table import BranchHistoryTable
+from procsim.branch.dynamic.gshare import GShare
+from procsim.branch.dynamic.tournament import Tournament
+
+def make_tournament():
+    return Tournament(BranchHistoryTable(16, 2), GShare(16, 2, 4), 16, 2)
+
+class TestTournament(unittest.TestCase):
+
+    def test_initially_local(self):
+        """Ensure the local component is chosen before any disagreement."""
+        tournament = make_tournament()
+        # Local weakly not taken, global weakly taken.
+        tournament.local_predictor.receive(5, False)
+        branch_info = tournament.predict(5, 'blth r1 r2 100')
+        self.assertEqual(branch_info, BranchInfo(False, 100, 6, 5))
+
+    def test_chooses_correct_component(self):
+        """Ensure an alternating branch switches to the global component."""
+        blth_str = 'blth r1 r2 100'
+        tournament = make_tournament()
+        n_incorrect = 0
+        for i in range(200):
+            taken = i % 2 == 0
+            if tournament.predict(3, blth_str).taken != taken:
+                n_incorrect += 1
+            tournament.receive(3, taken)
+        self.assertLess(n_incorrect, 10)
+        self.assertGreaterEqual(tournament.chooser_table[3],
+                                tournament.threshold)
+
+    def test_flush(self):
+        """Ensure flush restores the global component's history."""
+        tournament = make_tournament()
+        global_history = tournament.global_predictor.global_history
+        tournament.predict(0, 'blth r1 r2 100')
+        self.assertEqual(global_history.speculative, 1)
+        tournament.flush()
+        self.assertEqual(global_history.speculative, 0)
+
+    def test_override_global_history(self):
+        """Ensure the global history follows the chosen prediction."""
+        tournament = make_tournament()
+        global_history = tournament.global_predictor.global_history
+        # Local weakly not taken and chosen, global weakly taken.
+        tournament.local_predictor.receive(5, False)
+        self.assertFalse(tournament.predict(5, 'blth r1 r2 100').taken)
+        self.assertEqual(global_history.speculative, 0)
+        # Chosen prediction correct, so no flush.
+        self.assertTrue(tournament.predict(6, 'blth r1 r2 100').taken)
+        self.assertEqual(global_history.speculative, 0b01)
@@ -0,0 +1,85 @@
+import copy
+import os
+import random
+import tempfile
+import unittest
+
+from procsim.branch.dynamic.branch_history_table import BranchHistoryTable
+from procsim.branch.static.always_taken import AlwaysTaken
+from procsim.branch.static.never_taken import NeverTaken
+from procsim.branch.trace import BranchTrace
+from procsim.register_file import RegisterFile
+import programs.bubble_sort
+
+# Inner loop of 3 iterations inside an outer loop of 4 iterations.
+PROGRAM = ['addi r1 r1 1',
+           'addi r0 r0 1',
+           'blth r0 r2 1',
+           'addi r0 r0 -3',
+           'blth r1 r3 0',
+           'halt']
+
+def record():
+    register_file = RegisterFile(4, init_values={'r2': 3, 'r3': 4})
+    return BranchTrace.record(PROGRAM, register_file)
+
+class TestBranchTrace(unittest.TestCase):
+
+    def test_record(self):
+        trace = record()
+        self.assertEqual(trace.addrs.tolist(), [2, 2, 2, 4] * 4)
+        self.assertEqual(trace.taken.tolist(),
+                         [1, 1, 0, 1] * 3 + [1, 1, 0, 0])
+        self.assertEqual(trace.n_instructions, 4 * (1 + 3 * 2 + 2))
+        self.assertEqual(len(trace), 16)
+
+    def test_evaluate(self):
+        trace = record()
+        result = trace.evaluate(AlwaysTaken())
+        self.assertEqual(result['n_branches'], 16)
+        self.assertEqual(result['n_incorrect'], 5)
+        self.assertEqual(result['accuracy'], 11 / 16)
+        self.assertEqual(result['mpki'], 1000 * 5 / 36)
+        self.assertEqual(trace.evaluate(NeverTaken())['n_incorrect'], 11)
+
+    def test_branch_history_tables(self):
+        """Ensure vectorized tables match replaying each table."""
+        module = programs.bubble_sort
+        trace = BranchTrace.record(module.PROGRAM,
+                                   copy.deepcopy(module.REGISTER_FILE),
+                                   copy.deepcopy(module.MEMORY))
+        geometries = [(n_entries, n_bits) for n_entries in [1, 2, 3, 256]
+                      for n_bits in [1, 2, 3, 16]]
+        results = trace.evaluate_branch_history_tables(geometries)
+        for ((n_entries, n_bits), result) in zip(geometries, results):
+            predictor = BranchHistoryTable(n_entries, n_bits)
+            self.assertEqual(result, trace.evaluate(predictor))
+        self.assertEqual(trace.evaluate_branch_history_tables([]), [])
+
+    def test_branch_history_tables_random(self):
+        """Ensure vectorized tables match replaying a random trace."""
+        program = ['blth r0 r0 0'] * 8
+        addrs = [random.randrange(8) for _ in range(500)]
+        taken = [random.random() < 0.7 for _ in range(500)]
+        trace = BranchTrace(program, addrs, taken, 1000)
+        geometries = [(n_entries, n_bits) for n_entries in [1, 3, 8]
+                      for n_bits in [1, 2, 4]]
+        results = trace.evaluate_branch_history_tables(geometries)
+        for ((n_entries, n_bits), result) in zip(geometries, results):
+            predictor = BranchHistoryTable(n_entries, n_bits)
+            self.assertEqual(result, trace.evaluate(predictor))
+
+        empty = BranchTrace(program, [], [], 0)
+        self.assertEqual(empty.evaluate_branch_history_tables([(4, 2)]),
+                         [empty.evaluate(BranchHistoryTable(4, 2))])
+
+    def test_save_load(self):
+        trace = record()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'trace.npz')
+            trace.save(path)
+            loaded = BranchTrace.load(path)
+        self.assertEqual(loaded.addrs.tolist(), trace.addrs.tolist())
+        self.assertEqual(loaded.taken.tolist(), trace.taken.tolist())
+        self.assertEqual(loaded.n_instructions, trace.n_instructions)
+        self.assertEqual([str(ins) for ins in loaded.program], PROGRAM)
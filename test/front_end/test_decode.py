@@ -15,6 +15,10 @@ class TestDecode(unittest.TestCase):
         # ReorderBuffer full method takes a param. Modify FeedLog to ignore it.
         self.feed_log._full = self.feed_log.full
         self.feed_log.full = lambda x: self.feed_log._full()
+        # ReorderBuffer feed method also takes the BranchInfo. Log it apart.
+        self.branch_infos = []
+        self.feed_log._feed = self.feed_log.feed
+        self.feed_log.feed = self._feed
 
         self.test_strs = [('add r1 r2 r3', ins.Add('r1', 'r2', 'r3')),
                           ('addi r1 r2 5', ins.AddI('r1', 'r2', 5)),
@@ -28,6 +32,10 @@ class TestDecode(unittest.TestCase):
                           for (ins_str, exp_ins) in self.test_strs]
         self.test_strs[7][0]['branch_info'] = BranchInfo(False, 10, 9, 8)
 
+    def _feed(self, instruction, branch_info=None):
+        self.feed_log._feed(instruction)
+        self.branch_infos.append(branch_info)
+
     def test_correct_result(self):
         """Test correct Result computed and fed by Decode stage."""
         for delay in [1, 2, 5, 10]:
@@ -44,9 +52,8 @@ class TestDecode(unittest.TestCase):
                     self.assertTrue(instruction_list_equal(self.feed_log.log, exp_log))
                     unit.tick()
                 exp_log.append(exp_ins)
-                if isinstance(exp_ins, ins.Blth):
-                    exp_log[-1].branch_info = act_ins['branch_info']
                 self.assertTrue(instruction_list_equal(self.feed_log.log, exp_log))
+                self.assertIs(self.branch_infos[-1], act_ins.get('branch_info'))
 
     def test_full(self):
         """Test Decode full method updates correctly after ticks."""
@@ -73,8 +80,6 @@ class TestDecode(unittest.TestCase):
 
     def test_decode_str(self):
         for act_ins, exp_ins in self.test_strs:
-            if isinstance(exp_ins, ins.Blth):
-                exp_ins.branch_info = act_ins['branch_info']
             self.assertTrue(instruction_list_equal([decode._decode(act_ins)],
                                                    [exp_ins]))
 
@@ -118,6 +123,18 @@ class TestDecode(unittest.TestCase):
 
                     self.assertTrue(instruction_list_equal(self.feed_log.log, exp_ins))
 
+    def test_decode_instruction(self):
+        """Ensure fetched Instructions are used without modifying them."""
+        blth = ins.Blth('r1', 'r2', 10)
+        branch_info = BranchInfo(False, 10, 9, 8)
+        decoded = decode._decode({'instruction': blth,
+                                  'branch_info': branch_info})
+        self.assertIs(decoded, blth)
+        self.assertFalse(hasattr(blth, 'branch_info'))
+
+        add = ins.Add('r1', 'r2', 'r3')
+        self.assertIs(decode._decode({'instruction': add}), add)
+
     def test_halt(self):
         """Ensure Halt is decoded."""
         unit = decode.Decode(self.feed_log, capacity=12)
@@ -44,9 +44,9 @@ class TestFetch(unittest.TestCase):
             while n_fetch <= n_inst:
                 fetch.tick()
                 n_fetch += width
-                self.assertListEqual(self.feed_log.log,
-                                     [{'instruction_str': ins_str}
-                                      for ins_str in test_program_str[:n_fetch]])
+                self.assertListEqual([str(food['instruction'])
+                                      for food in self.feed_log.log],
+                                     test_program_str[:n_fetch])
                 self.assertEqual(self.reg_file['pc'], min(n_fetch, n_inst))
             # PC is now beyond # program instructions. Tick ensures Fetch handles
             # this gracefully.
@@ -62,10 +62,9 @@ class TestFetch(unittest.TestCase):
                       self.branch_predictor)
         fetch.tick()
 
-        exp_ins = {'instruction_str': ins_str,
-                   'branch_info': BranchInfo(False, 10, 1, 0)}
-
-        self.assertDictEqual(self.feed_log.log[0], exp_ins)
+        food = self.feed_log.log[0]
+        self.assertEqual(str(food['instruction']), ins_str)
+        self.assertEqual(food['branch_info'], BranchInfo(False, 10, 1, 0))
 
     def test_flush(self):
         """Ensure flush flushes Fetch and Decode."""
@@ -24,6 +24,7 @@ class TestFetchDecodeIntegration(unittest.TestCase):
 
         self.feed_log = FeedLog()
         self.feed_log.full = lambda _: False
+        self.feed_log.feed = lambda ins, branch_info=None: self.feed_log.log.append(ins)
         self.decode = Decode(self.feed_log)
 
         self.reg_file = RegisterFile(10)
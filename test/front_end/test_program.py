@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+
+from procsim.front_end import program
+from test.front_end.utils import instruction_list_equal
+import procsim.front_end.instructions as ins
+
+TEST_PROGRAM = ['add r1 r2 r3',
+                'addi r1 r2 5',
+                'sub rd r0 r9',
+                'subi r1 r2 10',
+                'mul r1 r2 r3',
+                'muli r1 r2 3',
+                'ldr r0 r1',
+                'str r99 r100',
+                'j 1000',
+                'blth r1 r2 10',
+                'halt']
+
+EXP_PROGRAM = [ins.Add('r1', 'r2', 'r3'),
+               ins.AddI('r1', 'r2', 5),
+               ins.Sub('rd', 'r0', 'r9'),
+               ins.SubI('r1', 'r2', 10),
+               ins.Mul('r1', 'r2', 'r3'),
+               ins.MulI('r1', 'r2', 3),
+               ins.Load('r0', 'r1'),
+               ins.Store('r99', 'r100'),
+               ins.Jump(1000),
+               ins.Blth('r1', 'r2', 10),
+               ins.Halt()]
+
+class TestProgram(unittest.TestCase):
+
+    def setUp(self):
+        program._cache.clear()
+
+    def test_parse(self):
+        for (ins_str, exp_ins) in zip(TEST_PROGRAM, EXP_PROGRAM):
+            self.assertTrue(instruction_list_equal([program.parse(ins_str)],
+                                                   [exp_ins]))
+            self.assertEqual(str(program.parse(ins_str)), ins_str)
+
+    def test_parse_invalid(self):
+        """Ensure unknown opcodes and wrong operands raise ValueError."""
+        for ins_str in ['nop', 'add r1 r2', 'addi r1 r2 x', 'j', 'halt r1',
+                        'blth r1 r2 10 11']:
+            with self.assertRaises(ValueError):
+                program.parse(ins_str)
+
+    def test_compile_invalid_address(self):
+        with self.assertRaisesRegex(ValueError, 'address 1'):
+            program.compile_program(['halt', 'bad r1'])
+
+    def test_compile_cached(self):
+        """Ensure a program is only parsed once per process."""
+        compiled = program.compile_program(TEST_PROGRAM)
+        self.assertIsInstance(compiled, tuple)
+        self.assertTrue(instruction_list_equal(compiled, EXP_PROGRAM))
+        self.assertIs(program.compile_program(list(TEST_PROGRAM)), compiled)
+        self.assertIs(program.compile_program(compiled), compiled)
+
+    def test_compile_disk_cache(self):
+        """Ensure compiled programs are written to and read from cache_dir."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            compiled = program.compile_program(TEST_PROGRAM, cache_dir)
+            path = os.path.join(cache_dir,
+                                program.program_hash(TEST_PROGRAM) + '.pickle')
+            self.assertTrue(os.path.exists(path))
+
+            program._cache.clear()
+            loaded = program.compile_program(TEST_PROGRAM, cache_dir)
+            self.assertIsNot(loaded, compiled)
+            self.assertTrue(instruction_list_equal(loaded, EXP_PROGRAM))
+
+    def test_compile_bad_disk_cache(self):
+        """Ensure a cache file that cannot be loaded is rebuilt."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir,
+                                program.program_hash(TEST_PROGRAM) + '.pickle')
+            # A pickle referencing a missing module fails with ImportError.
+            with open(path, 'wb') as f:
+                f.write(b'cno_such_module\nNoSuchClass\n.')
+
+            program._cache.clear()
+            compiled = program.compile_program(TEST_PROGRAM, cache_dir)
+            self.assertTrue(instruction_list_equal(compiled, EXP_PROGRAM))
+
+            program._cache.clear()
+            loaded = program.compile_program(TEST_PROGRAM, cache_dir)
+            self.assertTrue(instruction_list_equal(loaded, EXP_PROGRAM))
+
+    def test_program_hash_version(self):
+        """Ensure the cache key changes with CACHE_VERSION."""
+        key = program.program_hash(TEST_PROGRAM)
+        version = program.CACHE_VERSION
+        try:
+            program.CACHE_VERSION += 1
+            self.assertNotEqual(program.program_hash(TEST_PROGRAM), key)
+        finally:
+            program.CACHE_VERSION = version
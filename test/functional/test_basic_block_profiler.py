@@ -0,0 +1,47 @@
+import unittest
+
+from procsim.functional.basic_block_profiler import BasicBlockProfiler
+from procsim.register_file import RegisterFile
+
+# Two loops of 100 iterations, the first of 3 and the second of 4
+# instructions.
+PROGRAM = ['addi r0 r0 1',
+           'mul r2 r2 r0',
+           'blth r0 r1 0',
+           'addi r3 r3 1',
+           'add r4 r4 r3',
+           'sub r5 r4 r3',
+           'blth r3 r1 3',
+           'halt']
+
+def make_profiler(interval):
+    register_file = RegisterFile(6, init_values={'r1': 100})
+    return BasicBlockProfiler(PROGRAM, register_file, interval=interval)
+
+class TestBasicBlockProfiler(unittest.TestCase):
+
+    def test_vectors(self):
+        profiler = make_profiler(interval=300)
+        vectors = profiler.run()
+        self.assertTrue(profiler.emulator.halted)
+        self.assertEqual(profiler.block_starts(), [0, 3])
+        self.assertEqual(vectors.tolist(), [[300, 0],
+                                            [0, 300],
+                                            [0, 100]])
+
+    def test_split_blocks(self):
+        """Ensure blocks split by an interval boundary are counted."""
+        profiler = make_profiler(interval=50)
+        vectors = profiler.run()
+        self.assertEqual(vectors.sum(), 700)
+        self.assertTrue((vectors.sum(axis=1)[:-1] == 50).all())
+
+    def test_max_instructions(self):
+        profiler = make_profiler(interval=40)
+        vectors = profiler.run(max_instructions=100)
+        self.assertFalse(profiler.emulator.halted)
+        self.assertEqual(vectors.sum(axis=1).tolist(), [40, 40, 20])
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            make_profiler(interval=0)
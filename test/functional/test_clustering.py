@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+
+from procsim.functional.clustering import kmeans
+from procsim.functional.clustering import normalize
+from procsim.functional.clustering import random_projection
+from procsim.functional.clustering import select_intervals
+
+class TestClustering(unittest.TestCase):
+
+    def setUp(self):
+        # Three phases of 6, 3 and 1 intervals.
+        vectors = np.array([[100, 0, 0, 0]] * 6
+                           + [[0, 100, 0, 0]] * 3
+                           + [[0, 0, 50, 50]])
+        noise = np.random.RandomState(0).uniform(0, 2, vectors.shape)
+        self.vectors = vectors + noise
+
+    def test_normalize(self):
+        vectors = normalize([[1, 3], [0, 0]])
+        self.assertEqual(vectors.tolist(), [[0.25, 0.75], [0, 0]])
+
+    def test_random_projection(self):
+        vectors = np.random.RandomState(0).uniform(size=(5, 40))
+        projected = random_projection(vectors, n_dims=15, seed=0)
+        self.assertEqual(projected.shape, (5, 15))
+        self.assertIs(random_projection(projected, n_dims=15), projected)
+
+    def test_kmeans(self):
+        points = normalize(self.vectors)
+        centroids, labels = kmeans(points, 3, seed=0)
+        self.assertEqual(centroids.shape, (3, 4))
+        self.assertEqual(len(set(labels[:6])), 1)
+        self.assertEqual(len(set(labels[6:9])), 1)
+        self.assertEqual(len(set(labels)), 3)
+        with self.assertRaises(ValueError):
+            kmeans(points, 11)
+
+    def test_select_intervals(self):
+        selected = select_intervals(self.vectors, threshold=0.99)
+        self.assertEqual(len(selected), 3)
+        intervals = [interval for (interval, _) in selected]
+        self.assertLess(intervals[0], 6)
+        self.assertTrue(6 <= intervals[1] < 9)
+        self.assertEqual(intervals[2], 9)
+        weights = [weight for (_, weight) in selected]
+        self.assertEqual(weights, [0.6, 0.3, 0.1])
+
+    def test_single_phase(self):
+        selected = select_intervals(np.ones((4, 3)))
+        self.assertEqual(selected, [(0, 1.0)])
@@ -0,0 +1,147 @@
+import copy
+import itertools
+import unittest
+
+from procsim.branch.dynamic.branch_history_table import BranchHistoryTable
+from procsim.functional.emulator import Emulator
+from procsim.memory import Memory
+from procsim.register_file import RegisterFile
+from procsim.run.simulator import Simulator
+import programs.bubble_sort
+import programs.fib
+import programs.inner_product
+import programs.vector_addition
+
+class TestEmulator(unittest.TestCase):
+
+    def test_arithmetic(self):
+        program = ['addi r0 r0 7',
+                   'subi r1 r0 2',
+                   'muli r2 r1 3',
+                   'add r3 r0 r2',
+                   'sub r4 r0 r2',
+                   'mul r5 r0 r1',
+                   'halt']
+        register_file = RegisterFile(6)
+        emulator = Emulator(program, register_file)
+        self.assertTrue(emulator.run())
+        self.assertEqual([register_file['r%d' % i] for i in range(6)],
+                         [7, 5, 15, 22, -8, 35])
+        self.assertEqual(emulator.n_committed, 6)
+        self.assertEqual(register_file['pc'], 6)
+
+    def test_memory(self):
+        program = ['addi r0 r0 3',
+                   'addi r1 r1 9',
+                   'str r1 r0',
+                   'ldr r2 r0',
+                   'halt']
+        register_file = RegisterFile(3)
+        memory = Memory(4)
+        Emulator(program, register_file, memory).run()
+        self.assertEqual(memory[3], 9)
+        self.assertEqual(register_file['r2'], 9)
+
+    def test_branches(self):
+        program = ['j 2',
+                   'addi r1 r1 100',
+                   'addi r0 r0 1',
+                   'blth r0 r2 2',
+                   'halt']
+        register_file = RegisterFile(3, init_values={'r2': 5})
+        emulator = Emulator(program, register_file)
+        emulator.run()
+        self.assertEqual(register_file['r0'], 5)
+        self.assertEqual(register_file['r1'], 0)
+        self.assertEqual(emulator.n_jumps, 1)
+        self.assertEqual(emulator.n_branches, 5)
+        self.assertEqual(emulator.n_taken, 4)
+        self.assertEqual(emulator.n_committed, 10)
+
+    def test_train_branch_predictor(self):
+        program = ['addi r0 r0 1',
+                   'blth r0 r1 0',
+                   'halt']
+        register_file = RegisterFile(2, init_values={'r1': 3})
+        predictor = BranchHistoryTable(n_entries=4, n_prediction_bits=2)
+        Emulator(program, register_file, branch_predictor=predictor).run()
+        # Taken, taken, not taken from weakly taken.
+        self.assertEqual(predictor.history_table[1], 2)
+
+    def test_max_instructions(self):
+        program = ['addi r0 r0 1', 'j 0']
+        register_file = RegisterFile(1)
+        emulator = Emulator(program, register_file)
+        self.assertFalse(emulator.run(max_instructions=10))
+        self.assertEqual(register_file['r0'], 10)
+        self.assertFalse(emulator.run(max_instructions=5))
+        self.assertEqual(register_file['r0'], 15)
+        self.assertEqual(emulator.n_committed, 15)
+
+    def test_end_of_program(self):
+        register_file = RegisterFile(1)
+        emulator = Emulator(['addi r0 r0 1'], register_file)
+        self.assertFalse(emulator.run())
+        self.assertEqual(register_file['pc'], 1)
+
+    def test_matches_simulator(self):
+        """Ensure the Emulator and Simulator produce the same final state."""
+        for (module, compile_blocks) in itertools.product([programs.bubble_sort,
+                                                           programs.fib,
+                                                           programs.inner_product,
+                                                           programs.vector_addition],
+                                                          [False, True]):
+            register_file = copy.deepcopy(module.REGISTER_FILE)
+            memory = copy.deepcopy(module.MEMORY)
+            emulator = Emulator(module.PROGRAM, register_file, memory,
+                                compile_blocks=compile_blocks)
+            self.assertTrue(emulator.run())
+
+            simulator = Simulator(None,
+                                  module.PROGRAM,
+                                  copy.deepcopy(module.REGISTER_FILE),
+                                  copy.deepcopy(module.MEMORY))
+            stats = simulator.run()
+            self.assertTrue(stats.halted)
+            self.assertEqual(emulator.n_committed, stats.n_committed)
+            gprs = register_file.names[:-1]
+            self.assertEqual([register_file[r] for r in gprs],
+                             [simulator.register_file[r] for r in gprs])
+            if memory is not None:
+                self.assertEqual(memory.tolist(),
+                                 simulator.memory.tolist())
+
+    def test_compiled_blocks(self):
+        """Ensure compiled blocks match the interpreter under any limits."""
+        program = ['addi r0 r0 1',
+                   'ldr r2 r3',
+                   'add r2 r2 r0',
+                   'str r2 r3',
+                   'blth r2 r1 6',
+                   'addi r4 r4 1',
+                   'blth r0 r1 0',
+                   'j 8',
+                   'halt']
+        for limits in [[None], [1, 2, 3, 5, 8, 13, None], [4] * 100]:
+            results = []
+            for compile_blocks in [False, True]:
+                register_file = RegisterFile(5, init_values={'r1': 20})
+                memory = Memory(1)
+                memory[0] = 3
+                predictor = BranchHistoryTable(n_entries=8,
+                                               n_prediction_bits=2)
+                emulator = Emulator(program, register_file, memory,
+                                    branch_predictor=predictor,
+                                    compile_blocks=compile_blocks)
+                emulator.block_counts = {}
+                for limit in limits:
+                    emulator.run(max_instructions=limit)
+                results.append((register_file.values, memory[0],
+                                emulator.halted, emulator.n_committed,
+                                emulator.n_jumps, emulator.n_branches,
+                                emulator.n_taken, emulator.block_counts,
+                                predictor.history_table))
+            self.assertEqual(results[0], results[1])
+            self.assertTrue(results[1][2])
+            if limits == [None]:
+                self.assertEqual(sorted(emulator.blocks), [0, 5, 6, 7, 8])
@@ -0,0 +1,36 @@
+import unittest
+
+from procsim.run.benchmark import Benchmark
+from procsim.run.benchmark import compare
+from procsim.run.benchmark import run_benchmark
+from procsim.run.benchmark import run_benchmarks
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_run_benchmark(self):
+        result = run_benchmark(Benchmark('fib', 'programs.fib',
+                                         {'superscalar_width': 2},
+                                         max_cycles=100))
+        self.assertEqual(result['n_cycles'], 100)
+        self.assertGreater(result['cycles_per_second'], 0)
+        self.assertGreater(result['peak_rss'], 0)
+
+    def test_run_benchmarks(self):
+        """Ensure benchmarks run in spawned processes keep the fastest repeat."""
+        benchmark = Benchmark('fib', 'programs.fib', max_cycles=50)
+        results = run_benchmarks([benchmark], repeat=2)
+        self.assertEqual(list(results), ['fib'])
+        self.assertEqual(results['fib']['n_cycles'], 50)
+        self.assertGreater(results['fib']['peak_rss'], 0)
+
+    def test_compare(self):
+        result = run_benchmark(Benchmark('fib', 'programs.fib', max_cycles=50))
+        faster = dict(result, cycles_per_second=result['cycles_per_second'] / 2)
+        changed = dict(result, n_cycles=result['n_cycles'] + 1)
+
+        lines = compare({'fib': result}, {'fib': faster})
+        self.assertTrue(lines[1].endswith('2.00x'))
+        lines = compare({'fib': result}, {'fib': changed})
+        self.assertTrue(lines[1].endswith('MISMATCH'))
+        lines = compare({'fib': result}, {})
+        self.assertEqual(len(lines), 2)
@@ -0,0 +1,34 @@
+import unittest
+
+from procsim.run.branch_eval import evaluate
+from procsim.run.branch_eval import load_trace
+from procsim.run.config import Config
+
+class TestBranchEval(unittest.TestCase):
+
+    def test_evaluate(self):
+        trace = load_trace('programs.bubble_sort')
+        rows = evaluate(trace,
+                        ['branch_history_table', 'never_taken'],
+                        [(16, 1), (16, 2)])
+        self.assertEqual([(row['predictor'], row['n_entries'])
+                          for row in rows],
+                         [('branch_history_table', 16),
+                          ('branch_history_table', 16),
+                          ('never_taken', None)])
+        for row in rows:
+            self.assertEqual(row['n_branches'], len(trace))
+            self.assertGreater(row['accuracy'], 0)
+
+    def test_evaluate_config(self):
+        """Ensure predictor sizes and loop overrides come from the Config."""
+        trace = load_trace('programs.bubble_sort')
+        small = evaluate(trace, ['gshare'], [],
+                         Config(gshare=(2, 1, 1)))[0]
+        large = evaluate(trace, ['gshare'], [])[0]
+        self.assertNotEqual(small['n_incorrect'], large['n_incorrect'])
+
+        plain = evaluate(trace, ['branch_history_table'], [(16, 2)])[0]
+        loop = evaluate(trace, ['branch_history_table'], [(16, 2)],
+                        Config(loop_override=True))[0]
+        self.assertLess(loop['n_incorrect'], plain['n_incorrect'])
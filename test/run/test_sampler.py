@@ -0,0 +1,90 @@
+from copy import deepcopy
+import math
+import unittest
+
+from procsim.run.config import Config
+from procsim.run.sample_stats import SampleStats
+from procsim.run.sample_stats import normal_quantile
+from procsim.run.sampler import Sampler
+from procsim.run.simulator import Simulator
+import programs.dancing_branch
+
+class TestSampler(unittest.TestCase):
+
+    def make_sampler(self, **kwargs):
+        module = programs.dancing_branch
+        return Sampler(Config(),
+                       module.PROGRAM,
+                       deepcopy(module.REGISTER_FILE),
+                       deepcopy(module.MEMORY),
+                       **kwargs)
+
+    def test_estimate(self):
+        """Ensure the estimated cycles are close to a detailed run."""
+        module = programs.dancing_branch
+        detailed = Simulator(Config(),
+                             module.PROGRAM,
+                             deepcopy(module.REGISTER_FILE),
+                             deepcopy(module.MEMORY)).run()
+        stats = self.make_sampler(interval=600, warmup=100, window=200).run()
+        self.assertTrue(stats.halted)
+        self.assertEqual(stats.n_committed, detailed.n_committed)
+        self.assertEqual(stats.n_windows, 10)
+        self.assertLess(abs(stats.n_cycles - detailed.n_cycles),
+                        0.05 * detailed.n_cycles)
+        low, high = stats.ipc_interval
+        self.assertLessEqual(low, stats.instructions_per_cycle)
+        self.assertLessEqual(stats.instructions_per_cycle, high)
+
+    def test_predictor_kept_warm(self):
+        sampler = self.make_sampler(interval=600, warmup=100, window=200)
+        history_table = sampler.branch_predictor.history_table
+        sampler.run(max_instructions=600)
+        self.assertFalse(sampler.emulator.halted)
+        self.assertEqual(sampler.emulator.n_committed, 600)
+        self.assertTrue(history_table)
+
+    def test_architectural_state(self):
+        """Ensure detailed windows do not change the Emulator's state."""
+        module = programs.dancing_branch
+        sampler = self.make_sampler(interval=300, warmup=50, window=100)
+        sampler.run()
+        simulator = Simulator(Config(),
+                              module.PROGRAM,
+                              deepcopy(module.REGISTER_FILE),
+                              deepcopy(module.MEMORY))
+        simulator.run()
+        gprs = simulator.register_file.names[:-1]
+        self.assertEqual([sampler.emulator.register_file[r] for r in gprs],
+                         [simulator.register_file[r] for r in gprs])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.make_sampler(interval=100, warmup=50, window=100)
+        with self.assertRaises(ValueError):
+            self.make_sampler(window=0)
+
+class TestSampleStats(unittest.TestCase):
+
+    def test_interval(self):
+        stats = SampleStats(n_committed=1000,
+                            windows=[(100, 200), (100, 100), (100, 150)],
+                            halted=True,
+                            host_time=1.0)
+        self.assertAlmostEqual(stats.cycles_per_instruction, 1.5)
+        self.assertAlmostEqual(stats.n_cycles, 1500)
+        half_width = 1.959964 * 0.5 / math.sqrt(3)
+        self.assertAlmostEqual(stats.cpi_half_width, half_width, places=5)
+        low, high = stats.ipc_interval
+        self.assertAlmostEqual(low, 1 / (1.5 + half_width))
+        self.assertAlmostEqual(high, 1 / (1.5 - half_width))
+
+    def test_single_window(self):
+        stats = SampleStats(1000, [(100, 200)], True, 1.0)
+        self.assertEqual(stats.instructions_per_cycle, 0.5)
+        self.assertEqual(stats.ipc_interval, (0.0, math.inf))
+
+    def test_normal_quantile(self):
+        self.assertAlmostEqual(normal_quantile(0.975), 1.959964, places=5)
+        self.assertAlmostEqual(normal_quantile(0.5), 0.0, places=9)
+        self.assertAlmostEqual(normal_quantile(0.05), -1.644854, places=5)
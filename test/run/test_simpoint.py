@@ -0,0 +1,49 @@
+from copy import deepcopy
+import os
+import tempfile
+import unittest
+
+from procsim.functional.clustering import select_intervals
+from procsim.run.config import Config
+from procsim.run.simpoint import profile
+from procsim.run.simpoint import simulate
+from procsim.run.simpoint import write_checkpoints
+from procsim.run.simulator import Simulator
+import programs.bubble_sort
+
+class TestSimpoint(unittest.TestCase):
+
+    def test_estimate(self):
+        """Ensure the weighted CPI of the selected intervals is close."""
+        module = programs.bubble_sort
+        detailed = Simulator(Config(),
+                             module.PROGRAM,
+                             deepcopy(module.REGISTER_FILE),
+                             deepcopy(module.MEMORY)).run()
+
+        vectors = profile(module, interval=200)
+        self.assertEqual(vectors.sum(), detailed.n_committed)
+        selected = select_intervals(vectors)
+        self.assertAlmostEqual(sum(weight for (_, weight) in selected), 1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            points = write_checkpoints(Config(), module, 200, selected,
+                                       directory, warmup=100)
+            self.assertEqual(len(os.listdir(directory)), len(selected))
+            cpi = simulate(points, 200)
+        self.assertEqual(module.REGISTER_FILE['pc'], 0)
+        detailed_cpi = detailed.n_cycles / detailed.n_committed
+        self.assertLess(abs(cpi - detailed_cpi), 0.05 * detailed_cpi)
+
+    def test_drop_empty_interval(self):
+        """Ensure intervals past the end of the program are dropped."""
+        module = programs.bubble_sort
+        with tempfile.TemporaryDirectory() as directory:
+            points = write_checkpoints(Config(), module, 200, [(0, 1.0)],
+                                       directory)
+            cpi = simulate(points, 200)
+            points = write_checkpoints(Config(), module, 200,
+                                       [(0, 0.25), (10**6, 0.75)], directory)
+            self.assertAlmostEqual(simulate(points, 200), cpi)
+        self.assertEqual([point['dropped'] for point in points], [False, True])
+        self.assertNotIn('cpi', points[1])
@@ -0,0 +1,112 @@
+import copy
+import os
+import tempfile
+import unittest
+
+from procsim.memory import Memory
+from procsim.register_file import RegisterFile
+from procsim.run.config import Config
+from procsim.run.simulator import Simulator
+
+# Sum of memory[0:LEN] into r3.
+LEN = 10
+PROGRAM = ['addi r0 r0 %d' % LEN,
+           'ldr r2 r1',
+           'add r3 r3 r2',
+           'addi r1 r1 1',
+           'blth r1 r0 1',
+           'halt']
+
+def make_simulator(config=None):
+    memory = Memory(LEN)
+    for i in range(LEN):
+        memory[i] = i
+    return Simulator(config, PROGRAM, RegisterFile(4), memory)
+
+class TestSimulator(unittest.TestCase):
+
+    def test_run_to_halt(self):
+        for config in [Config(),
+                       Config(superscalar_width=1, capacity=4),
+                       Config(branch_predictor='never_taken'),
+                       Config(branch_predictor='gshare'),
+                       Config(branch_predictor='tournament'),
+                       Config(branch_predictor='tage'),
+                       Config(branch_predictor='perceptron'),
+                       Config(branch_predictor='loop'),
+                       Config(loop_override=True),
+                       Config(fast_forward=True)]:
+            simulator = make_simulator(config)
+            stats = simulator.run()
+            self.assertTrue(stats.halted)
+            self.assertTrue(simulator.halted)
+            self.assertEqual(simulator.register_file['r3'], sum(range(LEN)))
+            self.assertEqual(stats.n_cycles, simulator.clock.n_ticks)
+
+    def test_repeatable(self):
+        """Ensure independent Simulators in one process give equal Stats."""
+        first = make_simulator().run().as_dict()
+        second = make_simulator().run().as_dict()
+        for stats in [first, second]:
+            del stats['host_time']
+            del stats['cycles_per_second']
+        self.assertEqual(first, second)
+
+    def test_step(self):
+        simulator = make_simulator()
+        self.assertFalse(simulator.step(5))
+        self.assertEqual(simulator.clock.n_ticks, 5)
+        n_cycles = simulator.run().n_cycles
+
+        simulator = make_simulator()
+        while not simulator.step():
+            pass
+        self.assertEqual(simulator.stats().n_cycles, n_cycles)
+
+    def test_limits(self):
+        for fast_forward in [False, True]:
+            config = Config(fast_forward=fast_forward)
+            stats = make_simulator(config).run(max_cycles=7)
+            self.assertFalse(stats.halted)
+            self.assertEqual(stats.n_cycles, 7)
+
+            stats = make_simulator(config).run(max_instructions=12)
+            self.assertFalse(stats.halted)
+            self.assertGreaterEqual(stats.n_committed, 12)
+            self.assertLess(stats.n_committed, 12 + config.superscalar_width)
+
+    def test_invalid_branch_predictor(self):
+        with self.assertRaises(ValueError):
+            Config(branch_predictor='foo')
+
+    def test_checkpoint(self):
+        """Ensure a restored Simulator continues exactly as the original."""
+        for config in [Config(), Config(fast_forward=True)]:
+            expected = make_simulator(config).run().as_dict()
+            del expected['host_time']
+            del expected['cycles_per_second']
+
+            simulator = make_simulator(config)
+            simulator.run(max_cycles=13)
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'checkpoint')
+                simulator.save_checkpoint(path)
+                restored = Simulator.load_checkpoint(path)
+            self.assertEqual(restored.clock.n_ticks, 13)
+            self.assertEqual(restored.register_file, simulator.register_file)
+
+            fork = copy.deepcopy(restored)
+            for sim in [restored, fork]:
+                stats = sim.run().as_dict()
+                del stats['host_time']
+                del stats['cycles_per_second']
+                self.assertEqual(stats, expected)
+                self.assertEqual(sim.register_file['r3'], sum(range(LEN)))
+
+    def test_invalid_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'checkpoint')
+            with open(path, 'wb') as f:
+                f.write(b'not a checkpoint')
+            with self.assertRaises(ValueError):
+                Simulator.load_checkpoint(path)
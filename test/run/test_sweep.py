@@ -0,0 +1,62 @@
+import csv
+import io
+import json
+import unittest
+
+from procsim.run.config import Config
+from procsim.run.sweep import run_sweep
+from procsim.run.sweep import sweep_points
+from procsim.run.sweep import write_csv
+from procsim.run.sweep import write_json
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = {'superscalar_width': [1, 2, 4],
+                     'capacity': [8, 32],
+                     'branch_predictor': ['never_taken', 'always_taken']}
+
+    def test_cartesian_product(self):
+        points = sweep_points(['a', 'b'], self.grid)
+        self.assertEqual(len(points), 2 * 3 * 2 * 2)
+        self.assertEqual(len(set(repr(p) for p in points)), len(points))
+        self.assertIn(('b', Config(superscalar_width=2,
+                                   capacity=8,
+                                   branch_predictor='always_taken')),
+                      points)
+
+    def test_sample(self):
+        points = sweep_points(['a'], self.grid, sample=5, seed=0)
+        self.assertEqual(len(points), 5)
+        self.assertEqual(points, sweep_points(['a'], self.grid, sample=5, seed=0))
+        all_points = sweep_points(['a'], self.grid)
+        for point in points:
+            self.assertIn(point, all_points)
+
+    def test_run_sweep(self):
+        points = sweep_points(['programs.fib'], {'superscalar_width': [1, 4]})
+        serial = run_sweep(points, processes=1)
+        parallel = run_sweep(points, processes=2)
+        for rows in [serial, parallel]:
+            self.assertEqual([row['superscalar_width'] for row in rows], [1, 4])
+            for row in rows:
+                self.assertTrue(row['halted'])
+                self.assertEqual(row['n_committed'], 182)
+        self.assertEqual([row['n_cycles'] for row in serial],
+                         [row['n_cycles'] for row in parallel])
+
+    def test_write(self):
+        points = sweep_points(['programs.fib'], {'capacity': [4]})
+        rows = run_sweep(points, processes=1, max_cycles=50)
+
+        out = io.StringIO()
+        write_csv(rows, out)
+        out.seek(0)
+        csv_rows = list(csv.DictReader(out))
+        self.assertEqual(len(csv_rows), 1)
+        self.assertEqual(csv_rows[0]['n_cycles'], '50')
+        self.assertEqual(csv_rows[0]['program'], 'programs.fib')
+
+        out = io.StringIO()
+        write_json(rows, out)
+        self.assertEqual(json.loads(out.getvalue())[0]['n_cycles'], 50)
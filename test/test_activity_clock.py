@@ -0,0 +1,132 @@
+import math
+import unittest
+
+from procsim.activity_clock import ActivityClock
+from procsim.back_end.broadcast_bus import BroadcastBus
+from procsim.back_end.branch_unit import BranchUnit
+from procsim.back_end.integer_unit import IntegerUnit
+from procsim.back_end.load_store_queue import LoadStoreQueue
+from procsim.back_end.reorder_buffer import ReorderBuffer
+from procsim.back_end.reservation_station import ReservationStation
+from procsim.branch.dynamic.branch_history_table import BranchHistoryTable
+from procsim.clock import Clock
+from procsim.clocked import Clocked
+from procsim.end_of_program import EndOfProgram
+from procsim.front_end.decode import Decode
+from procsim.front_end.fetch import Fetch
+from procsim.memory import Memory
+from procsim.register_file import RegisterFile
+
+# Pointer chasing loop: each Load depends on the previous one.
+CHASE_PROGRAM = ['ldr r1 r1',
+                 'ldr r1 r1',
+                 'addi r3 r3 2',
+                 'str r3 r1',
+                 'blth r3 r2 0',
+                 'halt']
+
+class TestActivityClock(unittest.TestCase):
+
+    def test_skip_idle_components(self):
+        clock = ActivityClock()
+        busy = TimerStub(idle_cycles=0)
+        idle = TimerStub(idle_cycles=0, idle=True)
+        clock.register(busy)
+        clock.register(idle)
+        clock.tick()
+        self.assertEqual((busy.n_operate, busy.n_trigger), (1, 1))
+        self.assertEqual((idle.n_operate, idle.n_trigger), (0, 0))
+        self.assertEqual(clock.n_ticks, 1)
+
+    def test_fast_forward(self):
+        clock = ActivityClock()
+        stubs = [TimerStub(idle_cycles=5), TimerStub(idle_cycles=math.inf)]
+        for stub in stubs:
+            clock.register(stub)
+        clock.tick()
+        self.assertEqual(clock.n_ticks, 5)
+        self.assertEqual(clock.n_skipped, 5)
+        for stub in stubs:
+            self.assertEqual(stub.skipped, 5)
+            self.assertEqual(stub.n_operate, 0)
+
+    def test_fast_forward_max_cycles(self):
+        clock = ActivityClock()
+        stub = TimerStub(idle_cycles=5)
+        clock.register(stub)
+        clock.tick(max_cycles=2)
+        self.assertEqual(clock.n_ticks, 2)
+        self.assertEqual(stub.skipped, 2)
+
+    def test_never_fast_forward_forever(self):
+        """Ensure a Clock with no pending work still advances one cycle."""
+        clock = ActivityClock()
+        stub = TimerStub(idle_cycles=math.inf)
+        clock.register(stub)
+        clock.tick()
+        self.assertEqual(clock.n_ticks, 1)
+        self.assertEqual(stub.n_operate, 1)
+
+    def test_cycle_exact(self):
+        """Ensure ActivityClock and Clock simulate the same number of cycles."""
+        for width in [1, 2, 4]:
+            results = []
+            for clock in [Clock(), ActivityClock()]:
+                reg_file, memory = run_chase(clock, width)
+                results.append((clock.n_ticks,
+                                [reg_file['r%d' % i] for i in range(4)],
+                                [memory[i] for i in range(len(memory))]))
+            self.assertEqual(results[0], results[1])
+
+def run_chase(clock, width):
+    """Run CHASE_PROGRAM to completion using clock."""
+    memory = Memory(64)
+    for i in range(len(memory)):
+        memory[i] = (i * 7 + 3) % len(memory)
+    reg_file = RegisterFile(4, init_values={'r2': 40})
+
+    bus = BroadcastBus()
+    units = [BranchUnit(bus), IntegerUnit(bus), IntegerUnit(bus)]
+    rs = ReservationStation(capacity=8, width=width)
+    lsq = LoadStoreQueue(memory, bus, capacity=8, width=width)
+    predictor = BranchHistoryTable(16, 2)
+    rob = ReorderBuffer(reg_file, rs, lsq, predictor, capacity=8, width=width)
+    decode = Decode(rob, capacity=8, width=width)
+    fetch = Fetch(reg_file, CHASE_PROGRAM, decode, predictor, width=width)
+    rob.set_pipeline_flush_root(fetch)
+    for comp in [rs, rob]:
+        bus.subscribe(comp)
+    for unit in units:
+        rs.register(unit)
+        clock.register(unit)
+    for comp in [rs, lsq, rob, decode, fetch]:
+        clock.register(comp)
+    try:
+        for _ in range(10000):
+            clock.tick()
+    except EndOfProgram:
+        pass
+    return reg_file, memory
+
+class TimerStub(Clocked):
+    def __init__(self, idle_cycles, idle=False):
+        self._idle_cycles = idle_cycles
+        self._idle = idle
+        self.n_operate = 0
+        self.n_trigger = 0
+        self.skipped = 0
+
+    def operate(self):
+        self.n_operate += 1
+
+    def trigger(self):
+        self.n_trigger += 1
+
+    def idle(self):
+        return self._idle
+
+    def idle_cycles(self):
+        return self._idle_cycles - self.skipped
+
+    def skip(self, n_cycles):
+        self.skipped += n_cycles
@@ -1,6 +1,12 @@
+from array import array
+import copy
+import os
 import random
+import tempfile
 import unittest
 
+import numpy as np
+
 from procsim.memory import Memory
 from procsim.register import Register
 
@@ -48,3 +54,92 @@ class TestMemory(unittest.TestCase):
                     address = Register(address)
                 memory[address] = new_value
                 self.assertEqual(memory[address], new_value)
+
+    def test_non_int_value(self):
+        memory = Memory(10)
+        for invalid_value in ['foo', 1.5, None]:
+            with self.assertRaises(TypeError):
+                memory[0] = invalid_value
+
+    def test_integer_like_value(self):
+        memory = Memory(2)
+        memory[0] = np.int64(-3)
+        memory[1] = True
+        self.assertEqual(memory.tolist(), [-3, 1])
+        self.assertIs(type(memory[0]), int)
+
+    def test_wide_value(self):
+        """Ensure values wider than 64 bits are stored, not rejected."""
+        memory = Memory(3)
+        memory.load_array([1, 2])
+        memory[2] = 2**64 + 1
+        memory[0] = -2**70
+        self.assertEqual(memory.tolist(), [-2**70, 2, 2**64 + 1])
+        self.assertEqual(copy.deepcopy(memory).tolist(), memory.tolist())
+        memory.load_array([5], start=1)
+        self.assertEqual(memory[1], 5)
+        with self.assertRaises(OverflowError):
+            memory.dump_array()
+        with self.assertRaises(OverflowError):
+            memory.memoryview()
+
+    def test_load_dump_array(self):
+        """Ensure bulk loads set and initialize only the given locations."""
+        memory = Memory(10)
+        memory.load_array([1, 2, 3], start=2)
+        memory.load_array(array('q', [-4, 5]), start=7)
+        memory.load_array(array('b', [6]), start=9)
+        self.assertEqual(memory.tolist(),
+                         [None, None, 1, 2, 3, None, None, -4, 5, 6])
+        self.assertEqual(memory.dump_array(), array('q', [0, 0, 1, 2, 3, 0, 0, -4, 5, 6]))
+        self.assertEqual(memory.dump_array(2, 5), array('q', [1, 2, 3]))
+        with self.assertRaises(IndexError):
+            memory.load_array([1, 2], start=9)
+
+    def test_load_array_byte_order(self):
+        """Ensure non-native buffers are converted, not copied as bytes."""
+        memory = Memory(3)
+        for dtype in ['>i8', '<i8']:
+            memory.load_array(np.array([1, -2, 3], dtype=dtype))
+            self.assertEqual(memory.tolist(), [1, -2, 3])
+
+    def test_memoryview(self):
+        memory = Memory(4)
+        view = memory.memoryview()
+        self.assertEqual(view.format, 'q')
+        memory[1] = 7
+        self.assertEqual(view[1], 7)
+
+    def test_image_round_trip(self):
+        """Ensure saved images load back copy-on-write, mapped or not."""
+        memory = Memory(6)
+        memory.load_array([3, -1, 4, 1, -5, 9])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ['image.npy', 'image.bin']:
+                path = os.path.join(tmp_dir, name)
+                memory.save_image(path)
+
+                loaded = Memory.from_image(path)
+                self.assertIsInstance(loaded.values, memoryview)
+                self.assertEqual(loaded.tolist(), memory.tolist())
+                loaded[0] = 100
+                self.assertEqual(Memory.from_image(path)[0], 3)
+                self.assertEqual(copy.deepcopy(loaded).tolist(),
+                                 [100, -1, 4, 1, -5, 9])
+                loaded[1] = 2**64
+                self.assertEqual(loaded[1], 2**64)
+                self.assertEqual(Memory.from_image(path).tolist(),
+                                 memory.tolist())
+
+                padded = Memory.from_image(path, size=8)
+                self.assertEqual(padded.tolist(), memory.tolist() + [None, None])
+                with self.assertRaises(ValueError):
+                    Memory.from_image(path, size=5)
+
+    def test_npy_image_invalid(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'image.npy')
+            with open(path, 'wb') as f:
+                f.write(b'not an image')
+            with self.assertRaises(ValueError):
+                Memory.from_image(path)
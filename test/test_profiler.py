@@ -0,0 +1,77 @@
+import unittest
+
+from procsim.back_end.broadcast_bus import BroadcastBus
+from procsim.clock import Clock
+from procsim.clocked import Clocked
+from procsim.profiler import ProfiledComponent
+from procsim.profiler import Profiler
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = Profiler()
+        self.clock = Clock(self.profiler)
+        self.stubs = [ClockedStub(), ClockedStub()]
+        for stub in self.stubs:
+            self.clock.register(stub)
+
+    def test_unprofiled_clock(self):
+        """Ensure a Clock without a Profiler registers components unwrapped."""
+        clock = Clock()
+        stub = ClockedStub()
+        clock.register(stub)
+        self.assertIs(clock.components[0], stub)
+
+    def test_operate_trigger_counts(self):
+        """Ensure operate and trigger calls are counted per component class."""
+        for stub in self.clock.components:
+            self.assertIsInstance(stub, ProfiledComponent)
+        for _ in range(5):
+            self.clock.tick()
+        for stub in self.stubs:
+            self.assertEqual(stub.n_operate, 5)
+            self.assertEqual(stub.n_trigger, 5)
+        self.assertEqual(self.profiler.stats[('ClockedStub', 'operate')][0], 10)
+        self.assertEqual(self.profiler.stats[('ClockedStub', 'trigger')][0], 10)
+        self.assertGreaterEqual(self.profiler.stats[('ClockedStub', 'operate')][1], 0)
+
+    def test_broadcast_bus(self):
+        """Ensure profiled publish still delivers and records each receive."""
+        bus = BroadcastBus()
+        subscribers = [SubscriberStub(), SubscriberStub()]
+        for subscriber in subscribers:
+            bus.subscribe(subscriber)
+        bus.profile(self.profiler)
+        bus.publish('msg')
+        bus.publish('msg')
+        for subscriber in subscribers:
+            self.assertEqual(subscriber.messages, ['msg', 'msg'])
+        self.assertEqual(self.profiler.stats[('BroadcastBus', 'publish')][0], 2)
+        self.assertEqual(self.profiler.stats[('SubscriberStub', 'receive')][0], 4)
+
+    def test_report(self):
+        """Ensure report has a header line and one line per recorded method."""
+        self.clock.tick()
+        lines = self.profiler.report()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].startswith('ClockedStub.'))
+
+class ClockedStub(Clocked):
+
+    def __init__(self):
+        self.n_operate = 0
+        self.n_trigger = 0
+
+    def operate(self):
+        self.n_operate += 1
+
+    def trigger(self):
+        self.n_trigger += 1
+
+class SubscriberStub:
+
+    def __init__(self):
+        self.messages = []
+
+    def receive(self, message):
+        self.messages.append(message)
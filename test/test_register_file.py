@@ -47,6 +47,36 @@ class TestRegisterFile(unittest.TestCase):
         self.assertEqual(got, exp,
                          '%s returned %s, should be set to %s' % (name, got, exp))
 
+    def test_set_register_value(self):
+        reg_file = RegisterFile(2)
+        reg_file['r1'] = Register(7)
+        self.assertEqual(reg_file['r1'], 7)
+
+    def test_index_read_write(self):
+        """Ensure index access and name access see the same Registers."""
+        reg_file = RegisterFile(4, init_values={'r2': 5})
+        self.assertEqual(reg_file.index_of('pc'), reg_file.PC)
+        index = reg_file.index_of('r2')
+        self.assertEqual(reg_file.read(index), 5)
+        reg_file.write(index, 9)
+        self.assertEqual(reg_file['r2'], 9)
+        reg_file.values[reg_file.PC] = 3
+        self.assertEqual(reg_file['pc'], 3)
+        with self.assertRaises(KeyError):
+            reg_file.index_of('r4')
+
+    def test_snapshot_restore(self):
+        reg_file = RegisterFile(3, init_values={'r0': 1, 'pc': 2})
+        snapshot = reg_file.snapshot()
+        self.assertEqual(snapshot, (1, 0, 0, 2))
+        values = reg_file.values
+        reg_file['r0'] = 100
+        reg_file.restore(snapshot)
+        self.assertIs(reg_file.values, values)
+        self.assertEqual(reg_file, RegisterFile(3, init_values={'r0': 1, 'pc': 2}))
+        with self.assertRaises(ValueError):
+            reg_file.restore((1, 2))
+
     def test_len(self):
         n_gpr_registers = 10
         reg_file = RegisterFile(n_gpr_registers)
@@ -58,6 +88,9 @@ class TestRegisterFile(unittest.TestCase):
     def test_repr(self):
         reg_file = RegisterFile(3, gpr_prefix='R', init_values={'R1': 10, 'R2': -1})
         self.assertEqual(reg_file, eval(repr(reg_file)))
+        self.assertEqual(repr(RegisterFile(1, init_values={'r0': 3})),
+                         "RegisterFile(1, gpr_prefix='r', "
+                         "init_values={'r0': Register(3), 'pc': Register(0)})")
 
 def gen_values(length, prefix):
     """Deterministically Return valid RegisterFile init_values."""